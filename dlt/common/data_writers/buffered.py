@@ -1,5 +1,8 @@
+import io
 import gzip
-from functools import reduce
+from functools import reduce, partial
+from queue import Queue
+from threading import Thread
 from typing import List, IO, Any, Optional, Type, TypeVar, Generic
 
 from dlt.common.utils import uniq_id
@@ -24,6 +27,8 @@ class BufferedDataWriter(Generic[TWriter]):
         file_max_items: Optional[int] = None
         file_max_bytes: Optional[int] = None
         disable_compression: bool = False
+        compression_level: int = 9
+        background_compression: bool = False
         _caps: Optional[DestinationCapabilitiesContext] = None
 
         __section__ = known_sections.DATA_WRITER
@@ -39,6 +44,8 @@ class BufferedDataWriter(Generic[TWriter]):
         file_max_items: int = None,
         file_max_bytes: int = None,
         disable_compression: bool = False,
+        compression_level: int = 9,
+        background_compression: bool = False,
         _caps: DestinationCapabilitiesContext = None
     ):
         self.file_format = file_format
@@ -53,8 +60,12 @@ class BufferedDataWriter(Generic[TWriter]):
         self.buffer_max_items = min(buffer_max_items, file_max_items or buffer_max_items)
         self.file_max_bytes = file_max_bytes
         self.file_max_items = file_max_items
-        # the open function is either gzip.open or open
-        self.open = gzip.open if self._file_format_spec.supports_compression and not disable_compression else open
+        # the open function is either gzip.open, gzip.open compressing in background thread or open
+        if self._file_format_spec.supports_compression and not disable_compression:
+            gzip_open = open_background_gzip if background_compression else gzip.open
+            self.open = partial(gzip_open, compresslevel=compression_level)
+        else:
+            self.open = open
 
         self._current_columns: TTableSchemaColumns = None
         self._file_name: str = None
@@ -163,3 +174,92 @@ class BufferedDataWriter(Generic[TWriter]):
     def _ensure_open(self) -> None:
         if self._closed:
             raise BufferedDataWriterClosed(self._file_name)
+
+
+class BackgroundGzipFile(io.BufferedIOBase):
+    """Write only gzip file that compresses in a background thread. Written data is collected into chunks of
+    `CHUNK_SIZE` bytes that are passed to the thread via a bounded queue. zlib releases GIL when compressing so
+    data serialization and compression run in parallel. The output is a regular gzip file.
+    """
+    CHUNK_SIZE = 1024 * 1024
+    MAX_QUEUED_CHUNKS = 4
+
+    def __init__(self, filename: str, compresslevel: int = 9) -> None:
+        super().__init__()
+        self._gzip = gzip.GzipFile(filename, "wb", compresslevel=compresslevel)
+        self._chunk = bytearray()
+        self._written = 0
+        self._exception: BaseException = None
+        self._queue: "Queue[bytearray]" = Queue(maxsize=self.MAX_QUEUED_CHUNKS)
+        self._thread = Thread(target=self._compress, daemon=True, name="DltCompressThread")
+        self._thread.start()
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def tell(self) -> int:
+        """Returns the number of uncompressed bytes written"""
+        return self._written
+
+    def write(self, b: Any) -> int:
+        self._raise_on_failed()
+        n = len(b)
+        self._chunk += b
+        self._written += n
+        if len(self._chunk) >= self.CHUNK_SIZE:
+            self._queue.put(self._chunk)
+            self._chunk = bytearray()
+        return n
+
+    def flush(self) -> None:
+        # partial chunks are not passed to the thread, data is compressed on close
+        pass
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            if self._chunk:
+                self._queue.put(self._chunk)
+            self._queue.put(None)
+            self._thread.join()
+            self._gzip.close()
+        finally:
+            super().close()
+        self._raise_on_failed()
+
+    def _compress(self) -> None:
+        while True:
+            chunk = self._queue.get()
+            if chunk is None:
+                break
+            # keep consuming the queue after failure so writer does not block
+            if self._exception is None:
+                try:
+                    self._gzip.write(chunk)
+                except BaseException as ex:
+                    self._exception = ex
+
+    def _raise_on_failed(self) -> None:
+        if self._exception is not None:
+            raise self._exception
+
+
+class BackgroundGzipTextFile(io.TextIOWrapper):
+    """Text wrapper over `BackgroundGzipFile` that tells the uncompressed position without requiring a seekable file"""
+
+    def tell(self) -> int:
+        self.flush()
+        return self.buffer.tell()  # type: ignore[no-any-return]
+
+
+def open_background_gzip(filename: str, mode: str = "rb", compresslevel: int = 9, encoding: str = None) -> IO[Any]:
+    """Opens `BackgroundGzipFile` for writing, interface is compatible with `gzip.open`"""
+    assert "w" in mode, "only write mode is supported"
+    f = BackgroundGzipFile(filename, compresslevel=compresslevel)
+    if "b" in mode:
+        return f
+    return BackgroundGzipTextFile(f, encoding=encoding)
@@ -1,9 +1,11 @@
 import re
 import base64
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 from datetime import date, datetime, time  # noqa: I251
 
+from dlt.common.arithmetics import Decimal
 from dlt.common.json import json
+from dlt.common.schema.typing import TDataType
 
 # use regex to escape characters in single pass
 SQL_ESCAPE_DICT = {"'": "''", "\\": "\\\\", "\n": "\\n", "\r": "\\r"}
@@ -114,3 +116,92 @@ def escape_snowflake_identifier(v: str) -> str:
     # Snowcase uppercase all identifiers unless quoted. Match this here so queries on information schema work without issue
     # See also https://docs.snowflake.com/en/sql-reference/identifiers-syntax#double-quoted-identifiers
     return escape_postgres_identifier(v.upper())
+
+
+TLiteralEscaper = Callable[[Any], str]
+# python types that all the literal escapers render with `str`, bool is excluded on purpose (mssql renders it as int)
+# None is rendered as NULL by all of them
+_STR_LITERAL_TYPES = (int, float, Decimal)
+
+
+def _escape_str_typed(escape_literal: TLiteralEscaper) -> TLiteralEscaper:
+    def _escape(v: Any) -> str:
+        if v.__class__ in _STR_LITERAL_TYPES:
+            return str(v)
+        if v is None:
+            return "NULL"
+        return escape_literal(v)
+    return _escape
+
+
+def _escape_bool_typed(escape_literal: TLiteralEscaper) -> TLiteralEscaper:
+    literals = {True: escape_literal(True), False: escape_literal(False), None: "NULL"}
+
+    def _escape(v: Any) -> str:
+        if v.__class__ is bool or v is None:
+            return literals[v]
+        return escape_literal(v)
+    return _escape
+
+
+def _escape_text_typed(
+        escape_literal: TLiteralEscaper, prefix:str = "E'", escape_dict: Dict[str, str] = None, escape_re: re.Pattern = None  # type: ignore[type-arg]
+) -> TLiteralEscaper:
+    escape_dict = escape_dict or SQL_ESCAPE_DICT
+    sub = (escape_re or SQL_ESCAPE_RE).sub
+
+    def _repl(m: re.Match) -> str:  # type: ignore[type-arg]
+        return escape_dict[m.group(0)]
+
+    def _escape(v: Any) -> str:
+        if v.__class__ is str:
+            return prefix + sub(_repl, v) + "'"
+        if v is None:
+            return "NULL"
+        return escape_literal(v)
+    return _escape
+
+
+def _escape_temporal_typed(escape_literal: TLiteralEscaper) -> TLiteralEscaper:
+    def _escape(v: Any) -> str:
+        if isinstance(v, (datetime, date, time)):
+            return f"'{v.isoformat()}'"
+        if v is None:
+            return "NULL"
+        return escape_literal(v)
+    return _escape
+
+
+def _typed_escapers(escape_literal: TLiteralEscaper, escape_text: TLiteralEscaper) -> Dict[TDataType, TLiteralEscaper]:
+    escape_str = _escape_str_typed(escape_literal)
+    escape_temporal = _escape_temporal_typed(escape_literal)
+    return {
+        "text": escape_text,
+        "bool": _escape_bool_typed(escape_literal),
+        "bigint": escape_str,
+        "double": escape_str,
+        "decimal": escape_str,
+        "wei": escape_str,
+        "timestamp": escape_temporal,
+        "date": escape_temporal,
+        "time": escape_temporal,
+    }
+
+
+# escapers specialized for the column data type, they skip the type dispatch of the generic escaper for values
+# of the expected python type and fall back to it otherwise
+TYPED_LITERAL_ESCAPERS: Dict[TLiteralEscaper, Dict[TDataType, TLiteralEscaper]] = {
+    escape_redshift_literal: _typed_escapers(escape_redshift_literal, _escape_text_typed(escape_redshift_literal, prefix="'")),
+    escape_postgres_literal: _typed_escapers(escape_postgres_literal, _escape_text_typed(escape_postgres_literal)),
+    escape_duckdb_literal: _typed_escapers(escape_duckdb_literal, _escape_text_typed(escape_duckdb_literal)),
+    escape_mssql_literal: _typed_escapers(
+        escape_mssql_literal,
+        _escape_text_typed(escape_mssql_literal, prefix="N'", escape_dict=MS_SQL_ESCAPE_DICT, escape_re=MS_SQL_ESCAPE_RE)
+    ),
+}
+
+
+def get_typed_literal_escaper(escape_literal: TLiteralEscaper, data_type: TDataType) -> TLiteralEscaper:
+    """Returns `escape_literal` specialized for values of a column with `data_type`. Returns `escape_literal` itself
+    if no specialization is known"""
+    return TYPED_LITERAL_ESCAPERS.get(escape_literal, {}).get(data_type, escape_literal)
@@ -1,10 +1,11 @@
 import abc
 from dataclasses import dataclass
-from typing import IO, TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Type, Union
+from typing import IO, TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Type, Union
 
 from dlt.common import json
 from dlt.common.configuration import configspec, known_sections, with_config
 from dlt.common.configuration.specs import BaseConfiguration
+from dlt.common.data_writers.escape import TLiteralEscaper, get_typed_literal_escaper
 from dlt.common.destination import DestinationCapabilitiesContext, TLoaderFileFormat
 from dlt.common.schema.typing import TTableSchemaColumns
 from dlt.common.typing import StrAny
@@ -13,6 +14,11 @@ if TYPE_CHECKING:
     from dlt.common.libs.pyarrow import pyarrow as pa
 
 
+def _is_arrow_item(item: Any) -> bool:
+    # do not import pyarrow if it is not used
+    return hasattr(item, "num_rows") and hasattr(item, "schema")
+
+
 @dataclass
 class TFileFormatSpec:
     file_format: TLoaderFileFormat
@@ -80,15 +86,43 @@ class DataWriter(abc.ABC):
 
 
 class JsonlWriter(DataWriter):
+    ARROW_SLICE_SIZE = 10000
+    """Number of arrow rows joined into json lines at once, limits the size of buffers held in memory"""
 
     def write_header(self, columns_schema: TTableSchemaColumns) -> None:
         pass
 
     def write_data(self, rows: Sequence[Any]) -> None:
-        super().write_data(rows)
         for row in rows:
-            json.dump(row, self._f)
-            self._f.write(b"\n")
+            if _is_arrow_item(row):
+                self._write_arrow_item(row)
+            else:
+                self.items_count += 1
+                json.dump(row, self._f)
+                self._f.write(b"\n")
+
+    def _write_arrow_item(self, item: Any) -> None:
+        """Writes arrow table or batch as json lines concatenated with arrow compute, without creating a python dict per row"""
+        from dlt.common.libs.pyarrow import pyarrow, column_literals, to_record_batches
+
+        for batch in to_record_batches(item):
+            if batch.num_columns == 0:
+                self._f.write(b"{}\n" * batch.num_rows)
+                continue
+            for offset in range(0, batch.num_rows, self.ARROW_SLICE_SIZE):
+                batch_slice = batch.slice(offset, self.ARROW_SLICE_SIZE)
+                # pre-encoded keys are interleaved with the column values
+                parts: List[Any] = []
+                for name, column in zip(batch_slice.schema.names, batch_slice.columns):
+                    parts.append(("," if parts else "{") + json.dumps(name) + ":")
+                    parts.append(column_literals(column, json.dumps, "null"))
+                parts.append("}\n")
+                lines = pyarrow.compute.binary_join_element_wise(*parts, "")
+                # lines have no nulls so the utf-8 data buffer holds them back to back
+                _, offsets_buf, data_buf = lines.buffers()
+                offsets = memoryview(offsets_buf).cast("i")
+                self._f.write(memoryview(data_buf)[offsets[lines.offset]:offsets[lines.offset + len(lines)]])
+        self.items_count += item.num_rows
 
     def write_footer(self) -> None:
         pass
@@ -105,13 +139,24 @@ class JsonlWriter(DataWriter):
 
 
 class JsonlListPUAEncodeWriter(JsonlWriter):
+    ENCODE_SLICE_SIZE = 1000
+    """Number of rows encoded at once, limits the size of encoded buffer held in memory"""
 
     def write_data(self, rows: Sequence[Any]) -> None:
         # skip JsonlWriter when calling super
         super(JsonlWriter, self).write_data(rows)
         # write all rows as one list which will require to write just one line
         # encode types with PUA characters
-        json.typed_dump(rows, self._f)
+        if len(rows) <= self.ENCODE_SLICE_SIZE:
+            json.typed_dump(rows, self._f)
+        else:
+            # encode in slices and write them without the enclosing brackets
+            self._f.write(b"[")
+            for i in range(0, len(rows), self.ENCODE_SLICE_SIZE):
+                if i > 0:
+                    self._f.write(b",")
+                self._f.write(memoryview(json.typed_dumpb(rows[i:i + self.ENCODE_SLICE_SIZE]))[1:-1])
+            self._f.write(b"]")
         self._f.write(b"\n")
 
     @classmethod
@@ -130,45 +175,73 @@ class InsertValuesWriter(DataWriter):
     def __init__(self, f: IO[Any], caps: DestinationCapabilitiesContext = None) -> None:
         super().__init__(f, caps)
         self._chunks_written = 0
-        self._headers_lookup: Dict[str, int] = None
+        self._headers_lookup: Dict[str, Tuple[int, TLiteralEscaper]] = None
 
     def write_header(self, columns_schema: TTableSchemaColumns) -> None:
         assert self._chunks_written == 0
         assert columns_schema is not None, "column schema required"
         headers = columns_schema.keys()
-        # dict lookup is always faster
-        self._headers_lookup = {v: i for i, v in enumerate(headers)}
+        # dict lookup is always faster, each column gets escaper specialized for its data type
+        self._headers_lookup = {
+            name: (i, get_typed_literal_escaper(self._caps.escape_literal, column.get("data_type")))
+            for i, (name, column) in enumerate(columns_schema.items())
+        }
         # do not write INSERT INTO command, this must be added together with table name by the loader
         self._f.write("INSERT INTO {}(")
         self._f.write(",".join(map(self._caps.escape_identifier, headers)))
         self._f.write(")\nVALUES\n")
 
     def write_data(self, rows: Sequence[Any]) -> None:
-        super().write_data(rows)
-
-        def write_row(row: StrAny) -> None:
-            output = ["NULL"] * len(self._headers_lookup)
-            for n,v  in row.items():
-                output[self._headers_lookup[n]] = self._caps.escape_literal(v)
-            self._f.write("(")
-            self._f.write(",".join(output))
-            self._f.write(")")
-
-        # if next chunk add separator
-        if self._chunks_written > 0:
-            self._f.write(",\n")
-
-        # write rows
-        for row in rows[:-1]:
-            write_row(row)
-            self._f.write(",\n")
-
-        # write last row without separator so we can write footer eventually
-        write_row(rows[-1])
+        literals = self._row_literals(rows)
         self._chunks_written += 1
+        if not literals:
+            return
+        # if next chunk add separator, the last row is written without it so we can write footer eventually
+        if self.items_count > 0:
+            self._f.write(",\n")
+        self._f.write(",\n".join(literals))
+        self.items_count += len(literals)
+
+    def _row_literals(self, rows: Sequence[Any]) -> List[str]:
+        # arrow tables (ie. from parquet normalizer) may be mixed with python rows, keep the order
+        headers_lookup = self._headers_lookup
+        null_row = ["NULL"] * len(headers_lookup)
+        literals: List[str] = []
+        for row in rows:
+            if _is_arrow_item(row):
+                literals.extend(self._arrow_literals(row))
+            else:
+                output = null_row.copy()
+                for n, v in row.items():
+                    i, escape_literal = headers_lookup[n]
+                    output[i] = escape_literal(v)
+                literals.append("(" + ",".join(output) + ")")
+        return literals
+
+    def _arrow_literals(self, item: Any) -> List[str]:
+        """Escapes arrow table or batch column by column and concatenates the row literals with arrow compute.
+        Columns not present in the header are skipped.
+        """
+        from dlt.common.libs.pyarrow import pyarrow, column_literals, to_record_batches
+
+        literals: List[str] = []
+        for batch in to_record_batches(item):
+            columns: List[Any] = ["NULL"] * len(self._headers_lookup)
+            for name, column in zip(batch.schema.names, batch.columns):
+                if name not in self._headers_lookup:
+                    continue
+                i, escape_literal = self._headers_lookup[name]
+                columns[i] = column_literals(column, escape_literal, "NULL")
+            values = pyarrow.compute.binary_join_element_wise(*columns, ",")
+            if isinstance(values, pyarrow.Scalar):
+                # no known columns in the batch
+                literals.extend(["(" + values.as_py() + ")"] * batch.num_rows)
+            else:
+                literals.extend(pyarrow.compute.binary_join_element_wise("(", values, ")", "").to_pylist())
+        return literals
 
     def write_footer(self) -> None:
-        if self._chunks_written > 0:
+        if self.items_count > 0:
             self._f.write(";")
 
     @classmethod
@@ -240,9 +313,26 @@ class ParquetDataWriter(DataWriter):
 
 
     def write_data(self, rows: Sequence[Any]) -> None:
-        super().write_data(rows)
         from dlt.common.libs.pyarrow import pyarrow
 
+        # arrow tables (ie. from columnar normalizer) may be mixed with python rows, keep the order
+        py_rows: List[Any] = []
+        for row in rows:
+            if isinstance(row, (pyarrow.Table, pyarrow.RecordBatch)):
+                self._write_py_rows(py_rows)
+                py_rows = []
+                self.writer.write_table(self._align_to_schema(row), row_group_size=self.parquet_row_group_size)
+                self.items_count += row.num_rows
+            else:
+                py_rows.append(row)
+        self._write_py_rows(py_rows)
+
+    def _write_py_rows(self, rows: List[Any]) -> None:
+        if not rows:
+            return
+        from dlt.common.libs.pyarrow import pyarrow
+
+        self.items_count += len(rows)
         # replace complex types with json
         for key in self.complex_indices:
             for row in rows:
@@ -253,6 +343,19 @@ class ParquetDataWriter(DataWriter):
         # Write
         self.writer.write_table(table, row_group_size=self.parquet_row_group_size)
 
+    def _align_to_schema(self, item: Any) -> Any:
+        """Casts arrow `item` to the file schema, missing columns are filled with nulls"""
+        from dlt.common.libs.pyarrow import pyarrow
+
+        columns = []
+        for field in self.schema:
+            idx = item.schema.get_field_index(field.name)
+            if idx >= 0:
+                columns.append(item.column(idx).cast(field.type))
+            else:
+                columns.append(pyarrow.nulls(item.num_rows, type=field.type))
+        return pyarrow.Table.from_arrays(columns, schema=self.schema)
+
     def write_footer(self) -> None:
         self.writer.close()
         self.writer = None
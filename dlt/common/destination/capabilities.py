@@ -47,6 +47,8 @@ class DestinationCapabilitiesContext(ContainerInjectableContext):
     schema_supports_numeric_precision: bool = True
     timestamp_precision: int = 6
     max_rows_per_insert: Optional[int] = None
+    loader_adds_load_id: bool = False
+    """Load jobs fill `_dlt_load_id` of parquet files that do not contain it, so normalizer may link arrow files without rewriting"""
 
     # do not allow to create default value, destination caps must be always explicitly inserted into container
     can_create_default: ClassVar[bool] = False
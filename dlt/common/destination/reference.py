@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod, abstractproperty
 from importlib import import_module
 from types import TracebackType, ModuleType
-from typing import ClassVar, Final, Optional, NamedTuple, Literal, Sequence, Iterable, Type, Protocol, Union, TYPE_CHECKING, cast, List, ContextManager, Dict, Any
+from typing import ClassVar, Final, Optional, NamedTuple, Literal, Sequence, Iterable, Generator, Type, Protocol, Union, TYPE_CHECKING, cast, List, ContextManager, Dict, Any
 from contextlib import contextmanager
 import datetime  # noqa: 251
 from copy import deepcopy
@@ -267,6 +267,10 @@ class JobClientBase(ABC):
     def __exit__(self, exc_type: Type[BaseException], exc_val: BaseException, exc_tb: TracebackType) -> None:
         pass
 
+    def is_open(self) -> bool:
+        """Cheaply tells if client entered with `__enter__` can still be used. Must not make a round trip to the destination"""
+        return True
+
     def _verify_schema(self) -> None:
         """Verifies and cleans up a schema before loading
 
@@ -321,6 +325,12 @@ class WithStateSync(ABC):
         """Loads compressed state from destination storage"""
         pass
 
+    @abstractmethod
+    def get_stored_states(self, pipeline_name: str) -> Generator[StateInfo, None, None]:
+        """Iterates over compressed states of completed loads from destination storage, newest first. Close the generator if not exhausted
+        so the resources held by the destination client are released."""
+        pass
+
 
 class WithStagingDataset(ABC):
     """Adds capability to use staging dataset and request it from the loader"""
@@ -2,7 +2,7 @@ import os
 import base64
 import dataclasses
 from datetime import date, datetime, time  # noqa: I251
-from typing import Any, Callable, List, Protocol, IO, Union
+from typing import Any, Callable, Dict, List, Protocol, IO, Type, Union
 from uuid import UUID
 from hexbytes import HexBytes
 from enum import Enum
@@ -121,7 +121,38 @@ DECODERS: List[Callable[[Any], Any]] = [
 PUA_CHARACTER_MAX = len(DECODERS)
 
 
+def _pua_encode_isoformat(prefix: str) -> Callable[[Any], str]:
+    def _encode(obj: Any) -> str:
+        return prefix + obj.isoformat()
+    return _encode
+
+
+def _pua_encode_str(prefix: str) -> Callable[[Any], str]:
+    def _encode(obj: Any) -> str:
+        return prefix + str(obj)
+    return _encode
+
+
+# encoders for the most common exact types, looked up before going through the isinstance chain in `custom_pua_encode`
+_PUA_TYPE_ENCODERS: Dict[Type[Any], Callable[[Any], str]] = {
+    Wei: _pua_encode_str(_WEI),
+    Decimal: _pua_encode_str(_DECIMAL),
+    datetime: _pua_encode_isoformat(_DATETIME),
+    pendulum.DateTime: _pua_encode_isoformat(_DATETIME),
+    date: _pua_encode_isoformat(_DATE),
+    pendulum.Date: _pua_encode_isoformat(_DATE),
+    time: _pua_encode_isoformat(_TIME),
+    pendulum.Time: _pua_encode_isoformat(_TIME),
+    UUID: _pua_encode_str(_UUIDT),
+    HexBytes: lambda obj: _HEXBYTES + obj.hex(),
+    bytes: lambda obj: _B64BYTES + base64.b64encode(obj).decode('ascii'),
+}
+
+
 def custom_pua_encode(obj: Any) -> str:
+    encoder = _PUA_TYPE_ENCODERS.get(obj.__class__)
+    if encoder is not None:
+        return encoder(obj)
     # wei is subclass of decimal and must be checked first
     if isinstance(obj, Wei):
         return _WEI + str(obj)
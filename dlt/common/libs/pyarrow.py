@@ -11,6 +11,7 @@ from dlt.common.typing import TFileOrPath
 try:
     import pyarrow
     import pyarrow.parquet
+    import pyarrow.compute
 except ModuleNotFoundError:
     raise MissingDependencyException("DLT parquet Helpers", [f"{version.DLT_PKG_NAME}[parquet]"], "DLT Helpers for for parquet.")
 
@@ -194,6 +195,47 @@ def is_arrow_item(item: Any) -> bool:
     return isinstance(item, (pyarrow.Table, pyarrow.RecordBatch))
 
 
+def constant_dictionary_array(value: Any, length: int, value_type: pyarrow.DataType = None) -> pyarrow.DictionaryArray:
+    """Creates a dictionary encoded array of `length` rows where every row is `value`.
+
+    The dictionary holds a single entry and the indices are a zero filled int8 buffer, so no python objects
+    are created per row. Note that the array is not zero copy: the indices buffer is allocated for every call.
+
+    Args:
+        value: value of every row
+        length: number of rows
+        value_type: arrow type of the value, inferred if not provided
+
+    Returns:
+        pyarrow.DictionaryArray: the constant array with int8 indices
+    """
+    indices = pyarrow.repeat(pyarrow.scalar(0, type=pyarrow.int8()), length)
+    return pyarrow.DictionaryArray.from_arrays(indices, pyarrow.array([value], type=value_type))
+
+
+def to_record_batches(item: TAnyArrowItem) -> Sequence[pyarrow.RecordBatch]:
+    """Returns record batches of arrow table or the record batch itself"""
+    if isinstance(item, pyarrow.Table):
+        return item.to_batches()  # type: ignore[no-any-return]
+    return [item]
+
+
+def column_literals(column: pyarrow.Array, escape_literal: Callable[[Any], str], null_literal: str) -> pyarrow.Array:
+    """Formats values of `column` as string array of literals to be concatenated with `pyarrow.compute.binary_join_element_wise`.
+
+    Integer and boolean columns are formatted with arrow compute kernels. Values of other types are escaped one by one with
+    `escape_literal` as arrow string formatting of floats, decimals and temporal types differs from the escapers.
+    Nulls are formatted as `null_literal`.
+    """
+    if pyarrow.types.is_integer(column.type):
+        literals = pyarrow.compute.cast(column, pyarrow.string())
+    elif pyarrow.types.is_boolean(column.type):
+        literals = pyarrow.compute.if_else(column, escape_literal(True), escape_literal(False))
+    else:
+        return pyarrow.array([null_literal if v is None else escape_literal(v) for v in column.to_pylist()], type=pyarrow.string())
+    return pyarrow.compute.fill_null(literals, null_literal)
+
+
 TNewColumns = Sequence[Tuple[pyarrow.Field, Callable[[pyarrow.Table], Iterable[Any]]]]
 
 
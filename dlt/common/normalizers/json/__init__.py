@@ -33,6 +33,10 @@ class DataItemNormalizer(abc.ABC, Generic[TNormalizerConfig]):
     def extend_table(self, table_name: str) -> None:
         pass
 
+    def invalidate_cache(self) -> None:
+        """Called by the schema when settings (ie. preferred types) change. Normalizers that cache values derived from settings must drop them"""
+        pass
+
     @classmethod
     @abc.abstractmethod
     def update_normalizer_config(cls, schema: Schema, config: TNormalizerConfig) -> None:
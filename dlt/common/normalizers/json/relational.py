@@ -1,4 +1,4 @@
-from typing import Dict, List, Mapping, Optional, Sequence, Tuple, cast, TypedDict, Any
+from typing import ClassVar, Dict, List, Mapping, Optional, Sequence, Tuple, cast, TypedDict, Any
 from dlt.common.data_types.typing import TDataType
 from dlt.common.normalizers.exceptions import InvalidJsonNormalizer
 from dlt.common.normalizers.typing import TJSONNormalizer
@@ -42,10 +42,17 @@ class RelationalNormalizerConfig(TypedDict, total=False):
 
 
 class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
+    CHILD_NAMES_CACHE_SIZE: ClassVar[int] = 10000
+    """Max number of (path, key) entries in child names cache, the cache is cleared when full"""
+
     normalizer_config: RelationalNormalizerConfig
     propagation_config: RelationalNormalizerConfigPropagation
     max_nesting: int
     _skip_primary_key: Dict[str, bool]
+    _complex_types: Dict[str, Dict[str, bool]]
+    """Cached complex type decisions per table and column name"""
+    _child_names: Dict[Tuple[Tuple[str, ...], str], Tuple[str, str, str]]
+    """Cached (normalized key, child column name, normalized list table identifier) per (path, key)"""
 
     def __init__(self, schema: Schema) -> None:
         self.schema = schema
@@ -56,6 +63,8 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
         self.propagation_config = self.normalizer_config.get("propagation", None)
         self.max_nesting = self.normalizer_config.get("max_nesting", 1000)
         self._skip_primary_key = {}
+        self._complex_types = {}
+        self._child_names = {}
         # self.known_types: Dict[str, TDataType] = {}
         # self.primary_keys = Dict[str, ]
 
@@ -69,17 +78,22 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
         if _r_lvl == max_nesting:
             return True
         # use cached value
-        # path = f"{table_name}▶{field_name}"
-        # or use definition in the schema
-        column: TColumnSchema = None
-        table = schema.tables.get(table_name)
-        if table:
-            column = table["columns"].get(field_name)
-        if column is None:
-            data_type = schema.get_preferred_type(field_name)
-        else:
-            data_type = column["data_type"]
-        return data_type == "complex"
+        table_complex_types = self._complex_types.get(table_name)
+        if table_complex_types is None:
+            table_complex_types = self._complex_types[table_name] = {}
+        is_complex = table_complex_types.get(field_name)
+        if is_complex is None:
+            # or use definition in the schema
+            column: TColumnSchema = None
+            table = schema.tables.get(table_name)
+            if table:
+                column = table["columns"].get(field_name)
+            if column is None:
+                data_type = schema.get_preferred_type(field_name)
+            else:
+                data_type = column["data_type"]
+            is_complex = table_complex_types[field_name] = data_type == "complex"
+        return is_complex
 
 
     def _flatten(
@@ -91,18 +105,17 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
 
         out_rec_row: DictStrAny = {}
         out_rec_list: Dict[Tuple[str, ...], Sequence[Any]] = {}
-        schema_naming = self.schema.naming
+        child_names = self._child_names
 
         def norm_row_dicts(dict_row: StrAny, __r_lvl: int, path: Tuple[str, ...] = ()) -> None:
             for k, v in dict_row.items():
-                if k.strip():
-                    norm_k = schema_naming.normalize_identifier(k)
-                else:
-                    # for empty keys in the data use _
-                    norm_k = EMPTY_KEY_IDENTIFIER
-                # if norm_k != k:
-                #     print(f"{k} -> {norm_k}")
-                child_name = norm_k if path == () else schema_naming.shorten_fragments(*path, norm_k)
+                names = child_names.get((path, k))
+                if names is None:
+                    # data with dynamic keys would grow the cache without bounds
+                    if len(child_names) >= self.CHILD_NAMES_CACHE_SIZE:
+                        child_names.clear()
+                    names = child_names[(path, k)] = self._get_child_names(path, k)
+                norm_k, child_name, norm_table_k = names
                 # for lists and dicts we must check if type is possibly complex
                 if isinstance(v, (dict, list)):
                     if not self._is_complex_type(table, child_name, __r_lvl):
@@ -112,7 +125,7 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
                             norm_row_dicts(v, __r_lvl + 1, path + (norm_k,))
                         else:
                             # pass the list to out_rec_list
-                            out_rec_list[path + (schema_naming.normalize_table_identifier(k),)] = v
+                            out_rec_list[path + (norm_table_k,)] = v
                         continue
                     else:
                         # pass the complex value to out_rec_row
@@ -123,6 +136,17 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
         norm_row_dicts(dict_row, _r_lvl)
         return cast(TDataItemRow, out_rec_row), out_rec_list
 
+    def _get_child_names(self, path: Tuple[str, ...], k: str) -> Tuple[str, str, str]:
+        schema_naming = self.schema.naming
+        if k.strip():
+            norm_k = schema_naming.normalize_identifier(k)
+            norm_table_k = schema_naming.normalize_table_identifier(k)
+        else:
+            # for empty keys in the data use _
+            norm_k = norm_table_k = EMPTY_KEY_IDENTIFIER
+        child_name = norm_k if path == () else schema_naming.shorten_fragments(*path, norm_k)
+        return norm_k, child_name, norm_table_k
+
     @staticmethod
     def _get_child_row_hash(parent_row_id: str, child_table: str, list_idx: int) -> str:
         # create deterministic unique id of the child row taking into account that all lists are ordered
@@ -262,6 +286,8 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
             self.extend_table(table_name)
 
     def extend_table(self, table_name: str) -> None:
+        # columns of the table could change
+        self._complex_types.pop(table_name, None)
         # if the table has a merge w_d, add propagation info to normalizer
         table = self.schema.tables.get(table_name)
         if not table.get("parent") and table["write_disposition"] == "merge":
@@ -272,6 +298,11 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
                     }
                 }}})
 
+    def invalidate_cache(self) -> None:
+        # preferred types could change
+        self._complex_types.clear()
+        self._child_names.clear()
+
     def normalize_data_item(self, item: TDataItem, load_id: str, table_name: str) -> TNormalizedRowIterator:
         # wrap items that are not dictionaries in dictionary, otherwise they cannot be processed by the JSON normalizer
         if not isinstance(item, dict):
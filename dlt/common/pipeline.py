@@ -140,11 +140,30 @@ class LoadInfo(NamedTuple):
     def __str__(self) -> str:
         return self.asstr(verbosity=1)
 
+class TStateShardInfo(TypedDict, total=False):
+    """Locates a single state shard in the destination state table"""
+    version: int
+    """Version of the state row that stores the shard"""
+    hash: str
+    """Content hash of the shard"""
+
+
+class TSourceStateShardInfo(TStateShardInfo, total=False):
+    resources: Dict[str, TStateShardInfo]
+    """Shards of the individual resources of a source"""
+
+
+TStateShards = Dict[str, TSourceStateShardInfo]
+"""Manifest of source and resource state shards, keyed by source name"""
+
+
 class TPipelineLocalState(TypedDict, total=False):
     first_run: bool
     """Indicates a first run of the pipeline, where run ends with successful loading of data"""
     _last_extracted_at: datetime.datetime
     """Timestamp indicating when the state was synced with the destination. Lack of timestamp means not synced state."""
+    _state_shards: TStateShards
+    """Manifest of state shards that are confirmed to be stored in the destination"""
 
 
 class TPipelineState(TypedDict, total=False):
@@ -1,6 +1,6 @@
 import yaml
 from copy import copy, deepcopy
-from typing import ClassVar, Dict, List, Mapping, Optional, Sequence, Tuple, Any, cast
+from typing import ClassVar, Dict, List, Mapping, Optional, Sequence, Set, Tuple, Type, Any, cast
 from dlt.common import json
 
 from dlt.common.utils import extend_list_deduplicated
@@ -52,6 +52,10 @@ class Schema:
     _compiled_includes: Dict[str, Sequence[REPattern]]
     # type detections
     _type_detections: Sequence[TTypeDetections]
+    # (column name, python type) pairs per table that do not require coercion, with columns they were compiled for
+    _coerce_plans: Dict[str, Tuple[TTableSchemaColumns, Set[Tuple[str, Type[Any]]]]]
+    # tables serialized for version hash, with copies of table content they were serialized from
+    _dumped_tables: Dict[str, Tuple[TTableSchema, str]]
 
     # normalizers config
     _normalizers_config: TNormalizersConfig
@@ -99,7 +103,7 @@ class Schema:
             stored_schema["description"] = self._schema_description
 
         # bump version if modified
-        utils.bump_version_if_modified(stored_schema)
+        utils.bump_version_if_modified(stored_schema, self._dump_table)
         # remove defaults after bumping version
         if remove_defaults:
             utils.remove_defaults(stored_schema)
@@ -168,6 +172,7 @@ class Schema:
         if not table:
             table = utils.new_table(table_name, parent_table)
         table_columns = table["columns"]
+        coerce_plan = self._get_coerce_plan(table_name, table_columns)
 
         new_row: DictStrAny = {}
         for col_name, v in row.items():
@@ -175,6 +180,9 @@ class Schema:
             if v is None:
                 # just check if column is nullable if it exists
                 self._coerce_null_value(table_columns, table_name, col_name)
+            elif (col_name, type(v)) in coerce_plan:
+                # value of this type fits the existing column as is
+                new_row[col_name] = v
             else:
                 new_col_name, new_col_def, new_v = self._coerce_non_null_value(table_columns, table_name, col_name, v)
                 new_row[new_col_name] = new_v
@@ -184,6 +192,8 @@ class Schema:
                         updated_table_partial = copy(table)
                         updated_table_partial["columns"] = {}
                     updated_table_partial["columns"][new_col_name] = new_col_def
+                elif new_v is v and new_col_name == col_name:
+                    self._add_to_coerce_plan(coerce_plan, table_columns[col_name], v)
 
         return new_row, updated_table_partial
 
@@ -205,6 +215,9 @@ class Schema:
         else:
             # merge tables performing additional checks
             partial_table = utils.merge_tables(table, partial_table)
+        # columns changed so coerce plan must be recompiled and table serialized again
+        self._coerce_plans.pop(table_name, None)
+        self._dumped_tables.pop(table_name, None)
 
         self.data_item_normalizer.extend_table(table_name)
         return partial_table
@@ -231,7 +244,8 @@ class Schema:
         Returns:
             Tuple[int, str]: Current (``stored_version``, ``stored_version_hash``) tuple
         """
-        version = utils.bump_version_if_modified(self.to_dict())
+        stored_schema = self.to_dict()
+        version = stored_schema["version"], stored_schema["version_hash"]
         self._stored_version, self._stored_version_hash = version
         return version
 
@@ -334,7 +348,7 @@ class Schema:
         Returns:
             int: Current schema version
         """
-        return utils.bump_version_if_modified(self.to_dict())[0]
+        return self.to_dict()["version"]
 
     @property
     def stored_version(self) -> int:
@@ -348,7 +362,7 @@ class Schema:
     @property
     def version_hash(self) -> str:
         """Current version hash of the schema, recomputed from the actual content"""
-        return utils.bump_version_if_modified(self.to_dict())[1]
+        return self.to_dict()["version_hash"]
 
     @property
     def stored_version_hash(self) -> str:
@@ -405,6 +419,13 @@ class Schema:
             self.settings["detections"].remove(detection)
             self._compile_settings()
 
+    def _dump_table(self, table: TTableSchema) -> str:
+        # serialize only tables that were updated since last call, comparing content also detects tables modified in place
+        dumped_table = self._dumped_tables.get(table["name"])
+        if dumped_table is None or dumped_table[0] != table:
+            dumped_table = self._dumped_tables[table["name"]] = (deepcopy(table), utils.dump_table_for_hash(table))
+        return dumped_table[1]
+
     def _infer_column(self, k: str, v: Any, data_type: TDataType = None, is_variant: bool = False) -> TColumnSchema:
         column_schema =  TColumnSchema(
             name=k,
@@ -421,6 +442,25 @@ class Schema:
             column_schema["variant"] = is_variant
         return column_schema
 
+    def _get_coerce_plan(self, table_name: str, table_columns: TTableSchemaColumns) -> Set[Tuple[str, Type[Any]]]:
+        """Gets a set of (column name, python type) pairs for which values fit the existing columns of `table_name` without coercion"""
+        plan = self._coerce_plans.get(table_name)
+        # plan is valid only for the columns it was compiled for
+        if plan is None or plan[0] is not table_columns:
+            plan = self._coerce_plans[table_name] = (table_columns, set())
+        return plan[1]
+
+    @staticmethod
+    def _add_to_coerce_plan(coerce_plan: Set[Tuple[str, Type[Any]]], column: TColumnSchema, v: Any) -> None:
+        """Adds value type to `coerce_plan` if all values of that type fit `column` as they are, independently of the value"""
+        py_type = type(v)
+        data_type = column.get("data_type")
+        # complex values need encoding, enums are coerced to values and callables may be variants
+        if data_type == "complex" or hasattr(v, "value") or callable(v):
+            return
+        if data_type == py_type_to_sc_type(py_type):
+            coerce_plan.add((column["name"], py_type))
+
     def _coerce_null_value(self, table_columns: TTableSchemaColumns, table_name: str, col_name: str) -> None:
         """Raises when column is explicitly not nullable"""
         if col_name in table_columns:
@@ -514,6 +554,7 @@ class Schema:
                 self.normalize_table_identifiers(table)
             # re-index the table names
             self._schema_tables = {t["name"]:t for t in self._schema_tables.values()}
+            self._dumped_tables.clear()
 
         # name normalization functions
         self.naming = naming_module
@@ -539,6 +580,8 @@ class Schema:
         self._compiled_excludes: Dict[str, Sequence[REPattern]] = {}
         self._compiled_includes: Dict[str, Sequence[REPattern]] = {}
         self._type_detections: Sequence[TTypeDetections] = None
+        self._coerce_plans: Dict[str, Tuple[TTableSchemaColumns, Set[Tuple[str, Type[Any]]]]] = {}
+        self._dumped_tables: Dict[str, Tuple[TTableSchema, str]] = {}
 
         self._normalizers_config = None
         self.naming = None
@@ -561,6 +604,7 @@ class Schema:
 
     def _from_stored_schema(self, stored_schema: TStoredSchema) -> None:
         self._schema_tables = stored_schema.get("tables") or {}
+        self._dumped_tables.clear()
         if self.version_table_name not in self._schema_tables:
             raise SchemaCorruptedException(f"Schema must contain table {self.version_table_name}")
         if self.loads_table_name not in self._schema_tables:
@@ -595,6 +639,8 @@ class Schema:
                         self._compiled_includes[table["name"]] = list(map(utils.compile_simple_regex, table["filters"]["includes"]))
         # look for auto-detections in settings and then normalizer
         self._type_detections = self._settings.get("detections") or self._normalizers_config.get("detections") or []  # type: ignore
+        if self.data_item_normalizer:
+            self.data_item_normalizer.invalidate_cache()
 
     def __repr__(self) -> str:
         return f"Schema {self.name} at {id(self)}"
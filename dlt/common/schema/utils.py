@@ -3,7 +3,7 @@ import base64
 import hashlib
 
 from copy import deepcopy, copy
-from typing import Dict, List, Sequence, Tuple, Type, Any, cast, Iterable, Optional, Union
+from typing import Callable, Dict, List, Sequence, Tuple, Type, Any, cast, Iterable, Optional, Union
 
 from dlt.common import json
 from dlt.common.data_types import TDataType
@@ -134,9 +134,9 @@ def add_column_defaults(column: TColumnSchemaBase) -> TColumnSchema:
 #     return copy(column)  # type: ignore
 
 
-def bump_version_if_modified(stored_schema: TStoredSchema) -> Tuple[int, str]:
+def bump_version_if_modified(stored_schema: TStoredSchema, dump_table: Callable[[TTableSchema], str] = None) -> Tuple[int, str]:
     # if any change to schema document is detected then bump version and write new hash
-    hash_ = generate_version_hash(stored_schema)
+    hash_ = generate_version_hash(stored_schema, dump_table)
     previous_hash = stored_schema.get("version_hash")
     if not previous_hash:
         # if hash was not set, set it without bumping the version, that's initial schema
@@ -147,14 +147,33 @@ def bump_version_if_modified(stored_schema: TStoredSchema) -> Tuple[int, str]:
     return stored_schema["version"], hash_
 
 
-def generate_version_hash(stored_schema: TStoredSchema) -> str:
-    # generates hash out of stored schema content, excluding the hash itself and version
-    schema_copy = deepcopy(stored_schema)
+def dump_table_for_hash(table: TTableSchema) -> str:
+    """Serializes `table` exactly as it appears in the document hashed by `generate_version_hash`"""
+    return json.dumps(table, sort_keys=True)
+
+
+def generate_version_hash(stored_schema: TStoredSchema, dump_table: Callable[[TTableSchema], str] = None) -> str:
+    """Generates hash out of stored schema content, excluding the hash itself and version.
+
+    Tables may be serialized with `dump_table` ie. to reuse serialized content of tables that did not change. It must
+    return the same string as `dump_table_for_hash`.
+    """
+    # only top level keys are removed so shallow copy is enough
+    schema_copy = copy(stored_schema)
     schema_copy.pop("version")
     schema_copy.pop("version_hash", None)
     schema_copy.pop("imported_version_hash", None)
     # ignore order of elements when computing the hash
-    content = json.dumps(schema_copy, sort_keys=True)
+    tables = schema_copy.get("tables")
+    if dump_table is None or not tables:
+        content = json.dumps(schema_copy, sort_keys=True)
+    else:
+        # compose the same document as serialized with sorted keys but with tables serialized separately
+        dumped_tables = "{" + ",".join(json.dumps(tn) + ":" + dump_table(tables[tn]) for tn in sorted(tables)) + "}"
+        content = "{" + ",".join(
+            json.dumps(k) + ":" + (dumped_tables if k == "tables" else json.dumps(v, sort_keys=True))
+            for k, v in sorted(schema_copy.items())
+        ) + "}"
     h = hashlib.sha3_256(content.encode("utf-8"))
     # additionally check column order
     table_names = sorted((schema_copy.get("tables") or {}).keys())
@@ -2,11 +2,12 @@ import contextlib
 from copy import deepcopy
 import os
 import datetime  # noqa: 251
+import threading
 import humanize
 from os.path import join
 from pathlib import Path
 from pendulum.datetime import DateTime
-from typing import Dict, Iterable, List, NamedTuple, Literal, Optional, Sequence, Set, get_args, cast
+from typing import Dict, Iterable, List, NamedTuple, Literal, Optional, Sequence, Set, Tuple, get_args, cast
 
 from dlt.common import json, pendulum
 from dlt.common.configuration import known_sections
@@ -155,6 +156,9 @@ class LoadStorage(DataItemStorage, VersionedStorage):
             raise TerminalValueError(preferred_file_format)
         self.supported_file_formats = supported_file_formats
         self.config = config
+        # in-memory index of job states in normalized packages: load_id -> table_name -> job file name -> state
+        self._jobs_index: Dict[str, Dict[str, Dict[str, TJobState]]] = {}
+        self._jobs_index_lock = threading.Lock()
         super().__init__(
             preferred_file_format,
             LoadStorage.STORAGE_VERSION,
@@ -212,6 +216,7 @@ class LoadStorage(DataItemStorage, VersionedStorage):
 
     def commit_temp_load_package(self, load_id: str) -> None:
         self.storage.rename_tree(load_id, self.get_package_path(load_id))
+        self._drop_jobs_index(load_id)
 
     def list_packages(self) -> Sequence[str]:
         loads = self.storage.list_folder_dirs(LoadStorage.NORMALIZED_FOLDER, to_root=False)
@@ -240,6 +245,15 @@ class LoadStorage(DataItemStorage, VersionedStorage):
     def list_jobs_for_table(self, load_id: str, table_name: str) -> Sequence[LoadJobInfo]:
         return [job for job in self.list_all_jobs(load_id) if job.job_file_info.table_name == table_name]
 
+    def list_job_states_for_table(self, load_id: str, table_name: str) -> Sequence[Tuple[TJobState, ParsedLoadJobFileName]]:
+        """Lists states and parsed file names of all jobs for `table_name` in normalized package `load_id`.
+
+           Uses in-memory job index that is built from disk on first access and then updated when jobs are moved, so the package is not rescanned.
+        """
+        with self._jobs_index_lock:
+            table_jobs = self._get_jobs_index(load_id).get(table_name, {})
+            return [(state, ParsedLoadJobFileName.parse(file_name)) for file_name, state in table_jobs.items()]
+
     def list_all_jobs(self, load_id: str) -> Sequence[LoadJobInfo]:
         info = self.get_load_package_info(load_id)
         return [job for job in flatten_list_or_items(iter(info.jobs.values()))]  # type: ignore
@@ -285,7 +299,9 @@ class LoadStorage(DataItemStorage, VersionedStorage):
                 # we ignore if load package lacks one of working folders. completed_jobs may be deleted on archiving
                 for file in self.storage.list_folder_files(join(package_path, state)):
                     if not file.endswith(".exception"):
-                        jobs.append(self._read_job_file_info(state, file, package_created_at))
+                        # job may be moved to other folder by a loader worker in the meantime
+                        with contextlib.suppress(FileNotFoundError):
+                            jobs.append(self._read_job_file_info(state, file, package_created_at))
             all_jobs[state] = jobs
 
         return LoadPackageInfo(load_id, self.storage.make_full_path(package_path), package_state, schema.name, applied_update, package_created_at, all_jobs)
@@ -313,7 +329,9 @@ class LoadStorage(DataItemStorage, VersionedStorage):
 
     def add_new_job(self, load_id: str, job_file_path: str, job_state: TJobState = "new_jobs") -> None:
         """Adds new job by moving the `job_file_path` into `new_jobs` of package `load_id`"""
-        self.storage.atomic_import(job_file_path, self._get_job_folder_path(load_id, job_state))
+        with self._jobs_index_lock:
+            self.storage.atomic_import(job_file_path, self._get_job_folder_path(load_id, job_state))
+            self._update_jobs_index(load_id, None, FileStorage.get_file_name_from_file_path(job_file_path), job_state)
 
     def atomic_import(self, external_file_path: str, to_folder: str) -> str:
         """Copies or links a file at `external_file_path` into the `to_folder` effectively importing file into storage"""
@@ -357,6 +375,7 @@ class LoadStorage(DataItemStorage, VersionedStorage):
         # move to completed
         completed_path = self.get_completed_package_path(load_id)
         self.storage.rename_tree(load_path, completed_path)
+        self._drop_jobs_index(load_id)
 
     def delete_completed_package(self, load_id: str) -> None:
         package_path = self.get_completed_package_path(load_id)
@@ -366,6 +385,8 @@ class LoadStorage(DataItemStorage, VersionedStorage):
 
     def wipe_normalized_packages(self) -> None:
         self.storage.delete_folder(self.NORMALIZED_FOLDER, recursively=True)
+        with self._jobs_index_lock:
+            self._jobs_index.clear()
 
     def get_package_path(self, load_id: str) -> str:
         return join(LoadStorage.NORMALIZED_FOLDER, load_id)
@@ -390,10 +411,41 @@ class LoadStorage(DataItemStorage, VersionedStorage):
         assert file_name == FileStorage.get_file_name_from_file_path(file_name)
         load_path = self.get_package_path(load_id)
         dest_path = join(load_path, dest_folder, new_file_name or file_name)
-        self.storage.atomic_rename(join(load_path, source_folder, file_name), dest_path)
+        with self._jobs_index_lock:
+            self.storage.atomic_rename(join(load_path, source_folder, file_name), dest_path)
+            self._update_jobs_index(load_id, file_name, new_file_name or file_name, dest_folder)
         # print(f"{join(load_path, source_folder, file_name)} -> {dest_path}")
         return self.storage.make_full_path(dest_path)
 
+    def _get_jobs_index(self, load_id: str) -> Dict[str, Dict[str, TJobState]]:
+        """Gets jobs index for package `load_id`, rebuilds it from disk if not present. Must be called with index lock held"""
+        jobs_index = self._jobs_index.get(load_id)
+        if jobs_index is None:
+            jobs_index = {}
+            for state in WORKING_FOLDERS:
+                with contextlib.suppress(FileNotFoundError):
+                    for file_name in self.storage.list_folder_files(self._get_job_folder_path(load_id, state), to_root=False):
+                        if not file_name.endswith(".exception"):
+                            table_name = self.parse_job_file_name(file_name).table_name
+                            jobs_index.setdefault(table_name, {})[file_name] = state
+            self._jobs_index[load_id] = jobs_index
+        return jobs_index
+
+    def _update_jobs_index(self, load_id: str, old_file_name: Optional[str], file_name: str, state: TJobState) -> None:
+        """Moves job in the index of package `load_id` if index is present. Must be called with index lock held"""
+        jobs_index = self._jobs_index.get(load_id)
+        if jobs_index is None:
+            # will be built from disk on first access
+            return
+        table_jobs = jobs_index.setdefault(self.parse_job_file_name(file_name).table_name, {})
+        if old_file_name:
+            table_jobs.pop(old_file_name, None)
+        table_jobs[file_name] = state
+
+    def _drop_jobs_index(self, load_id: str) -> None:
+        with self._jobs_index_lock:
+            self._jobs_index.pop(load_id, None)
+
     def _get_job_folder_path(self, load_id: str, folder: TJobState) -> str:
         return join(self.get_package_path(load_id), folder)
 
@@ -1,8 +1,7 @@
 import os
 from pathlib import Path
-from typing import ClassVar, Dict, Optional, Sequence, Tuple, List, cast, Type, Any
+from typing import ClassVar, Dict, Iterable, Iterator, Optional, Sequence, Tuple, List, cast, Type, Any
 import google.cloud.bigquery as bigquery  # noqa: I250
-from google.cloud import exceptions as gcp_exceptions
 from google.api_core import exceptions as api_core_exceptions
 
 from dlt.common import json, logger
@@ -15,7 +14,7 @@ from dlt.common.schema.typing import TTableSchema, TColumnType, TTableFormat
 from dlt.common.schema.exceptions import UnknownTableException
 
 from dlt.destinations.job_client_impl import SqlJobClientWithStaging
-from dlt.destinations.exceptions import DestinationSchemaWillNotUpdate, DestinationTransientException, LoadJobNotExistsException, LoadJobTerminalException
+from dlt.destinations.exceptions import DatabaseUndefinedRelation, DestinationSchemaWillNotUpdate, DestinationTransientException, LoadJobNotExistsException, LoadJobTerminalException
 
 from dlt.destinations.bigquery import capabilities
 from dlt.destinations.bigquery.configuration import BigQueryClientConfiguration
@@ -62,7 +61,18 @@ class BigQueryTypeMapper(TypeMapper):
         "TIME": "time",
     }
 
+    # standard sql type names used in INFORMATION_SCHEMA to legacy type names used by the API
+    sql_dbt_to_dbt = {
+        "INT64": "INTEGER",
+        "FLOAT64": "FLOAT",
+        "BOOL": "BOOLEAN",
+    }
+
     def from_db_type(self, db_type: str, precision: Optional[int], scale: Optional[int]) -> TColumnType:
+        # nested types look like ARRAY<INT64> or STRUCT<a STRING, b INT64>
+        if db_type.startswith(("ARRAY", "STRUCT")):
+            return dict(data_type="complex")
+        db_type = self.sql_dbt_to_dbt.get(db_type, db_type)
         if db_type == "BIGNUMERIC":
             if precision is None:  # biggest numeric possible
                 return dict(data_type="wei")
@@ -250,31 +260,46 @@ class BigQueryClient(SqlJobClientWithStaging, SupportsStagingDestination):
         name = self.capabilities.escape_identifier(c["name"])
         return f"{name} {self.type_mapper.to_db_type(c, table_format)} {self._gen_not_null(c.get('nullable', True))}"
 
-    def get_storage_table(self, table_name: str) -> Tuple[bool, TTableSchemaColumns]:
-        schema_table: TTableSchemaColumns = {}
+    def get_storage_tables(self, table_names: Iterable[str]) -> Iterator[Tuple[str, TTableSchemaColumns]]:
+        table_names = list(table_names)
+        if len(table_names) == 0:
+            return
+        storage_tables: Dict[str, TTableSchemaColumns] = {table_name: {} for table_name in table_names}
+        query = f"""
+SELECT table_name, column_name, data_type, is_nullable, is_partitioning_column, clustering_ordinal_position
+    FROM {self.sql_client.fully_qualified_dataset_name()}.INFORMATION_SCHEMA.COLUMNS
+WHERE table_name IN UNNEST(%s) ORDER BY table_name, ordinal_position;"""
         try:
-            table = self.sql_client.native_connection.get_table(
-                self.sql_client.make_qualified_table_name(table_name, escape=False),
-                retry=self.sql_client._default_retry,
-                timeout=self.config.http_timeout
-            )
-            partition_field = table.time_partitioning.field if table.time_partitioning else None
-            for c in table.schema:
-                schema_c: TColumnSchema = {
-                    "name": c.name,
-                    "nullable": c.is_nullable,
-                    "unique": False,
-                    "sort": False,
-                    "primary_key": False,
-                    "foreign_key": False,
-                    "cluster": c.name in (table.clustering_fields or []),
-                    "partition": c.name == partition_field,
-                    **self._from_db_type(c.field_type, c.precision, c.scale)
-                }
-                schema_table[c.name] = schema_c
-            return True, schema_table
-        except gcp_exceptions.NotFound:
-            return False, schema_table
+            rows = self.sql_client.execute_sql(query, table_names)
+        except DatabaseUndefinedRelation:
+            # dataset does not exist
+            rows = []
+        for c in rows:
+            schema_table = storage_tables.get(c[0])
+            if schema_table is None:
+                continue
+            # parametrized types look like NUMERIC(10, 2)
+            db_type, _, params = c[2].partition("(")
+            precision: Optional[int] = None
+            scale: Optional[int] = None
+            if params and db_type in ("NUMERIC", "BIGNUMERIC"):
+                type_params = [int(p) for p in params.rstrip(")").split(",")]
+                precision = type_params[0]
+                scale = type_params[1] if len(type_params) > 1 else 0
+            schema_c: TColumnSchema = {
+                "name": c[1],
+                "nullable": c[3] == "YES",
+                "unique": False,
+                "sort": False,
+                "primary_key": False,
+                "foreign_key": False,
+                "cluster": c[5] is not None,
+                "partition": c[4] == "YES",
+                **self._from_db_type(db_type, precision, scale)
+            }
+            schema_table[c[1]] = schema_c
+        for table_name in table_names:
+            yield table_name, storage_tables[table_name]
 
     def _create_load_job(self, table: TTableSchema, file_path: str) -> bigquery.LoadJob:
         # append to table for merge loads (append to stage) and regular appends
@@ -35,6 +35,7 @@ def capabilities() -> DestinationCapabilitiesContext:
     caps.supports_ddl_transactions = True
     caps.alter_add_multi_column = False
     caps.supports_truncate_command = False
+    caps.loader_adds_load_id = True
 
     return caps
 
@@ -104,10 +104,11 @@ class DuckDbTypeMapper(TypeMapper):
 
 
 class DuckDbCopyJob(LoadJob, FollowupJob):
-    def __init__(self, table_name: str, file_path: str, sql_client: DuckDbSqlClient) -> None:
+    def __init__(self, table: TTableSchema, file_path: str, load_id: str, sql_client: DuckDbSqlClient) -> None:
         super().__init__(FileStorage.get_file_name_from_file_path(file_path))
 
-        qualified_table_name = sql_client.make_qualified_table_name(table_name)
+        qualified_table_name = sql_client.make_qualified_table_name(table["name"])
+        insert_sql: str = None
         if file_path.endswith("parquet"):
             source_format = "PARQUET"
             options = ""
@@ -115,6 +116,8 @@ class DuckDbCopyJob(LoadJob, FollowupJob):
             with PARQUET_TABLE_LOCK:
                 # create or get lock per table name
                 lock: threading.Lock = TABLES_LOCKS.setdefault(qualified_table_name, threading.Lock())
+            if "_dlt_load_id" in table["columns"]:
+                insert_sql = self._insert_with_load_id_sql(qualified_table_name, file_path, load_id, sql_client)
         elif file_path.endswith("jsonl"):
             # NOTE: loading JSON does not work in practice on duckdb: the missing keys fail the load instead of being interpreted as NULL
             source_format = "JSON"  # newline delimited, compression auto
@@ -125,7 +128,23 @@ class DuckDbCopyJob(LoadJob, FollowupJob):
 
         with maybe_context(lock):
             with sql_client.begin_transaction():
-                sql_client.execute_sql(f"COPY {qualified_table_name} FROM '{file_path}' ( FORMAT {source_format} {options});")
+                if insert_sql:
+                    sql_client.execute_sql(insert_sql)
+                else:
+                    sql_client.execute_sql(f"COPY {qualified_table_name} FROM '{file_path}' ( FORMAT {source_format} {options});")
+
+    @staticmethod
+    def _insert_with_load_id_sql(qualified_table_name: str, file_path: str, load_id: str, sql_client: DuckDbSqlClient) -> Optional[str]:
+        """Returns INSERT statement that fills `_dlt_load_id` if parquet file was linked by normalizer without it"""
+        file_columns = [row[0] for row in sql_client.execute_sql(f"DESCRIBE SELECT * FROM read_parquet('{file_path}');")]
+        if "_dlt_load_id" in file_columns:
+            return None
+        escape_identifier = sql_client.capabilities.escape_identifier
+        columns = ", ".join(escape_identifier(c) for c in file_columns)
+        return (
+            f"INSERT INTO {qualified_table_name} ({columns}, {escape_identifier('_dlt_load_id')}) "
+            f"SELECT {columns}, {sql_client.capabilities.escape_literal(load_id)} FROM read_parquet('{file_path}');"
+        )
 
 
     def state(self) -> TLoadJobState:
@@ -152,7 +171,7 @@ class DuckDbClient(InsertValuesJobClient):
     def start_file_load(self, table: TTableSchema, file_path: str, load_id: str) -> LoadJob:
         job = super().start_file_load(table, file_path, load_id)
         if not job:
-            job = DuckDbCopyJob(table["name"], file_path, self.sql_client)
+            job = DuckDbCopyJob(table, file_path, load_id, self.sql_client)
         return job
 
     def _get_column_def_sql(self, c: TColumnSchema, table_format: TTableFormat = None) -> str:
@@ -6,7 +6,7 @@ import contextlib
 from copy import copy
 import datetime  # noqa: 251
 from types import TracebackType
-from typing import Any, ClassVar, List, NamedTuple, Optional, Sequence, Tuple, Type, Iterable, Iterator, ContextManager, cast
+from typing import Any, ClassVar, Dict, List, NamedTuple, Optional, Sequence, Tuple, Type, Iterable, Iterator, Generator, ContextManager, cast
 import zlib
 import re
 
@@ -88,6 +88,8 @@ class SqlJobClientBase(JobClientBase, WithStateSync):
 
     _VERSION_TABLE_SCHEMA_COLUMNS: ClassVar[Tuple[str, ...]] = ('version_hash', 'schema_name', 'version', 'engine_version', 'inserted_at', 'schema')
     _STATE_TABLE_COLUMNS: ClassVar[Tuple[str, ...]] = ('version', 'engine_version', 'pipeline_name', 'state', 'created_at', '_dlt_load_id')
+    STORAGE_TABLES_QUERY_CHUNK: ClassVar[int] = 1000
+    """Max number of table names passed as query parameters when retrieving storage tables, some databases limit number of parameters"""
 
     def __init__(self, schema: Schema, config: DestinationClientConfiguration,  sql_client: SqlClientBase[TNativeConn]) -> None:
         self.version_table_schema_columns = ", ".join(sql_client.escape_column_name(col) for col in self._VERSION_TABLE_SCHEMA_COLUMNS)
@@ -205,7 +207,20 @@ class SqlJobClientBase(JobClientBase, WithStateSync):
     def __exit__(self, exc_type: Type[BaseException], exc_val: BaseException, exc_tb: TracebackType) -> None:
         self.sql_client.close_connection()
 
+    def is_open(self) -> bool:
+        conn = self.sql_client.native_connection
+        # dbapi connections that track their state expose `closed`
+        return conn is not None and not getattr(conn, "closed", False)
+
     def get_storage_table(self, table_name: str) -> Tuple[bool, TTableSchemaColumns]:
+        _, schema_table = next(iter(self.get_storage_tables([table_name])))
+        # if no columns we assume that table does not exist
+        return len(schema_table) > 0, schema_table
+
+    def get_storage_tables(self, table_names: Iterable[str]) -> Iterator[Tuple[str, TTableSchemaColumns]]:
+        """Gets columns of all `table_names` with INFORMATION_SCHEMA queries of up to `STORAGE_TABLES_QUERY_CHUNK` tables.
+        Yields table name and its columns, empty for tables that do not exist
+        """
 
         def _null_to_bool(v: str) -> bool:
             if v == "NO":
@@ -214,35 +229,44 @@ class SqlJobClientBase(JobClientBase, WithStateSync):
                 return True
             raise ValueError(v)
 
-        fields = ["column_name", "data_type", "is_nullable"]
+        table_names = list(table_names)
+        if len(table_names) == 0:
+            return
+        fields = ["table_name", "column_name", "data_type", "is_nullable"]
         if self.capabilities.schema_supports_numeric_precision:
             fields += ["numeric_precision", "numeric_scale"]
-        db_params = self.sql_client.make_qualified_table_name(table_name, escape=False).split(".", 3)
+        # all tables are in the same catalog and schema
+        db_params = self.sql_client.make_qualified_table_name(table_names[0], escape=False).split(".", 3)[:-1]
         query = f"""
 SELECT {",".join(fields)}
     FROM INFORMATION_SCHEMA.COLUMNS
 WHERE """
-        if len(db_params) == 3:
+        if len(db_params) == 2:
             query += "table_catalog = %s AND "
-        query += "table_schema = %s AND table_name = %s ORDER BY ordinal_position;"
-        rows = self.sql_client.execute_sql(query, *db_params)
+        rows: List[Sequence[Any]] = []
+        for idx in range(0, len(table_names), self.STORAGE_TABLES_QUERY_CHUNK):
+            chunk = table_names[idx:idx + self.STORAGE_TABLES_QUERY_CHUNK]
+            chunk_query = query + f"table_schema = %s AND table_name IN ({','.join(['%s'] * len(chunk))}) ORDER BY table_name, ordinal_position;"
+            rows.extend(self.sql_client.execute_sql(chunk_query, *db_params, *chunk))
 
         # if no rows we assume that table does not exist
-        schema_table: TTableSchemaColumns = {}
-        if len(rows) == 0:
-            # TODO: additionally check if table exists
-            return False, schema_table
+        # TODO: additionally check if table exists
+        storage_tables: Dict[str, TTableSchemaColumns] = {table_name: {} for table_name in table_names}
         # TODO: pull more data to infer indexes, PK and uniques attributes/constraints
         for c in rows:
-            numeric_precision = c[3] if self.capabilities.schema_supports_numeric_precision else None
-            numeric_scale = c[4] if self.capabilities.schema_supports_numeric_precision else None
+            schema_table = storage_tables.get(c[0])
+            if schema_table is None:
+                continue
+            numeric_precision = c[4] if self.capabilities.schema_supports_numeric_precision else None
+            numeric_scale = c[5] if self.capabilities.schema_supports_numeric_precision else None
             schema_c: TColumnSchemaBase = {
-                "name": c[0],
-                "nullable": _null_to_bool(c[2]),
-                **self._from_db_type(c[1], numeric_precision, numeric_scale)
+                "name": c[1],
+                "nullable": _null_to_bool(c[3]),
+                **self._from_db_type(c[2], numeric_precision, numeric_scale)
             }
-            schema_table[c[0]] = schema_c  # type: ignore
-        return True, schema_table
+            schema_table[c[1]] = schema_c  # type: ignore
+        for table_name in table_names:
+            yield table_name, storage_tables[table_name]
 
     @abstractmethod
     def _from_db_type(self, db_type: str, precision: Optional[int], scale: Optional[int]) -> TColumnType:
@@ -254,23 +278,20 @@ WHERE """
         return self._row_to_schema_info(query, self.schema.name)
 
     def get_stored_state(self, pipeline_name: str) -> StateInfo:
+        # close the generator so the cursor is released before next query is executed
+        with contextlib.closing(self.get_stored_states(pipeline_name)) as stored_states:
+            return next(stored_states, None)
+
+    def get_stored_states(self, pipeline_name: str) -> Generator[StateInfo, None, None]:
         state_table = self.sql_client.make_qualified_table_name(self.schema.state_table_name)
         loads_table = self.sql_client.make_qualified_table_name(self.schema.loads_table_name)
         query = f"SELECT {self.state_table_columns} FROM {state_table} AS s JOIN {loads_table} AS l ON l.load_id = s._dlt_load_id WHERE pipeline_name = %s AND l.status = 0 ORDER BY created_at DESC"
         with self.sql_client.execute_query(query, pipeline_name) as cur:
+            # fetch rows one by one so only the newest states are read when shards are found early
             row = cur.fetchone()
-        if not row:
-            return None
-        return StateInfo(row[0], row[1], row[2], row[3], pendulum.instance(row[4]))
-
-    # def get_stored_states(self, state_table: str) -> List[StateInfo]:
-    #     """Loads list of compressed states from destination storage, optionally filtered by pipeline name"""
-    #     query = f"SELECT {self.STATE_TABLE_COLUMNS} FROM {state_table} AS s ORDER BY created_at DESC"
-    #     result: List[StateInfo] = []
-    #     with self.sql_client.execute_query(query) as cur:
-    #         for row in cur.fetchall():
-    #             result.append(StateInfo(row[0], row[1], row[2], row[3], pendulum.instance(row[4])))
-    #     return result
+            while row:
+                yield StateInfo(row[0], row[1], row[2], row[3], pendulum.instance(row[4]))
+                row = cur.fetchone()
 
     def get_stored_schema_by_hash(self, version_hash: str) -> StorageSchemaInfo:
         name = self.sql_client.make_qualified_table_name(self.schema.version_table_name)
@@ -300,8 +321,8 @@ WHERE """
         """
         sql_updates = []
         schema_update: TSchemaTables = {}
-        for table_name in only_tables or self.schema.tables:
-            exists, storage_table = self.get_storage_table(table_name)
+        for table_name, storage_table in self.get_storage_tables(only_tables or self.schema.tables.keys()):
+            exists = len(storage_table) > 0
             new_columns = self._create_table_update(table_name, storage_table)
             if len(new_columns) > 0:
                 # build and add sql to execute
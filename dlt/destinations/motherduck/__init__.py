@@ -33,6 +33,7 @@ def capabilities() -> DestinationCapabilitiesContext:
     caps.supports_ddl_transactions = False
     caps.alter_add_multi_column = False
     caps.supports_truncate_command = False
+    caps.loader_adds_load_id = True
 
     return caps
 
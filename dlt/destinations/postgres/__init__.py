@@ -21,7 +21,8 @@ def capabilities() -> DestinationCapabilitiesContext:
     # https://www.postgresql.org/docs/current/limits.html
     caps = DestinationCapabilitiesContext()
     caps.preferred_loader_file_format = "insert_values"
-    caps.supported_loader_file_formats = ["insert_values"]
+    # parquet is not supported: arrow tables would be hard linked and loaded with COPY instead of the preferred format
+    caps.supported_loader_file_formats = ["insert_values", "jsonl"]
     caps.preferred_staging_file_format = None
     caps.supported_staging_file_formats = []
     caps.escape_identifier = escape_postgres_identifier
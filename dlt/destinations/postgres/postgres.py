@@ -1,11 +1,17 @@
-from typing import ClassVar, Dict, Optional, Sequence, List, Any
+import re
+import base64
+from io import StringIO
+from typing import Callable, ClassVar, Dict, Iterator, Optional, Sequence, List, Any, Tuple
 
+from dlt.common import json
 from dlt.common.wei import EVM_DECIMAL_PRECISION
-from dlt.common.destination.reference import NewLoadJob
+from dlt.common.destination.reference import FollowupJob, LoadJob, NewLoadJob, TLoadJobState
 from dlt.common.destination import DestinationCapabilitiesContext
 from dlt.common.data_types import TDataType
 from dlt.common.schema import TColumnSchema, TColumnHint, Schema
 from dlt.common.schema.typing import TTableSchema, TColumnType, TTableFormat
+from dlt.common.schema.utils import is_complete_column
+from dlt.common.storages import FileStorage
 
 from dlt.destinations.sql_jobs import SqlStagingCopyJob, SqlJobParams
 
@@ -22,6 +28,9 @@ HINT_TO_POSTGRES_ATTR: Dict[TColumnHint, str] = {
     "unique": "UNIQUE"
 }
 
+HEX_BYTES_RE = re.compile(r"0x(?:[0-9a-f]{2})*")
+"""Matches HexBytes encoded in jsonl. Note that base64 encoded bytes may match only if they consist of lowercase hex digits after `0x`"""
+
 class PostgresTypeMapper(TypeMapper):
     sct_to_unbound_dbt = {
         "complex": "jsonb",
@@ -76,6 +85,87 @@ class PostgresTypeMapper(TypeMapper):
         return super().from_db_type(db_type, precision, scale)
 
 
+class PostgresCopyJob(LoadJob, FollowupJob):
+    """Loads `jsonl` file with COPY ... FROM STDIN, streaming the rows as csv in chunks"""
+
+    COPY_CHUNK_SIZE: ClassVar[int] = 8 * 1024 * 1024
+    """Max size of csv buffer sent in single COPY statement"""
+
+    def __init__(self, table: TTableSchema, file_path: str, sql_client: Psycopg2SqlClient) -> None:
+        super().__init__(FileStorage.get_file_name_from_file_path(file_path))
+        self._sql_client = sql_client
+        qualified_table_name = sql_client.make_qualified_table_name(table["name"])
+        column_names, encoders, rows = self._jsonl_rows(table, file_path)
+        columns = ",".join(sql_client.capabilities.escape_identifier(c) for c in column_names)
+        # copy file content immediately
+        with self._sql_client.begin_transaction():
+            for csv_buffer in self._csv_chunks(encoders, rows):
+                sql_client.copy_expert(
+                    f"COPY {qualified_table_name} ({columns}) FROM STDIN WITH (FORMAT csv)", csv_buffer
+                )
+
+    def state(self) -> TLoadJobState:
+        # this job is always done
+        return "completed"
+
+    def exception(self) -> str:
+        # this part of code should be never reached
+        raise NotImplementedError()
+
+    def _csv_chunks(self, encoders: Sequence[Callable[[Any], str]], rows: Iterator[List[Any]]) -> Iterator[StringIO]:
+        """Encodes rows into csv buffers of at most COPY_CHUNK_SIZE characters"""
+        buffer = StringIO()
+        for row in rows:
+            buffer.write(
+                ",".join(
+                    "" if v is None else '"' + encode(v).replace('"', '""') + '"'
+                    for encode, v in zip(encoders, row)
+                )
+            )
+            buffer.write("\n")
+            if buffer.tell() >= self.COPY_CHUNK_SIZE:
+                buffer.seek(0)
+                yield buffer
+                buffer = StringIO()
+        if buffer.tell() > 0:
+            buffer.seek(0)
+            yield buffer
+
+    @staticmethod
+    def _jsonl_rows(table: TTableSchema, file_path: str) -> Tuple[List[str], List[Callable[[Any], str]], Iterator[List[Any]]]:
+        """Returns names and csv encoders of complete columns in `table` and iterator of rows with values of those columns in `file_path`"""
+        columns = [c for c in table["columns"].values() if is_complete_column(c)]
+        column_names = [c["name"] for c in columns]
+        encoders = [_csv_encoder(c["data_type"]) for c in columns]
+
+        def _rows() -> Iterator[List[Any]]:
+            with FileStorage.open_zipsafe_ro(file_path, "rb") as f:
+                for line in f:
+                    if line.strip():
+                        row = json.loadb(line)
+                        yield [row.get(name) for name in column_names]
+
+        return column_names, encoders, _rows()
+
+
+def _encode_binary(v: str) -> str:
+    # HexBytes are written to jsonl as 0x prefixed hex and bytes as base64, see `json.custom_encode`
+    if HEX_BYTES_RE.fullmatch(v):
+        return "\\x" + v[2:]
+    return "\\x" + base64.b64decode(v).hex()
+
+
+def _csv_encoder(data_type: TDataType) -> Callable[[Any], str]:
+    """Returns function converting json value of `data_type` into csv field text accepted by COPY"""
+    if data_type == "bool":
+        return lambda v: "true" if v else "false"
+    if data_type == "binary":
+        return _encode_binary
+    if data_type == "complex":
+        return lambda v: json.dumps(v) if isinstance(v, (dict, list)) else str(v)
+    return str
+
+
 class PostgresStagingCopyJob(SqlStagingCopyJob):
 
     @classmethod
@@ -109,6 +199,12 @@ class PostgresClient(InsertValuesJobClient):
         self.active_hints = HINT_TO_POSTGRES_ATTR if self.config.create_indexes else {}
         self.type_mapper = PostgresTypeMapper(self.capabilities)
 
+    def start_file_load(self, table: TTableSchema, file_path: str, load_id: str) -> LoadJob:
+        job = super().start_file_load(table, file_path, load_id)
+        if not job and file_path.endswith("jsonl"):
+            job = PostgresCopyJob(table, file_path, self.sql_client)
+        return job
+
     def _get_column_def_sql(self, c: TColumnSchema, table_format: TTableFormat = None) -> str:
         hints_str = " ".join(self.active_hints.get(h, "") for h in self.active_hints.keys() if c.get(h, False) is True)
         column_name = self.capabilities.escape_identifier(c["name"])
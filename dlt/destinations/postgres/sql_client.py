@@ -10,7 +10,7 @@ else:
     from psycopg2.sql import SQL, Composed, Composable
 
 from contextlib import contextmanager
-from typing import Any, AnyStr, ClassVar, Iterator, Optional, Sequence
+from typing import IO, Any, AnyStr, ClassVar, Iterator, Optional, Sequence
 
 from dlt.destinations.exceptions import DatabaseTerminalException, DatabaseTransientException, DatabaseUndefinedRelation
 from dlt.destinations.typing import DBApi, DBApiCursor, DBTransaction
@@ -95,6 +95,20 @@ class Psycopg2SqlClient(SqlClientBase["psycopg2.connection"], DBTransaction):
                     self.open_connection()
                 raise outer
 
+    @raise_database_error
+    def copy_expert(self, sql: str, file: IO[Any]) -> None:
+        """Executes COPY ... FROM STDIN `sql` statement streaming data from `file`"""
+        with self._conn.cursor() as curr:
+            try:
+                curr.copy_expert(sql, file)
+            except psycopg2.Error as outer:
+                try:
+                    self._reset_connection()
+                except psycopg2.Error:
+                    self.close_connection()
+                    self.open_connection()
+                raise outer
+
     def execute_fragments(self, fragments: Sequence[AnyStr], *args: Any, **kwargs: Any) -> Optional[Sequence[Sequence[Any]]]:
         # compose the statements using psycopg2 library
         composed =  Composed(sql if isinstance(sql, Composable) else SQL(sql) for sql in fragments)
@@ -1,3 +1,4 @@
+import contextlib
 from functools import wraps
 from types import TracebackType
 from typing import (
@@ -8,6 +9,8 @@ from typing import (
     Dict,
     Type,
     Iterable,
+    Iterator,
+    Generator,
     Any,
     IO,
     Tuple,
@@ -447,8 +450,9 @@ class WeaviateClient(JobClientBase, WithStateSync):
         return applied_update
 
     def _execute_schema_update(self, only_tables: Iterable[str]) -> None:
-        for table_name in only_tables or self.schema.tables:
-            exists, existing_columns = self.get_storage_table(table_name)
+        for table_name, existing_columns in self.get_storage_tables(only_tables or self.schema.tables.keys()):
+            # classes created by dlt always have properties
+            exists = len(existing_columns) > 0
             # TODO: detect columns where vectorization was added or removed and modify it. currently we ignore change of hints
             new_columns = self.schema.get_new_table_columns(
                 table_name, existing_columns
@@ -476,19 +480,39 @@ class WeaviateClient(JobClientBase, WithStateSync):
                 return False, table_schema
             raise
 
+        return True, self._class_schema_to_columns(class_schema)
+
+    def get_storage_tables(self, table_names: Iterable[str]) -> Iterator[Tuple[str, TTableSchemaColumns]]:
+        """Gets all class schemas with a single request. Yields table name and its columns, empty if class does not exist"""
+        classes = self.db_client.schema.get().get("classes", [])
+        class_schemas = {class_["class"]: class_ for class_ in classes}
+        # Weaviate may capitalize class names
+        class_schemas_lower = {class_name.lower(): class_ for class_name, class_ in class_schemas.items()}
+        for table_name in table_names:
+            class_name = self.make_qualified_class_name(table_name)
+            class_schema = class_schemas.get(class_name) or class_schemas_lower.get(class_name.lower())
+            yield table_name, {} if class_schema is None else self._class_schema_to_columns(class_schema)
+
+    def _class_schema_to_columns(self, class_schema: Dict[str, Any]) -> TTableSchemaColumns:
         # Convert Weaviate class schema to dlt table schema
+        table_schema: TTableSchemaColumns = {}
         for prop in class_schema["properties"]:
             schema_c: TColumnSchema = {
                 "name": self.schema.naming.normalize_identifier(prop["name"]),
                 **self._from_db_type(prop["dataType"][0], None, None),
             }
             table_schema[prop["name"]] = schema_c
-        return True, table_schema
+        return table_schema
 
     def get_stored_state(self, pipeline_name: str) -> Optional[StateInfo]:
         """Loads compressed state from destination storage"""
+        with contextlib.closing(self.get_stored_states(pipeline_name)) as stored_states:
+            return next(stored_states, None)
+
+    def get_stored_states(self, pipeline_name: str) -> Generator[StateInfo, None, None]:
+        """Iterates over compressed states of completed loads, newest first"""
 
-        # we need to find a stored state that matches a load id that was completed
+        # we need to find stored states that match a load id that was completed
         # we retrieve the state in blocks of 10 for this
         stepsize = 10
         offset = 0
@@ -504,7 +528,7 @@ class WeaviateClient(JobClientBase, WithStateSync):
                 }, limit=stepsize, offset=offset, properties=self.state_properties)
             offset += stepsize
             if len(state_records) == 0:
-                return None
+                return
             for state in state_records:
                 load_id = state["_dlt_load_id"]
                 load_records = self.get_records(self.schema.loads_table_name,
@@ -513,21 +537,10 @@ class WeaviateClient(JobClientBase, WithStateSync):
                         "operator": "Equal",
                         "valueString": load_id,
                      }, limit=1, properties=["load_id", "status"])
-                # if there is a load for this state which was successful, return the state
+                # if there is a load for this state which was successful, yield the state
                 if len(load_records):
                     state["dlt_load_id"] = state.pop("_dlt_load_id")
-                    return StateInfo(**state)
-
-    # def get_stored_states(self, state_table: str) -> List[StateInfo]:
-    #     state_records = self.get_records(state_table,
-    #         sort={
-    #             "path": ["created_at"],
-    #             "order": "desc"
-    #         }, properties=self.state_properties)
-
-    #     for state in state_records:
-    #         state["dlt_load_id"] = state.pop("_dlt_load_id")
-    #     return [StateInfo(**state) for state in state_records]
+                    yield StateInfo(**state)
 
     def get_stored_schema(self) -> Optional[StorageSchemaInfo]:
         """Retrieves newest schema from destination storage"""
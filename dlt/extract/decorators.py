@@ -208,7 +208,8 @@ def resource(
     merge_key: TTableHintTemplate[TColumnNames] = None,
     table_format: TTableHintTemplate[TTableFormat] = None,
     selected: bool = True,
-    spec: Type[BaseConfiguration] = None
+    spec: Type[BaseConfiguration] = None,
+    parallelized: bool = False
 ) -> DltResource:
     ...
 
@@ -224,7 +225,8 @@ def resource(
     merge_key: TTableHintTemplate[TColumnNames] = None,
     table_format: TTableHintTemplate[TTableFormat] = None,
     selected: bool = True,
-    spec: Type[BaseConfiguration] = None
+    spec: Type[BaseConfiguration] = None,
+    parallelized: bool = False
 ) -> Callable[[Callable[TResourceFunParams, Any]], DltResource]:
     ...
 
@@ -241,6 +243,7 @@ def resource(
     table_format: TTableHintTemplate[TTableFormat] = None,
     selected: bool = True,
     spec: Type[BaseConfiguration] = None,
+    parallelized: bool = False,
     standalone: Literal[True] = True
 ) -> Callable[[Callable[TResourceFunParams, Any]], Callable[TResourceFunParams, DltResource]]:
     ...
@@ -258,7 +261,8 @@ def resource(
     merge_key: TTableHintTemplate[TColumnNames] = None,
     table_format: TTableHintTemplate[TTableFormat] = None,
     selected: bool = True,
-    spec: Type[BaseConfiguration] = None
+    spec: Type[BaseConfiguration] = None,
+    parallelized: bool = False
 ) -> DltResource:
     ...
 
@@ -275,6 +279,7 @@ def resource(
     table_format: TTableHintTemplate[TTableFormat] = None,
     selected: bool = True,
     spec: Type[BaseConfiguration] = None,
+    parallelized: bool = False,
     standalone: bool = False,
     data_from: TUnboundDltResource = None,
 ) -> Any:
@@ -328,6 +333,8 @@ def resource(
 
         spec (Type[BaseConfiguration], optional): A specification of configuration and secret values required by the source.
 
+        parallelized (bool, optional): When `True` the resource generator is evaluated in the extract thread pool so many resources are extracted concurrently. See `DltResource.parallelize`.
+
         standalone (bool, optional): Returns a wrapped decorated function that creates DltResource instance. Must be called before use. Cannot be part of a source.
 
         data_from (TUnboundDltResource, optional): Allows to pipe data from one resource to another to build multi-step pipelines.
@@ -348,7 +355,10 @@ def resource(
             merge_key=merge_key,
             table_format=table_format
         )
-        return DltResource.from_data(_data, _name, _section, table_template, selected, cast(DltResource, data_from), incremental=incremental)
+        r = DltResource.from_data(_data, _name, _section, table_template, selected, cast(DltResource, data_from), incremental=incremental)
+        if parallelized:
+            r.parallelize()
+        return r
 
 
     def decorator(f: Callable[TResourceFunParams, Any]) -> Callable[TResourceFunParams, DltResource]:
@@ -105,9 +105,9 @@ class InvalidResourceDataType(DltResourceException):
         super().__init__(resource_name, f"Cannot create resource {resource_name} from specified data. If you want to process just one data item, enclose it in a list. " + msg)
 
 
-class InvalidResourceDataTypeAsync(InvalidResourceDataType):
+class InvalidParallelResourceDataType(InvalidResourceDataType):
     def __init__(self, resource_name: str, item: Any,_typ: Type[Any]) -> None:
-        super().__init__(resource_name, item, _typ, "Async iterators and generators are not valid resources. Please use standard iterators and generators that yield Awaitables instead (for example by yielding from async function without await")
+        super().__init__(resource_name, item, _typ, f"Parallel resource data must be a generator or a generator function but {_typ.__name__} was provided. Transformers cannot be parallelized.")
 
 
 class InvalidResourceDataTypeBasic(InvalidResourceDataType):
@@ -1,8 +1,11 @@
 import contextlib
 import os
-from typing import ClassVar, List, Set, Dict, Type, Any, Sequence, Optional
+from queue import Queue
+from threading import Thread
+from typing import Callable, ClassVar, Iterator, List, Set, Dict, Tuple, Type, Any, Sequence, Optional
 from collections import defaultdict
 
+from dlt.common.configuration import configspec, with_config
 from dlt.common.configuration.container import Container
 from dlt.common.configuration.resolve import inject_section
 from dlt.common.configuration.specs.config_section_context import ConfigSectionContext
@@ -15,9 +18,9 @@ from dlt.common.runtime.collector import Collector, NULL_COLLECTOR
 from dlt.common.utils import uniq_id
 from dlt.common.typing import TDataItems, TDataItem
 from dlt.common.schema import Schema, utils, TSchemaUpdate
-from dlt.common.schema.typing import TColumnSchema, TTableSchemaColumns
+from dlt.common.schema.typing import TColumnSchema, TTableSchema, TTableSchemaColumns
 from dlt.common.storages import NormalizeStorageConfiguration, NormalizeStorage, DataItemStorage, FileStorage
-from dlt.common.configuration.specs import known_sections
+from dlt.common.configuration.specs import BaseConfiguration, known_sections
 
 from dlt.extract.decorators import SourceSchemaInjectableContext
 from dlt.extract.exceptions import DataItemRequiredForDynamicTableHints
@@ -64,13 +67,28 @@ class ArrowExtractorStorage(ExtractorItemStorage):
 class ExtractorStorage(NormalizeStorage):
     EXTRACT_FOLDER: ClassVar[str] = "extract"
 
+    @configspec
+    class ExtractorStorageConfiguration(BaseConfiguration):
+        background_writer: bool = False
+        """Serializes and compresses the data items in a writer thread so extraction does not block on file i/o"""
+        background_writer_queue_size: int = 100
+        """Max number of data items waiting for the writer thread"""
+
+        __section__ = known_sections.EXTRACT
+
     """Wrapper around multiple extractor storages with different file formats"""
-    def __init__(self, C: NormalizeStorageConfiguration) -> None:
+    @with_config(spec=ExtractorStorageConfiguration)
+    def __init__(self, C: NormalizeStorageConfiguration, *, background_writer: bool = False, background_writer_queue_size: int = 100) -> None:
         super().__init__(True, C)
         self._item_storages: Dict[TLoaderFileFormat, ExtractorItemStorage] = {
             "puae-jsonl": JsonLExtractorStorage(self.storage, extract_folder=self.EXTRACT_FOLDER),
             "arrow": ArrowExtractorStorage(self.storage, extract_folder=self.EXTRACT_FOLDER)
         }
+        self.background_writer = background_writer
+        self.background_writer_queue_size = background_writer_queue_size
+        self._writer_queue: "Queue[Optional[Tuple[Callable[..., None], Tuple[Any, ...]]]]" = None
+        self._writer_thread: Thread = None
+        self._writer_exception: BaseException = None
 
     def _get_extract_path(self, extract_id: str) -> str:
         return os.path.join(self.EXTRACT_FOLDER, extract_id)
@@ -84,9 +102,22 @@ class ExtractorStorage(NormalizeStorage):
         return self._item_storages[loader_file_format]
 
     def close_writers(self, extract_id: str) -> None:
+        # write all pending items before closing the files
+        self.stop_background_writer()
         for storage in self._item_storages.values():
             storage.close_writers(extract_id)
 
+    def stop_background_writer(self, raise_on_failed: bool = True) -> None:
+        """Waits until all items queued for the writer thread are written and stops the thread. Raises exception from the writer thread."""
+        if self._writer_thread:
+            self._writer_queue.put(None)
+            self._writer_thread.join()
+            self._writer_thread = None
+            self._writer_queue = None
+        writer_exception, self._writer_exception = self._writer_exception, None
+        if writer_exception and raise_on_failed:
+            raise writer_exception
+
     def commit_extract_files(self, extract_id: str, with_delete: bool = True) -> None:
         extract_path = self._get_extract_path(extract_id)
         for file in self.storage.list_folder_files(extract_path, to_root=False):
@@ -101,7 +132,47 @@ class ExtractorStorage(NormalizeStorage):
             self.storage.delete_folder(extract_path, recursively=True)
 
     def write_data_item(self, file_format: TLoaderFileFormat, load_id: str, schema_name: str, table_name: str, item: TDataItems, columns: TTableSchemaColumns) -> None:
-        self.get_storage(file_format).write_data_item(load_id, schema_name, table_name, item, columns)
+        storage = self.get_storage(file_format)
+        if self.background_writer:
+            # create writer in current thread so it is configured in the same context as without background writer
+            writer = storage.get_writer(load_id, schema_name, table_name)
+            # columns may be modified in place by the extractor so pass a copy
+            self._submit_write(writer.write_data_item, item, dict(columns) if columns else columns)
+        else:
+            storage.write_data_item(load_id, schema_name, table_name, item, columns)
+
+    def write_empty_file(self, file_format: TLoaderFileFormat, load_id: str, schema_name: str, table_name: str, columns: TTableSchemaColumns) -> None:
+        storage = self.get_storage(file_format)
+        if self.background_writer:
+            writer = storage.get_writer(load_id, schema_name, table_name)
+            self._submit_write(writer.write_empty_file, columns)
+        else:
+            storage.write_empty_file(load_id, schema_name, table_name, columns)
+
+    def _submit_write(self, write_f: Callable[..., None], *args: Any) -> None:
+        # fail fast if writer thread failed
+        if self._writer_exception:
+            self.stop_background_writer()
+        if not self._writer_thread:
+            self._writer_queue = Queue(maxsize=self.background_writer_queue_size)
+            self._writer_thread = Thread(target=self._write_items, args=(self._writer_queue,), daemon=True, name="DltExtractWriterThread")
+            self._writer_thread.start()
+        # blocks if writer thread is behind
+        self._writer_queue.put((write_f, args))
+
+    def _write_items(self, writer_queue: "Queue[Optional[Tuple[Callable[..., None], Tuple[Any, ...]]]]") -> None:
+        while True:
+            task = writer_queue.get()
+            if task is None:
+                return
+            # after failure just drain the queue so the extractor does not block
+            if self._writer_exception:
+                continue
+            write_f, args = task
+            try:
+                write_f(*args)
+            except BaseException as ex:
+                self._writer_exception = ex
 
 
 
@@ -123,6 +194,8 @@ class Extractor:
         self.collector = collector
         self.resources_with_items = resources_with_items
         self.extract_id = extract_id
+        # last partial table computed with dynamic hints, per table name
+        self._computed_dynamic_tables: Dict[str, TTableSchema] = {}
 
     @property
     def storage(self) -> ExtractorItemStorage:
@@ -151,8 +224,7 @@ class Extractor:
         else:
             if resource._table_name_hint_fun:
                 if isinstance(items, list):
-                    for item in items:
-                        self._write_dynamic_table(resource, item)
+                    self._write_dynamic_tables(resource, items)
                 else:
                     self._write_dynamic_table(resource, items)
             else:
@@ -163,7 +235,7 @@ class Extractor:
 
     def write_empty_file(self, table_name: str) -> None:
         table_name = self.schema.naming.normalize_table_identifier(table_name)
-        self.storage.write_empty_file(self.extract_id, self.schema.name, table_name, None)
+        self._storage.write_empty_file(self.file_format, self.extract_id, self.schema.name, table_name, None)
 
     def _write_item(self, table_name: str, resource_name: str, items: TDataItems, columns: TTableSchemaColumns = None) -> None:
         # normalize table name before writing so the name match the name in schema
@@ -172,24 +244,49 @@ class Extractor:
         table_name = self.schema.naming.normalize_identifier(table_name)
         self.collector.update(table_name)
         self.resources_with_items.add(resource_name)
-        self.storage.write_data_item(self.extract_id, self.schema.name, table_name, items, columns)
+        self._storage.write_data_item(self.file_format, self.extract_id, self.schema.name, table_name, items, columns)
 
     def _write_dynamic_table(self, resource: DltResource, item: TDataItem) -> None:
+        table_name = self._compute_dynamic_table(resource, item)
+        # write to storage with inferred table name
+        self._write_item(table_name, resource.name, item)
+
+    def _write_dynamic_tables(self, resource: DltResource, items: List[TDataItem]) -> None:
+        """Routes `items` to tables with names computed from dynamic hints and writes each table partition once"""
+        partitions: Dict[str, List[TDataItem]] = {}
+        for item in items:
+            table_name = self._compute_dynamic_table(resource, item)
+            partition = partitions.get(table_name)
+            if partition is None:
+                partitions[table_name] = [item]
+            else:
+                partition.append(item)
+        for table_name, partition in partitions.items():
+            self._write_item(table_name, resource.name, partition)
+
+    def _compute_dynamic_table(self, resource: DltResource, item: TDataItem) -> str:
+        """Computes table name and updates partial table for `item` with dynamic hints. Returns the table name"""
         table_name = resource._table_name_hint_fun(item)
         existing_table = self.dynamic_tables.get(table_name)
         if existing_table is None:
-            self.dynamic_tables[table_name] = [resource.compute_table_schema(item)]
+            self.dynamic_tables[table_name] = [self._compute_table(resource, item)]
         else:
             # quick check if deep table merge is required
             if resource._table_has_other_dynamic_hints:
                 new_table = resource.compute_table_schema(item)
-                # this merges into existing table in place
-                utils.merge_tables(existing_table[0], new_table)
+                # merge only if hints resolved differently than for the previous item
+                if new_table != self._computed_dynamic_tables.get(table_name):
+                    # this merges into existing table in place
+                    utils.merge_tables(existing_table[0], new_table)
+                    self._computed_dynamic_tables[table_name] = new_table
             else:
                 # if there are no other dynamic hints besides name then we just leave the existing partial table
                 pass
-        # write to storage with inferred table name
-        self._write_item(table_name, resource.name, item)
+        return table_name
+
+    def _compute_table(self, resource: DltResource, item: TDataItem) -> TTableSchema:
+        """Computes partial table for `item` that is written to a table for the first time"""
+        return resource.compute_table_schema(item)
 
     def _write_static_table(self, resource: DltResource, table_name: str, items: TDataItems) -> None:
         existing_table = self.dynamic_tables.get(table_name)
@@ -241,18 +338,34 @@ class ArrowExtractor(Extractor):
         existing_table = self.dynamic_tables.get(table_name)
         if existing_table is not None:
             return
-        static_table = resource.compute_table_schema()
         if isinstance(items, list):
             item = items[0]
         else:
             item = items
+        static_table = self._compute_arrow_table(resource.compute_table_schema(), item)
+        static_table["name"] = table_name
+        self.dynamic_tables[table_name] = [self.schema.normalize_table_identifiers(static_table)]
+
+    def _compute_table(self, resource: DltResource, item: TDataItem) -> TTableSchema:
+        return self.schema.normalize_table_identifiers(self._compute_arrow_table(resource.compute_table_schema(item), item))
+
+    def _compute_arrow_table(self, table: TTableSchema, item: TDataItem) -> TTableSchema:
         # Merge the columns to include primary_key and other hints that may be set on the resource
         arrow_columns = pyarrow.py_arrow_to_table_schema_columns(item.schema)
-        for key, value in static_table["columns"].items():
+        for key, value in table["columns"].items():
             arrow_columns[key] = utils.merge_columns(value, arrow_columns.get(key, {}))
-        static_table["columns"] = arrow_columns
-        static_table["name"] = table_name
-        self.dynamic_tables[table_name] = [self.schema.normalize_table_identifiers(static_table)]
+        table["columns"] = arrow_columns
+        return table
+
+
+@contextlib.contextmanager
+def _stop_background_writer_on_exception(storage: ExtractorStorage) -> Iterator[None]:
+    try:
+        yield
+    except BaseException:
+        # extraction failed or got interrupted, do not report writer exceptions
+        storage.stop_background_writer(raise_on_failed=False)
+        raise
 
 
 def extract(
@@ -278,7 +391,7 @@ def extract(
     }
     last_item_format: Optional[TLoaderFileFormat] = None
 
-    with collector(f"Extract {source.name}"):
+    with collector(f"Extract {source.name}"), _stop_background_writer_on_exception(storage):
         # yield from all selected pipes
         with PipeIterator.from_pipes(source.resources.selected_pipes, max_parallel_items=max_parallel_items, workers=workers, futures_poll_interval=futures_poll_interval) as pipes:
             left_gens = total_gens = len(pipes._sources)
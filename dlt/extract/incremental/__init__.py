@@ -1,5 +1,5 @@
 import os
-from typing import Generic, TypeVar, Any, Optional, Callable, List, TypedDict, get_args, get_origin, Sequence, Type, Dict
+from typing import Generic, TypeVar, Any, Optional, Callable, List, TypedDict, get_args, get_origin, Sequence, Type, Dict, Iterator
 import inspect
 from functools import wraps, partial
 from datetime import datetime  # noqa: I251
@@ -24,7 +24,7 @@ from dlt.common.data_types.type_helpers import coerce_from_date_types, coerce_va
 
 from dlt.extract.exceptions import IncrementalUnboundError, PipeException
 from dlt.extract.incremental.exceptions import IncrementalCursorPathMissing, IncrementalPrimaryKeyMissing
-from dlt.extract.incremental.typing import IncrementalColumnState, TCursorValue, LastValueFunc
+from dlt.extract.incremental.typing import IncrementalColumnState, TCursorValue, LastValueFunc, TCursorOrder
 from dlt.extract.pipe import Pipe
 from dlt.extract.utils import resolve_column_value
 from dlt.extract.typing import SupportsPipe, TTableHintTemplate, MapItem, YieldMapItem, FilterItem, ItemTransform
@@ -72,6 +72,9 @@ class Incremental(ItemTransform[TDataItem], BaseConfiguration, Generic[TCursorVa
             specified range of data. Currently Airflow scheduler is detected: "data_interval_start" and "data_interval_end" are taken from the context and passed Incremental class.
             The values passed explicitly to Incremental will be ignored.
             Note that if logical "end date" is present then also "end_value" will be set which means that resource state is not used and exactly this range of date will be loaded
+        row_order: Declares that the resource yields items sorted by the cursor value, either ascending ("asc") or descending ("desc"). When set, the resource
+            generator is closed as soon as an item is out of range and no further items may be in range: ie. `end_value` is reached for ascending order
+            and `max` function. Works with `min` and `max` last value functions.
     """
     cursor_path: str = None
     # TODO: Support typevar here
@@ -85,7 +88,8 @@ class Incremental(ItemTransform[TDataItem], BaseConfiguration, Generic[TCursorVa
             last_value_func: Optional[LastValueFunc[TCursorValue]]=max,
             primary_key: Optional[TTableHintTemplate[TColumnNames]] = None,
             end_value: Optional[TCursorValue] = None,
-            allow_external_schedulers: bool = False
+            allow_external_schedulers: bool = False,
+            row_order: Optional[TCursorOrder] = None
     ) -> None:
         # make sure that path is valid
         if cursor_path:
@@ -100,6 +104,7 @@ class Incremental(ItemTransform[TDataItem], BaseConfiguration, Generic[TCursorVa
         self.resource_name: Optional[str] = None
         self.primary_key: Optional[TTableHintTemplate[TColumnNames]] = primary_key
         self.allow_external_schedulers = allow_external_schedulers
+        self.row_order = row_order
 
         self._cached_state: IncrementalColumnState = None
         """State dictionary cached on first access"""
@@ -143,7 +148,8 @@ class Incremental(ItemTransform[TDataItem], BaseConfiguration, Generic[TCursorVa
             last_value_func=self.last_value_func,
             primary_key=self.primary_key,
             end_value=self.end_value,
-            allow_external_schedulers=self.allow_external_schedulers
+            allow_external_schedulers=self.allow_external_schedulers,
+            row_order=self.row_order
         )
 
     def merge(self, other: "Incremental[TCursorValue]") -> "Incremental[TCursorValue]":
@@ -156,10 +162,10 @@ class Incremental(ItemTransform[TDataItem], BaseConfiguration, Generic[TCursorVa
         >>>
         >>> my_resource(updated=incremental(initial_value='2023-01-01', end_value='2023-02-01'))
         """
-        kwargs = dict(self, last_value_func=self.last_value_func, primary_key=self.primary_key)
+        kwargs = dict(self, last_value_func=self.last_value_func, primary_key=self.primary_key, row_order=self.row_order)
         for key, value in dict(
                 other,
-                last_value_func=other.last_value_func, primary_key=other.primary_key).items():
+                last_value_func=other.last_value_func, primary_key=other.primary_key, row_order=other.row_order).items():
             if value is not None:
                 kwargs[key] = value
         # preserve Generic param information
@@ -194,6 +200,7 @@ class Incremental(ItemTransform[TDataItem], BaseConfiguration, Generic[TCursorVa
             self.initial_value = native_value.initial_value
             self.last_value_func = native_value.last_value_func
             self.end_value = native_value.end_value
+            self.row_order = native_value.row_order
             self.resource_name = self.resource_name
         else:  # TODO: Maybe check if callable(getattr(native_value, '__lt__', None))
             # Passing bare value `incremental=44` gets parsed as initial_value
@@ -237,6 +244,16 @@ class Incremental(ItemTransform[TDataItem], BaseConfiguration, Generic[TCursorVa
         s = self.get_state()
         return s['last_value']  # type: ignore
 
+    def can_close(self) -> bool:
+        """Checks if the resource yielding items sorted by the cursor may be closed because no more items will be in range"""
+        if self.row_order is None or self.last_value_func not in (min, max):
+            return False
+        # items come in order in which the last value grows, so the end of range is reached
+        if (self.row_order == "asc") == (self.last_value_func is max):
+            return self.end_out_of_range
+        # items come in reverse order, all next items are before the start of the range
+        return self.start_out_of_range
+
     def _transform_item(self, transformer: IncrementalTransform, row: TDataItem) -> Optional[TDataItem]:
         row, start_out_of_range, end_out_of_range = transformer(row)
         self.start_out_of_range = start_out_of_range
@@ -425,10 +442,26 @@ class IncrementalResourceWrapper(ItemTransform[TDataItem]):
             if self._resource_name:
                 self._incremental.bind(Pipe(self._resource_name))
             bound_args.arguments[p.name] = self._incremental
-            return func(*bound_args.args, **bound_args.kwargs)
+            gen = func(*bound_args.args, **bound_args.kwargs)
+            if self._incremental.row_order and inspect.isgenerator(gen):
+                return self._close_when_out_of_range(self._incremental, gen)
+            return gen
 
         return _wrap  # type: ignore
 
+    @staticmethod
+    def _close_when_out_of_range(incremental: Incremental[Any], gen: Iterator[TDataItems]) -> Iterator[TDataItems]:
+        """Yields from `gen` and closes it when items are sorted by cursor and the last item was out of range. The incremental step
+           processes each item before the generator is resumed"""
+        try:
+            for item in gen:
+                yield item
+                if incremental.can_close():
+                    logger.info(f"Closing resource {incremental.resource_name}: items sorted {incremental.row_order} are out of range")
+                    break
+        finally:
+            gen.close()
+
     @property
     def allow_external_schedulers(self) -> bool:
         """Allows the Incremental instance to get its initial and end values from external schedulers like Airflow"""
@@ -1,5 +1,5 @@
 from datetime import datetime, date  # noqa: I251
-from typing import Any, Optional, Tuple, List
+from typing import Any, Optional, Set, Tuple, List
 
 try:
     import pandas as pd
@@ -12,7 +12,7 @@ except ModuleNotFoundError:
     np = None
 
 from dlt.common.exceptions import MissingDependencyException
-from dlt.common.utils import digest128
+from dlt.common.utils import digest128b
 from dlt.common.json import json
 from dlt.common import pendulum
 from dlt.common.typing import TDataItem, TDataItems
@@ -47,6 +47,11 @@ class IncrementalTransform:
         self.last_value_func = last_value_func
         self.primary_key = primary_key
 
+        # set index over unique hashes list kept in state
+        self._unique_hashes_index: Set[str] = None
+        self._indexed_hashes: List[str] = None
+        self._indexed_count = 0
+
         # compile jsonpath
         self._compiled_cursor_path = compile_path(cursor_path)
         # for simple column name we'll fallback to search in dict
@@ -60,6 +65,22 @@ class IncrementalTransform:
     ) -> Tuple[bool, bool, bool]:
         ...
 
+    def unique_hashes_index(self) -> Set[str]:
+        """Returns a set of unique hashes in incremental state. The set is rebuilt if the list in the state was replaced or
+           modified elsewhere, use `add_unique_hash` to add hashes to both."""
+        hashes = self.incremental_state["unique_hashes"]
+        if hashes is not self._indexed_hashes or len(hashes) != self._indexed_count:
+            self._unique_hashes_index = set(hashes)
+            self._indexed_hashes = hashes
+            self._indexed_count = len(hashes)
+        return self._unique_hashes_index
+
+    def add_unique_hash(self, unique_value: str) -> None:
+        """Adds `unique_value` to the unique hashes in the state and to the index"""
+        self.unique_hashes_index().add(unique_value)
+        self.incremental_state["unique_hashes"].append(unique_value)
+        self._indexed_count += 1
+
 
 class JsonIncremental(IncrementalTransform):
 
@@ -70,10 +91,11 @@ class JsonIncremental(IncrementalTransform):
         resource_name: str
     ) -> str:
         try:
+            # hash encoded bytes directly, the digest is the same as of the decoded json string
             if primary_key:
-                return digest128(json.dumps(resolve_column_value(primary_key, row), sort_keys=True))
+                return digest128b(json.dumpb(resolve_column_value(primary_key, row), sort_keys=True))
             elif primary_key is None:
-                return digest128(json.dumps(row, sort_keys=True))
+                return digest128b(json.dumpb(row, sort_keys=True))
             else:
                 return None
         except KeyError as k_err:
@@ -137,10 +159,10 @@ class JsonIncremental(IncrementalTransform):
                 unique_value = self.unique_value(row, self.primary_key, self.resource_name)
                 # if unique value exists then use it to deduplicate
                 if unique_value:
-                    if unique_value in self.incremental_state['unique_hashes']:
+                    if unique_value in self.unique_hashes_index():
                         return None, start_out_of_range, end_out_of_range
                     # add new hash only if the record row id is same as current last value
-                    self.incremental_state['unique_hashes'].append(unique_value)
+                    self.add_unique_hash(unique_value)
                 return row, start_out_of_range, end_out_of_range
             # skip the record that is not a last_value or new_value: that record was already processed
             check_values = (row_value,) + ((self.start_value,) if self.start_value is not None else ())
@@ -163,19 +185,16 @@ class JsonIncremental(IncrementalTransform):
 class ArrowIncremental(IncrementalTransform):
     _dlt_index = "_dlt_index"
 
-    def unique_values(
-        self,
-        item: "TAnyArrowItem",
-        unique_columns: List[str],
-        resource_name: str
-    ) -> List[Tuple[int, str]]:
+    def compute_unique_values(self, item: "TAnyArrowItem", unique_columns: List[str]) -> List[str]:
+        """Computes unique hashes of `unique_columns` for each row in `item`"""
         if not unique_columns:
             return []
-        item = item
-        indices = item[self._dlt_index].to_pylist()
-        rows = item.select(unique_columns).to_pylist()
+        # encode rows column by column, the digest is the same as of `json.dumps(row, sort_keys=True)`
+        keys = sorted(unique_columns)
+        encoded_keys = [json.dumpb(key) + b":" for key in keys]
+        columns = [[json.dumpb(v, sort_keys=True) for v in item[key].to_pylist()] for key in keys]
         return [
-            (index, digest128(json.dumps(row, sort_keys=True))) for index, row in zip(indices, rows)
+            digest128b(b"{" + b",".join([k + v for k, v in zip(encoded_keys, values)]) + b"}") for values in zip(*columns)
         ]
 
     def _deduplicate(self, tbl: "pa.Table", unique_columns: Optional[List[str]], aggregate: str, cursor_path: str) -> "pa.Table":
@@ -286,28 +305,31 @@ class ArrowIncremental(IncrementalTransform):
             tbl = self._deduplicate(tbl, unique_columns, aggregate, cursor_path)
             # Remove already processed rows where the cursor is equal to the last value
             eq_rows = tbl.filter(pa.compute.equal(tbl[cursor_path], last_value))
-            # compute index, unique hash mapping
-            unique_values = self.unique_values(eq_rows, unique_columns, self.resource_name)
-            unique_values = [(i, uq_val) for i, uq_val in unique_values if uq_val in self.incremental_state['unique_hashes']]
-            remove_idx = pa.array(i for i, _ in unique_values)
-            # Filter the table
-            tbl = tbl.filter(pa.compute.invert(pa.compute.is_in(tbl[self._dlt_index], remove_idx)))
+            # compute unique hashes and find the ones already in state
+            unique_values = pa.array(self.compute_unique_values(eq_rows, unique_columns), type=pa.string())
+            is_processed = pa.compute.is_in(
+                unique_values, value_set=pa.array(self.incremental_state['unique_hashes'], type=pa.string())
+            )
+            if len(unique_values) > 0:
+                # Filter the table
+                remove_idx = eq_rows[self._dlt_index].filter(is_processed)
+                tbl = tbl.filter(pa.compute.invert(pa.compute.is_in(tbl[self._dlt_index], value_set=remove_idx)))
 
             if new_value_compare(row_value, last_value).as_py() and row_value != last_value:  # Last value has changed
                 self.incremental_state['last_value'] = row_value
                 # Compute unique hashes for all rows equal to row value
-                self.incremental_state['unique_hashes'] = [uq_val for _, uq_val in self.unique_values(
-                    tbl.filter(pa.compute.equal(tbl[cursor_path], row_value)), unique_columns, self.resource_name
-                )]
+                self.incremental_state['unique_hashes'] = self.compute_unique_values(
+                    tbl.filter(pa.compute.equal(tbl[cursor_path], row_value)), unique_columns
+                )
             else:
-                # last value is unchanged, add the hashes
-                self.incremental_state['unique_hashes'] = list(set(self.incremental_state['unique_hashes'] + [uq_val for _, uq_val in unique_values]))
+                # last value is unchanged, add the hashes of new rows
+                self.incremental_state['unique_hashes'].extend(unique_values.filter(pa.compute.invert(is_processed)).to_pylist())
         else:
             tbl = self._deduplicate(tbl, unique_columns, aggregate, cursor_path)
             self.incremental_state['last_value'] = row_value
-            self.incremental_state['unique_hashes'] = [uq_val for _, uq_val in self.unique_values(
-                tbl.filter(pa.compute.equal(tbl[cursor_path], row_value)), unique_columns, self.resource_name
-            )]
+            self.incremental_state['unique_hashes'] = self.compute_unique_values(
+                tbl.filter(pa.compute.equal(tbl[cursor_path], row_value)), unique_columns
+            )
 
         if len(tbl) == 0:
             return None, start_out_of_range, end_out_of_range
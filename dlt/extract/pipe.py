@@ -3,12 +3,13 @@ import types
 import asyncio
 import makefun
 from asyncio import Future
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 from copy import copy
-from threading import Thread
-from typing import Any, Dict, Optional, Sequence, Union, Callable, Iterable, Iterator, List, NamedTuple, Awaitable, Tuple, Type, TYPE_CHECKING, Literal
+from threading import Condition, Thread
+from typing import Any, AsyncIterable, AsyncIterator, ClassVar, Deque, Dict, Optional, Sequence, Union, Callable, Iterable, Iterator, List, NamedTuple, Awaitable, Tuple, Type, TYPE_CHECKING, Literal
 
-from dlt.common import sleep
+from dlt.common.runtime import signals
 from dlt.common.configuration import configspec
 from dlt.common.configuration.inject import with_config
 from dlt.common.configuration.specs import BaseConfiguration, ContainerInjectableContext
@@ -21,8 +22,8 @@ from dlt.common.utils import get_callable_name
 from dlt.extract.exceptions import (CreatePipeException, DltSourceException, ExtractorException, InvalidStepFunctionArguments,
                                     InvalidResourceDataTypeFunctionNotAGenerator, InvalidTransformerGeneratorFunction, ParametrizedResourceUnbound,
                                     PipeException, PipeGenInvalid, PipeItemProcessingError, PipeNotBoundToData, ResourceExtractionError)
-from dlt.extract.typing import DataItemWithMeta, ItemTransform, SupportsPipe, TPipedDataItems
-from dlt.extract.utils import check_compat_transformer, simulate_func_call, wrap_compat_transformer, wrap_resource_gen
+from dlt.extract.typing import NO_ITEM_READY, DataItemWithMeta, ItemTransform, SupportsPipe, TPipedDataItems
+from dlt.extract.utils import check_compat_transformer, simulate_func_call, wrap_async_iterator, wrap_compat_transformer, wrap_resource_gen
 
 if TYPE_CHECKING:
     TItemFuture = Future[Union[TDataItems, DataItemWithMeta]]
@@ -64,6 +65,8 @@ from dlt.common.typing import TDataItem
 TPipeStep = Union[
     Iterable[TPipedDataItems],
     Iterator[TPipedDataItems],
+    AsyncIterable[TDataItems],
+    AsyncIterator[TDataItems],
     # Callable with meta
     Callable[[TDataItems, Optional[Any]], TPipedDataItems],
     Callable[[TDataItems, Optional[Any]], Iterator[TPipedDataItems]],
@@ -259,6 +262,9 @@ class Pipe(SupportsPipe):
             # otherwise it must be an iterator
             if isinstance(gen, Iterable):
                 self.replace_gen(iter(gen))
+            # async iterators are evaluated on the event loop
+            if isinstance(self.gen, (AsyncIterator, AsyncIterable)):
+                self.replace_gen(wrap_async_iterator(self.gen))
         else:
             # verify if transformer can be called
             self._ensure_transform_step(self._gen_idx, gen)
@@ -307,9 +313,9 @@ class Pipe(SupportsPipe):
         return _data
 
     def _verify_head_step(self, step: TPipeStep) -> None:
-        # first element must be Iterable, Iterator or Callable in resource pipe
-        if not isinstance(step, (Iterable, Iterator)) and not callable(step):
-            raise CreatePipeException(self.name, "A head of a resource pipe must be Iterable, Iterator or a Callable")
+        # first element must be Iterable, Iterator, their async counterparts or Callable in resource pipe
+        if not isinstance(step, (Iterable, Iterator, AsyncIterable, AsyncIterator)) and not callable(step):
+            raise CreatePipeException(self.name, "A head of a resource pipe must be Iterable, Iterator, AsyncIterable, AsyncIterator or a Callable")
 
     def _wrap_transform_step_meta(self, step_no: int, step: TPipeStep) -> TPipeStep:
         # step must be a callable: a transformer or a transformation
@@ -406,6 +412,9 @@ class Pipe(SupportsPipe):
 
 class PipeIterator(Iterator[PipeItem]):
 
+    FUTURES_MAX_WAIT: ClassVar[float] = 1.0
+    """Max time to block waiting for futures before checking for signals"""
+
     @configspec
     class PipeIteratorConfiguration(BaseConfiguration):
         max_parallel_items: int = 20
@@ -427,7 +436,10 @@ class PipeIterator(Iterator[PipeItem]):
         self._async_pool_thread: Thread = None
         self._thread_pool: ThreadPoolExecutor = None
         self._sources: List[SourcePipeItem] = []
-        self._futures: List[FuturePipeItem] = []
+        self._futures: Dict[TItemFuture, FuturePipeItem] = {}
+        # futures are appended by done callbacks, in order of completion
+        self._done_futures: Deque[TItemFuture] = deque()
+        self._futures_cond = Condition()
         self._next_item_mode = next_item_mode
 
     @classmethod
@@ -516,11 +528,15 @@ class PipeIterator(Iterator[PipeItem]):
                     if len(self._futures) == 0 and len(self._sources) == 0:
                         # no more elements in futures or sources
                         raise StopIteration()
-                    else:
-                        sleep(self.futures_poll_interval)
+                    elif len(self._futures) > 0:
+                        # wake up when any future is done, sources may have no item ready so check them periodically
+                        self._wait_for_futures(self.futures_poll_interval if len(self._sources) > 0 else None)
                     continue
 
             item = pipe_item.item
+            # async iterators yield awaitables of their items
+            if isinstance(item, (AsyncIterator, AsyncIterable)):
+                item = wrap_async_iterator(item)
             # if item is iterator, then add it as a new source
             if isinstance(item, Iterator):
                 # print(f"adding iterable {item}")
@@ -530,20 +546,22 @@ class PipeIterator(Iterator[PipeItem]):
 
             if isinstance(item, Awaitable) or callable(item):
                 # do we have a free slot or one of the slots is done?
-                if len(self._futures) < self.max_parallel_items or self._next_future() >= 0:
+                if len(self._futures) < self.max_parallel_items or self._next_future():
                     # check if Awaitable first - awaitable can also be a callable
                     if isinstance(item, Awaitable):
                         future = asyncio.run_coroutine_threadsafe(item, self._ensure_async_pool())
                     elif callable(item):
                         future = self._ensure_thread_pool().submit(item)
                     # print(future)
-                    self._futures.append(FuturePipeItem(future, pipe_item.step, pipe_item.pipe, pipe_item.meta))  # type: ignore
+                    self._futures[future] = FuturePipeItem(future, pipe_item.step, pipe_item.pipe, pipe_item.meta)  # type: ignore
+                    # register callback after future is stored, callback is called immediately if future is already done
+                    future.add_done_callback(self._on_future_done)
                     # pipe item consumed for now, request a new one
                     pipe_item = None
                     continue
                 else:
                     # print("maximum futures exceeded, waiting")
-                    sleep(self.futures_poll_interval)
+                    self._wait_for_futures(None)
                 # try same item later
                 continue
 
@@ -586,10 +604,12 @@ class PipeIterator(Iterator[PipeItem]):
             loop.stop()
 
         # stop all futures
-        for f, _, _, _ in self._futures:
+        for f in list(self._futures):
             if not f.done():
                 f.cancel()
         self._futures.clear()
+        with self._futures_cond:
+            self._done_futures.clear()
 
         # close all generators
         for gen, _, _, _ in self._sources:
@@ -643,8 +663,23 @@ class PipeIterator(Iterator[PipeItem]):
     def __exit__(self, exc_type: Type[BaseException], exc_val: BaseException, exc_tb: types.TracebackType) -> None:
         self.close()
 
-    def _next_future(self) -> int:
-        return next((i for i, val in enumerate(self._futures) if val.item.done()), -1)
+    def _on_future_done(self, future: TItemFuture) -> None:
+        # called from the thread that completed the future
+        with self._futures_cond:
+            self._done_futures.append(future)
+            self._futures_cond.notify()
+
+    def _wait_for_futures(self, timeout: Optional[float]) -> None:
+        """Blocks until any future is done or `timeout` passes. Without `timeout` wakes up periodically to check for signals"""
+        signals.raise_if_signalled()
+        with self._futures_cond:
+            if len(self._done_futures) == 0:
+                self._futures_cond.wait(timeout or self.FUTURES_MAX_WAIT)
+        signals.raise_if_signalled()
+
+    def _next_future(self) -> bool:
+        """Checks if any future is done"""
+        return len(self._done_futures) > 0
 
     def _resolve_futures(self) -> ResolvablePipeItem:
         # no futures at all
@@ -652,12 +687,17 @@ class PipeIterator(Iterator[PipeItem]):
             return None
 
         # anything done?
-        idx = self._next_future()
-        if idx == -1:
-            # nothing done
-            return None
-
-        future, step, pipe, meta = self._futures.pop(idx)
+        with self._futures_cond:
+            if len(self._done_futures) == 0:
+                # nothing done
+                return None
+            done_future = self._done_futures.popleft()
+
+        future_item = self._futures.pop(done_future, None)
+        if future_item is None:
+            # future was dropped when closing
+            return self._resolve_futures()
+        future, step, pipe, meta = future_item
 
         if future.cancelled():
             # get next future
@@ -670,6 +710,9 @@ class PipeIterator(Iterator[PipeItem]):
             raise ResourceExtractionError(pipe.name, future, str(ex), "future") from ex
 
         item = future.result()
+        if item is None:
+            # item was filtered out or async iterator got exhausted, get next future
+            return self._resolve_futures()
         if isinstance(item, DataItemWithMeta):
             return ResolvablePipeItem(item.data, step, pipe, item.meta)
         else:
@@ -685,15 +728,22 @@ class PipeIterator(Iterator[PipeItem]):
         # no more sources to iterate
         if len(self._sources) == 0:
             return None
+        source_idx = len(self._sources) - 1
         try:
             # get items from last added iterator, this makes the overall Pipe as close to FIFO as possible
-            gen, step, pipe, meta = self._sources[-1]
-            # print(f"got {pipe.name}")
-            # register current pipe name during the execution of gen
-            set_current_pipe_name(pipe.name)
             item = None
-            while item is None:
+            while item is None and source_idx >= 0:
+                gen, step, pipe, meta = self._sources[source_idx]
+                # print(f"got {pipe.name}")
+                # register current pipe name during the execution of gen
+                set_current_pipe_name(pipe.name)
                 item = next(gen)
+                if item is NO_ITEM_READY:
+                    # item of this source is evaluated in a pool, try older sources
+                    item = None
+                    source_idx -= 1
+            if item is None:
+                return None
             # full pipe item may be returned, this is used by ForkPipe step
             # to redirect execution of an item to another pipe
             if isinstance(item, ResolvablePipeItem):
@@ -706,7 +756,7 @@ class PipeIterator(Iterator[PipeItem]):
                     return ResolvablePipeItem(item, step, pipe, meta)
         except StopIteration:
             # remove empty iterator and try another source
-            self._sources.pop()
+            self._sources.pop(source_idx)
             return self._get_source_item()
         except (PipelineException, ExtractorException, DltSourceException, PipeException):
             raise
@@ -725,11 +775,18 @@ class PipeIterator(Iterator[PipeItem]):
             # print(f"got {pipe.name}")
             # register current pipe name during the execution of gen
             item = None
-            while item is None:
+            # try every source once, sources may have no item ready now
+            for _ in range(sources_count):
                 self._round_robin_index = (self._round_robin_index + 1) % sources_count
                 gen, step, pipe, meta = self._sources[self._round_robin_index]
                 set_current_pipe_name(pipe.name)
                 item = next(gen)
+                if item is NO_ITEM_READY:
+                    item = None
+                elif item is not None:
+                    break
+            if item is None:
+                return None
             # full pipe item may be returned, this is used by ForkPipe step
             # to redirect execution of an item to another pipe
             if isinstance(item, ResolvablePipeItem):
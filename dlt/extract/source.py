@@ -17,15 +17,16 @@ from dlt.common.configuration.container import Container
 from dlt.common.pipeline import PipelineContext, StateInjectableContext, SupportsPipelineRun, resource_state, source_state, pipeline_state
 from dlt.common.utils import graph_find_scc_nodes, flatten_list_or_items, get_callable_name, graph_edges_to_nodes, multi_context_manager, uniq_id
 
-from dlt.extract.typing import (DataItemWithMeta, ItemTransformFunc, ItemTransformFunctionWithMeta, TDecompositionStrategy, TableNameMeta,
+from dlt.extract.typing import (NO_ITEM_READY, DataItemWithMeta, ItemTransformFunc, ItemTransformFunctionWithMeta, TDecompositionStrategy, TableNameMeta,
                                 FilterItem, MapItem, YieldMapItem, ValidateItem)
 from dlt.extract.pipe import Pipe, ManagedPipeIterator, TPipeStep
 from dlt.extract.schema import DltResourceSchema, TTableSchemaTemplate
 from dlt.extract.incremental import Incremental, IncrementalResourceWrapper
 from dlt.extract.exceptions import (
     InvalidTransformerDataTypeGeneratorFunctionRequired, InvalidParentResourceDataType, InvalidParentResourceIsAFunction, InvalidResourceDataType, InvalidResourceDataTypeIsNone, InvalidTransformerGeneratorFunction,
-    DataItemRequiredForDynamicTableHints, InvalidResourceDataTypeAsync, InvalidResourceDataTypeBasic,
+    DataItemRequiredForDynamicTableHints, InvalidParallelResourceDataType, InvalidResourceDataTypeBasic,
     InvalidResourceDataTypeMultiplePipes, ParametrizedResourceUnbound, ResourceNameMissing, ResourceNotATransformer, ResourcesNotFoundError, DeletingResourcesNotSupported)
+from dlt.extract.utils import wrap_parallel_iterator
 from dlt.extract.wrappers import wrap_additional_type
 
 
@@ -85,7 +86,7 @@ class DltResource(Iterable[TDataItem], DltResourceSchema):
             name = name or get_callable_name(data)
 
         # if generator, take name from it
-        if inspect.isgenerator(data):
+        if inspect.isgenerator(data) or inspect.isasyncgen(data):
             name = name or get_callable_name(data)  # type: ignore
 
         # name is mandatory
@@ -96,8 +97,6 @@ class DltResource(Iterable[TDataItem], DltResourceSchema):
         data = wrap_additional_type(data)
 
         # several iterable types are not allowed and must be excluded right away
-        if isinstance(data, (AsyncIterator, AsyncIterable)):
-            raise InvalidResourceDataTypeAsync(name, data, type(data))
         if isinstance(data, (str, dict)):
             raise InvalidResourceDataTypeBasic(name, data, type(data))
 
@@ -107,8 +106,8 @@ class DltResource(Iterable[TDataItem], DltResourceSchema):
             DltResource._ensure_valid_transformer_resource(name, data)
             parent_pipe = DltResource._get_parent_pipe(name, data_from)
 
-        # create resource from iterator, iterable or generator function
-        if isinstance(data, (Iterable, Iterator)) or callable(data):
+        # create resource from iterator, iterable, their async counterparts or generator function
+        if isinstance(data, (Iterable, Iterator, AsyncIterable, AsyncIterator)) or callable(data):
             pipe = Pipe.from_data(name, data, parent=parent_pipe)
             return cls(pipe, table_schema_template, selected, incremental=incremental, section=section, args_bound=not callable(data))
         else:
@@ -267,6 +266,9 @@ class DltResource(Iterable[TDataItem], DltResourceSchema):
             try:
                 for i in gen:  # type: ignore # TODO: help me fix this later
                     yield i
+                    # sources evaluated in a pool may have no item ready
+                    if i is NO_ITEM_READY:
+                        continue
                     count += 1
                     if count == max_items:
                         return
@@ -279,6 +281,30 @@ class DltResource(Iterable[TDataItem], DltResourceSchema):
             self._pipe.replace_gen(_gen_wrap(self._pipe.gen))
         return self
 
+    def parallelize(self) -> "DltResource":
+        """Evaluates the resource generator in the extract thread pool so many resources are extracted concurrently
+
+        This mutates the encapsulated generator so each next item is requested in a thread pool worker. Only one item of a given resource is
+        requested at a time so the items keep their order. Other resources are advanced while the item is requested.
+        Transformers and resources created from lists or other iterables are not supported.
+
+        Returns:
+            "DltResource": returns self
+        """
+        if self.is_transformer:
+            raise InvalidParallelResourceDataType(self.name, self._pipe.gen, type(self._pipe.gen))
+        gen = self._pipe.gen
+        if inspect.isgenerator(gen):
+            self._pipe.replace_gen(wrap_parallel_iterator(gen))
+        elif callable(gen) and inspect.isgeneratorfunction(inspect.unwrap(gen)):
+            def _parallel_gen(*args: Any, **kwargs: Any) -> Any:
+                return wrap_parallel_iterator(gen(*args, **kwargs))
+            # preserve the signature and the wrapped function so the resource may be still bound
+            self._pipe.replace_gen(makefun.wraps(gen)(_parallel_gen))
+        else:
+            raise InvalidParallelResourceDataType(self.name, gen, type(gen))
+        return self
+
     def add_step(self, item_transform: ItemTransformFunctionWithMeta[TDataItems], insert_at: int = None) -> "DltResource":  # noqa: A003
         if insert_at is None:
             self._pipe.append_step(item_transform)
@@ -35,6 +35,17 @@ class TableNameMeta:
         self.table_name = table_name
 
 
+class NoItemReady:
+    """Yielded by sources that have no item ready now ie. because their next item is evaluated in a pool"""
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "NO_ITEM_READY"
+
+
+NO_ITEM_READY = NoItemReady()
+
+
 class SupportsPipe(Protocol):
     """A protocol with the core Pipe properties and operations"""
     name: str
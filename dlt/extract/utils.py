@@ -1,16 +1,20 @@
+import asyncio
+import contextlib
 import inspect
 import makefun
-from typing import Optional, Tuple, Union, List, Any, Sequence, cast
+import threading
+from typing import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterator, Optional, Tuple, Union, List, Any, Sequence, cast
 from collections.abc import Mapping as C_Mapping
 
-from dlt.common.exceptions import MissingDependencyException
+from dlt.common.exceptions import MissingDependencyException, ResourceNameNotAvailable
 from dlt.common.pipeline import reset_resource_state
+from dlt.common.source import get_current_pipe_name, set_current_pipe_name, unset_current_pipe_name
 from dlt.common.schema.typing import TColumnNames, TAnySchemaColumns, TTableSchemaColumns
 from dlt.common.typing import AnyFun, DictStrAny, TDataItem, TDataItems
 from dlt.common.utils import get_callable_name
 from dlt.extract.exceptions import InvalidResourceDataTypeFunctionNotAGenerator, InvalidStepFunctionArguments
 
-from dlt.extract.typing import TTableHintTemplate, TDataItem, TFunHintTemplate, SupportsPipe
+from dlt.extract.typing import NO_ITEM_READY, NoItemReady, TTableHintTemplate, TDataItem, TFunHintTemplate, SupportsPipe
 
 try:
     from dlt.common.libs import pydantic
@@ -123,7 +127,8 @@ def wrap_compat_transformer(name: str, f: AnyFun, sig: inspect.Signature, *args:
 
 def wrap_resource_gen(name: str, f: AnyFun, sig: inspect.Signature, *args: Any, **kwargs: Any) -> AnyFun:
     """Wraps a generator or generator function so it is evaluated on extraction"""
-    if inspect.isgeneratorfunction(inspect.unwrap(f)) or inspect.isgenerator(f):
+    unwrapped_f = inspect.unwrap(f)
+    if inspect.isgeneratorfunction(unwrapped_f) or inspect.isgenerator(f) or inspect.isasyncgenfunction(unwrapped_f):
         # always wrap generators and generator functions. evaluate only at runtime!
 
         def _partial() -> Any:
@@ -134,3 +139,114 @@ def wrap_resource_gen(name: str, f: AnyFun, sig: inspect.Signature, *args: Any,
         return makefun.wraps(f, new_sig=inspect.signature(_partial))(_partial)  # type: ignore
     else:
         raise InvalidResourceDataTypeFunctionNotAGenerator(name, f, type(f))
+
+
+def wrap_async_iterator(gen: Union[AsyncIterator[TDataItems], AsyncIterable[TDataItems]]) -> Iterator[Union[Awaitable[TDataItems], NoItemReady]]:
+    """Wraps async iterator `gen` into a generator of awaitables, each returning next item from `gen`.
+
+    Awaitables are evaluated on the pipe event loop so many async generators progress concurrently. Only one awaitable of the same `gen`
+    is evaluated at a time: while it is pending the wrapper yields `NO_ITEM_READY` so the pipe iterator may advance other sources and
+    the items keep their order. When the wrapper is closed, `gen` is closed on the event loop that evaluated it.
+    """
+    if not isinstance(gen, AsyncIterator):
+        gen = gen.__aiter__()
+    exhausted = False
+    busy = False
+    # event loop that evaluates the awaitables, used to close `gen`
+    loop: asyncio.AbstractEventLoop = None
+    # lock is created lazily so it binds to the event loop that evaluates the awaitables
+    lock: asyncio.Lock = None
+
+    async def _anext() -> TDataItems:
+        nonlocal exhausted, busy, loop, lock
+        if lock is None:
+            loop = asyncio.get_running_loop()
+            lock = asyncio.Lock()
+        try:
+            async with lock:
+                return await gen.__anext__()
+        except StopAsyncIteration:
+            exhausted = True
+            return None
+        finally:
+            busy = False
+
+    async def _aclose() -> None:
+        # wait for pending item to be evaluated or cancelled
+        async with lock:
+            await gen.aclose()  # type: ignore[attr-defined]
+
+    try:
+        while not exhausted:
+            while busy:
+                yield NO_ITEM_READY
+            # gen may get exhausted while busy
+            if exhausted:
+                break
+            busy = True
+            yield _anext()
+    except GeneratorExit:
+        # pipe iterator got closed, close async generator if it was started
+        if loop is not None and loop.is_running() and hasattr(gen, "aclose"):
+            with contextlib.suppress(Exception):
+                asyncio.run_coroutine_threadsafe(_aclose(), loop).result()
+
+
+def wrap_parallel_iterator(gen: Iterator[TDataItems]) -> Iterator[Union[Callable[[], TDataItems], NoItemReady]]:
+    """Wraps iterator `gen` into a generator of callables, each returning next item from `gen`.
+
+    Callables are evaluated in the pipe thread pool so many iterators progress concurrently. Only one callable of the same `gen` is
+    evaluated at a time: while it is pending the wrapper yields `NO_ITEM_READY` so the pipe iterator may advance other sources. Callables are
+    evaluated with the name of the pipe that requested them so resource state is available in `gen`.
+    """
+    exhausted = False
+    closed = False
+    busy = False
+    pipe_name: str = None
+    # synchronizes closing of `gen` between the pipe iterator and the worker thread
+    lock = threading.Lock()
+
+    def _close() -> None:
+        if inspect.isgenerator(gen):
+            gen.close()
+
+    def _next() -> TDataItems:
+        nonlocal exhausted, busy
+        if pipe_name:
+            set_current_pipe_name(pipe_name)
+        try:
+            return next(gen)
+        except StopIteration:
+            exhausted = True
+            return None
+        finally:
+            if pipe_name:
+                unset_current_pipe_name()
+            with lock:
+                busy = False
+                close_gen = closed
+            # wrapper was closed while evaluating, close the wrapped generator here
+            if close_gen:
+                _close()
+
+    try:
+        while not exhausted:
+            while busy:
+                yield NO_ITEM_READY
+            # gen may get exhausted while busy
+            if exhausted:
+                break
+            busy = True
+            # pipe iterator sets the pipe name when requesting next item from a source
+            try:
+                pipe_name = get_current_pipe_name()
+            except ResourceNameNotAvailable:
+                pipe_name = None
+            yield _next
+    except GeneratorExit:
+        with lock:
+            closed = True
+            close_gen = not busy
+        # close the wrapped generator unless it is still evaluated in a thread
+        if close_gen:
+            _close()
@@ -2,11 +2,13 @@ import contextlib
 from copy import copy
 from functools import reduce
 import datetime  # noqa: 251
+import threading
 from typing import Dict, List, Optional, Tuple, Set, Iterator, Iterable, Callable
-from concurrent.futures import Executor
+from concurrent.futures import Executor, Future, wait, FIRST_COMPLETED
 import os
 
 from dlt.common import sleep, logger
+from dlt.common.runtime import signals
 from dlt.common.configuration import with_config, known_sections
 from dlt.common.configuration.accessors import config
 from dlt.common.pipeline import LoadInfo, SupportsPipeline
@@ -31,6 +33,11 @@ from dlt.load.exceptions import LoadClientJobFailed, LoadClientJobRetry, LoadCli
 class Load(Runnable[Executor]):
     pool: Executor
 
+    MIN_POLL_INTERVAL: float = 0.1
+    """Initial interval to poll running jobs when no job changed state"""
+    MAX_POLL_INTERVAL: float = 1.0
+    """Poll interval is doubled until it reaches the maximum"""
+
     @with_config(spec=LoaderConfiguration, sections=(known_sections.LOAD,))
     def __init__(
         self,
@@ -53,6 +60,9 @@ class Load(Runnable[Executor]):
         self.load_storage: LoadStorage = self.create_storage(is_storage_owner)
         self._processed_load_ids: Dict[str, str] = {}
         """Load ids to dataset name"""
+        self._pooled_clients: Dict[Tuple[int, bool], JobClientBase] = {}
+        """Open clients per (thread id, is staging destination) reused by jobs started in a package"""
+        self._pooled_clients_lock = threading.Lock()
 
 
     def create_storage(self, is_storage_owner: bool) -> LoadStorage:
@@ -75,6 +85,41 @@ class Load(Runnable[Executor]):
     def get_staging_destination_client(self, schema: Schema) -> JobClientBase:
         return self.staging_destination.client(schema, self.initial_staging_client_config)
 
+    def get_pooled_client(self, schema: Schema, is_staging_destination: bool = False) -> JobClientBase:
+        """Gets open destination or staging destination client for `schema` that is reused by all jobs started in the current thread.
+        Clients are closed with `close_pooled_clients` or when job fails to start. Clients that are not open anymore are replaced.
+        """
+        key = (threading.get_ident(), is_staging_destination)
+        client = self._pooled_clients.get(key)
+        if client is not None and (client.schema is not schema or not client.is_open()):
+            self.release_pooled_client(is_staging_destination)
+            client = None
+        if client is None:
+            client = self.get_staging_destination_client(schema) if is_staging_destination else self.get_destination_client(schema)
+            client.__enter__()
+            with self._pooled_clients_lock:
+                self._pooled_clients[key] = client
+        return client
+
+    def release_pooled_client(self, is_staging_destination: bool = False) -> None:
+        """Closes the client pooled for the current thread ie. when connection may be broken"""
+        with self._pooled_clients_lock:
+            client = self._pooled_clients.pop((threading.get_ident(), is_staging_destination), None)
+        if client is not None:
+            with contextlib.suppress(Exception):
+                client.__exit__(None, None, None)
+
+    def close_pooled_clients(self) -> None:
+        """Closes all pooled clients, must be called when no jobs are being started"""
+        with self._pooled_clients_lock:
+            clients = list(self._pooled_clients.values())
+            self._pooled_clients.clear()
+        for client in clients:
+            try:
+                client.__exit__(None, None, None)
+            except Exception:
+                logger.exception(f"Could not close pooled client for {client.config.destination_name}")
+
     def is_staging_destination_job(self, file_path: str) -> bool:
         return self.staging_destination is not None and os.path.splitext(file_path)[1][1:] in self.staging_destination.capabilities().supported_loader_file_formats
 
@@ -91,56 +136,59 @@ class Load(Runnable[Executor]):
     @workermethod
     def w_spool_job(self: "Load", file_path: str, load_id: str, schema: Schema) -> Optional[LoadJob]:
         job: LoadJob = None
+        is_staging_destination_job = self.is_staging_destination_job(file_path)
         try:
-            is_staging_destination_job = self.is_staging_destination_job(file_path)
-            job_client = self.get_destination_client(schema)
-
             # if we have a staging destination and the file is not a reference, send to staging
-            with (self.get_staging_destination_client(schema) if is_staging_destination_job else job_client) as client:
-                job_info = self.load_storage.parse_job_file_name(file_path)
-                if job_info.file_format not in self.load_storage.supported_file_formats:
-                    raise LoadClientUnsupportedFileFormats(job_info.file_format, self.capabilities.supported_loader_file_formats, file_path)
-                logger.info(f"Will load file {file_path} with table name {job_info.table_name}")
-                table = client.get_load_table(job_info.table_name)
-                if table["write_disposition"] not in ["append", "replace", "merge"]:
-                    raise LoadClientUnsupportedWriteDisposition(job_info.table_name, table["write_disposition"], file_path)
-
-                if is_staging_destination_job:
-                    use_staging_dataset = isinstance(job_client, SupportsStagingDestination) and job_client.should_load_data_to_staging_dataset_on_staging_destination(table)
-                else:
-                    use_staging_dataset = isinstance(job_client, WithStagingDataset) and job_client.should_load_data_to_staging_dataset(table)
+            client = self.get_pooled_client(schema, is_staging_destination_job)
+            job_client = self.get_destination_client(schema) if is_staging_destination_job else client
+            job_info = self.load_storage.parse_job_file_name(file_path)
+            if job_info.file_format not in self.load_storage.supported_file_formats:
+                raise LoadClientUnsupportedFileFormats(job_info.file_format, self.capabilities.supported_loader_file_formats, file_path)
+            logger.info(f"Will load file {file_path} with table name {job_info.table_name}")
+            table = client.get_load_table(job_info.table_name)
+            if table["write_disposition"] not in ["append", "replace", "merge"]:
+                raise LoadClientUnsupportedWriteDisposition(job_info.table_name, table["write_disposition"], file_path)
+
+            if is_staging_destination_job:
+                use_staging_dataset = isinstance(job_client, SupportsStagingDestination) and job_client.should_load_data_to_staging_dataset_on_staging_destination(table)
+            else:
+                use_staging_dataset = isinstance(job_client, WithStagingDataset) and job_client.should_load_data_to_staging_dataset(table)
 
-                with self.maybe_with_staging_dataset(client, use_staging_dataset):
-                    job = client.start_file_load(table, self.load_storage.storage.make_full_path(file_path), load_id)
+            with self.maybe_with_staging_dataset(client, use_staging_dataset):
+                job = client.start_file_load(table, self.load_storage.storage.make_full_path(file_path), load_id)
         except (DestinationTerminalException, TerminalValueError):
             # if job irreversibly cannot be started, mark it as failed
             logger.exception(f"Terminal problem when adding job {file_path}")
             job = EmptyLoadJob.from_file_path(file_path, "failed", pretty_format_exception())
+            # connection may be in undefined state
+            self.release_pooled_client(is_staging_destination_job)
         except (DestinationTransientException, Exception):
             # return no job so file stays in new jobs (root) folder
             logger.exception(f"Temporary problem when adding job {file_path}")
             job = EmptyLoadJob.from_file_path(file_path, "retry", pretty_format_exception())
+            self.release_pooled_client(is_staging_destination_job)
         self.load_storage.start_job(load_id, job.file_name())
         return job
 
-    def spool_new_jobs(self, load_id: str, schema: Schema) -> Tuple[int, List[LoadJob]]:
-        # TODO: validate file type, combine files, finalize etc., this is client specific, jsonl for single table
-        # can just be combined, insert_values must be finalized and then combined
-        # use thread based pool as jobs processing is mostly I/O and we do not want to pickle jobs
-        # TODO: combine files by providing a list of files pertaining to same table into job, so job must be
-        # extended to accept a list
-        load_files = self.load_storage.list_new_jobs(load_id)[:self.config.workers]
-        file_count = len(load_files)
-        if file_count == 0:
-            logger.info(f"No new jobs found in {load_id}")
-            return 0, []
-        logger.info(f"Will load {file_count}, creating jobs")
-        param_chunk = [(id(self), file, load_id, schema) for file in load_files]
-        # exceptions should not be raised, None as job is a temporary failure
-        # other jobs should not be affected
-        jobs = self.pool.map(Load.w_spool_job, *zip(*param_chunk))
-        # remove None jobs and check the rest
-        return file_count, [job for job in jobs if job is not None]
+    def start_new_jobs(self, load_id: str, schema: Schema, max_jobs: int, skip_jobs: Set[Tuple[str, str]]) -> Dict["Future[LoadJob]", ParsedLoadJobFileName]:
+        """Submits at most `max_jobs` new jobs to the pool and returns futures with jobs being started. Jobs with (table name, file id) in `skip_jobs` are not started
+        and all started jobs are added to `skip_jobs`.
+        """
+        started_jobs: Dict["Future[LoadJob]", ParsedLoadJobFileName] = {}
+        if max_jobs <= 0:
+            return started_jobs
+        for file in self.load_storage.list_new_jobs(load_id):
+            job_info = self.load_storage.parse_job_file_name(file)
+            job_key = (job_info.table_name, job_info.file_id)
+            if job_key in skip_jobs:
+                continue
+            skip_jobs.add(job_key)
+            started_jobs[self.pool.submit(Load.w_spool_job, id(self), file, load_id, schema)] = job_info
+            if len(started_jobs) == max_jobs:
+                break
+        if started_jobs:
+            logger.info(f"Will load {len(started_jobs)}, creating jobs")
+        return started_jobs
 
     def retrieve_jobs(self, client: JobClientBase, load_id: str, staging_client: JobClientBase = None) -> Tuple[int, List[LoadJob]]:
         jobs: List[LoadJob] = []
@@ -180,9 +228,9 @@ class Load(Runnable[Executor]):
         table_chain: List[TTableSchema] = []
         # make sure all the jobs for the table chain is completed
         for table in get_child_tables(schema.tables, top_merged_table["name"]):
-            table_jobs = self.load_storage.list_jobs_for_table(load_id, table["name"])
+            table_jobs = self.load_storage.list_job_states_for_table(load_id, table["name"])
             # all jobs must be completed in order for merge to be created
-            if any(job.state not in ("failed_jobs", "completed_jobs") and job.job_file_info.job_id() != being_completed_job_id for job in table_jobs):
+            if any(job_state not in ("failed_jobs", "completed_jobs") and job_file_info.job_id() != being_completed_job_id for job_state, job_file_info in table_jobs):
                 return None
             # if there are no jobs for the table, skip it, unless the write disposition is replace, as we need to create and clear the child tables
             if not table_jobs and top_merged_table["write_disposition"] != "replace":
@@ -338,11 +386,8 @@ class Load(Runnable[Executor]):
             else:
                 jobs_count, jobs = self.retrieve_jobs(job_client, load_id)
 
-        if not jobs:
-            # jobs count is a total number of jobs including those that could not be initialized
-            jobs_count, jobs = self.spool_new_jobs(load_id, schema)
         # if there are no existing or new jobs we complete the package
-        if jobs_count == 0:
+        if jobs_count == 0 and not self.load_storage.list_new_jobs(load_id):
             self.complete_package(load_id, schema, False)
             return
         # update counter we only care about the jobs that are scheduled to be loaded
@@ -353,11 +398,33 @@ class Load(Runnable[Executor]):
         self.collector.update("Jobs", no_completed_jobs, total_jobs)
         if no_failed_jobs > 0:
             self.collector.update("Jobs", no_failed_jobs, message="WARNING: Some of the jobs failed!", label="Failed")
-        # loop until all jobs are processed
-        while True:
-            try:
-                remaining_jobs = self.complete_jobs(load_id, jobs, schema)
-                if len(remaining_jobs) == 0:
+        # jobs being started in the pool
+        starting_jobs: Dict["Future[LoadJob]", ParsedLoadJobFileName] = {}
+        # each job is started once per run, retried jobs are started again in the next run
+        started_job_keys = {(job.job_file_info().table_name, job.job_file_info().file_id) for job in jobs}
+        poll_interval = self.MIN_POLL_INTERVAL
+        try:
+            # keep `workers` jobs in flight until all jobs are processed
+            while True:
+                for future in [f for f in starting_jobs if f.done()]:
+                    del starting_jobs[future]
+                    jobs.append(future.result())
+                # jobs from table chains that are still being started are not completed: followup jobs for
+                # the chain are created only when all of its jobs are completed and job being started may be missed
+                starting_tables = {get_top_level_table(schema.tables, job_info.table_name)["name"] for job_info in starting_jobs.values()}
+                deferred_jobs = [
+                    job for job in jobs
+                    if get_top_level_table(schema.tables, job.job_file_info().table_name)["name"] in starting_tables
+                ] if starting_tables else []
+                deferred_ids = {id(job) for job in deferred_jobs}
+                completing_jobs = [job for job in jobs if id(job) not in deferred_ids]
+                remaining_jobs = self.complete_jobs(load_id, completing_jobs, schema)
+                has_progress = {id(job) for job in remaining_jobs} != {id(job) for job in completing_jobs}
+                jobs = remaining_jobs + deferred_jobs
+                # refill free slots with new jobs
+                new_jobs = self.start_new_jobs(load_id, schema, self.config.workers - len(jobs) - len(starting_jobs), started_job_keys)
+                starting_jobs.update(new_jobs)
+                if len(jobs) == 0 and len(starting_jobs) == 0:
                     # get package status
                     package_info = self.load_storage.get_load_package_info(load_id)
                     # possibly raise on failed jobs
@@ -372,14 +439,26 @@ class Load(Runnable[Executor]):
                             if r_c > 0 and r_c % self.config.raise_on_max_retries == 0:
                                 raise LoadClientJobRetry(load_id, new_job.job_file_info.job_id(), r_c, self.config.raise_on_max_retries)
                     break
-                # process remaining jobs again
-                jobs = remaining_jobs
-                # this will raise on signal
-                sleep(1)
-            except LoadClientJobFailed:
-                # the package is completed and skipped
-                self.complete_package(load_id, schema, True)
-                raise
+                if has_progress or new_jobs:
+                    poll_interval = self.MIN_POLL_INTERVAL
+                    continue
+                # wait for jobs being started or poll running jobs with backoff, this will raise on signal
+                if starting_jobs:
+                    wait(starting_jobs, timeout=poll_interval, return_when=FIRST_COMPLETED)
+                    signals.raise_if_signalled()
+                else:
+                    sleep(poll_interval)
+                poll_interval = min(poll_interval * 2, self.MAX_POLL_INTERVAL)
+        except LoadClientJobFailed:
+            # the package is completed and skipped
+            self.complete_package(load_id, schema, True)
+            raise
+        finally:
+            # do not close pooled clients under jobs being started: drop jobs not yet running and wait for the rest
+            for future in starting_jobs:
+                future.cancel()
+            wait(starting_jobs)
+            self.close_pooled_clients()
 
     def run(self, pool: Optional[Executor]) -> TRunMetrics:
         # store pool
@@ -12,9 +12,11 @@ class ItemsNormalizerConfiguration(BaseConfiguration):
     """When true, items to be normalized will have `_dlt_id` column added with a unique ID for each row."""
     add_dlt_load_id: bool = False
     """When true, items to be normalized will have `_dlt_load_id` column added with the current load ID."""
+    columnar: bool = False
+    """When true, chunks of flat json items are coerced and written column by column with pyarrow. Used only when json items are written to parquet files."""
 
     if TYPE_CHECKING:
-        def __init__(self, add_dlt_id: bool = None, add_dlt_load_id: bool = None) -> None:
+        def __init__(self, add_dlt_id: bool = None, add_dlt_load_id: bool = None, columnar: bool = None) -> None:
             ...
 
 
@@ -30,6 +32,9 @@ class NormalizeConfiguration(PoolRunnerConfiguration):
 
     parquet_normalizer: ItemsNormalizerConfiguration = ItemsNormalizerConfiguration(add_dlt_id=False, add_dlt_load_id=False)
 
+    task_max_bytes: int = 8 * 1024 * 1024
+    """Max size of extracted files (on disk) processed by a single parallel normalize task. Big files get a task of their own"""
+
     def on_resolved(self) -> None:
         self.pool_type = "none" if self.workers == 1 else "process"
 
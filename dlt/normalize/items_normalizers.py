@@ -1,12 +1,15 @@
 import os
-from typing import List, Dict, Tuple, Protocol, Any
+import datetime  # noqa: 251
+from enum import Enum
+from typing import Iterable, Iterator, List, Dict, Optional, Set, Tuple, Protocol, Any, Type
 from pathlib import Path
 from abc import abstractmethod
 
 from dlt.common import json, logger
-from dlt.common.json import custom_pua_decode
+from dlt.common.arithmetics import Decimal
+from dlt.common.json import custom_pua_decode, PUA_CHARACTER_MAX
 from dlt.common.runtime import signals
-from dlt.common.schema.typing import TTableSchemaColumns
+from dlt.common.schema.typing import TTableSchemaColumns, TPartialTableSchema
 from dlt.common.storages import NormalizeStorage, LoadStorage, NormalizeStorageConfiguration, FileStorage
 from dlt.common.typing import TDataItem
 from dlt.common.schema import TSchemaUpdate, Schema
@@ -14,13 +17,16 @@ from dlt.common.utils import TRowCount, merge_row_count, increase_row_count
 from dlt.normalize.configuration import NormalizeConfiguration
 from dlt.common.exceptions import MissingDependencyException
 from dlt.common.normalizers.utils import generate_dlt_ids
+from dlt.common.wei import Wei
 
 try:
     from dlt.common.libs import pyarrow
     from dlt.common.libs.pyarrow import pyarrow as pa
+    from pyarrow import compute as pc
 except MissingDependencyException:
     pyarrow = None
     pa = None
+    pc = None
 
 
 class ItemsNormalizer:
@@ -45,54 +51,63 @@ class ItemsNormalizer:
 
 class JsonLItemsNormalizer(ItemsNormalizer):
     def _normalize_chunk(self, root_table_name: str, items: List[TDataItem]) -> Tuple[TSchemaUpdate, int, TRowCount]:
-        column_schemas: Dict[
-            str, TTableSchemaColumns
-        ] = {}  # quick access to column schema for writers below
-        schema_update: TSchemaUpdate = {}
-        schema = self.schema
-        schema_name = schema.name
-        items_count = 0
-        row_counts: TRowCount = {}
+        return self._coerce_and_write_rows(self._normalize_items(root_table_name, items))
 
+    def _normalize_items(self, root_table_name: str, items: List[TDataItem]) -> Iterator[Tuple[Tuple[str, str], TDataItem]]:
+        """Yields normalized and filtered rows together with (table name, parent table name)"""
+        schema = self.schema
         for item in items:
-            for (table_name, parent_table), row in self.schema.normalize_data_item(
+            for (table_name, parent_table), row in schema.normalize_data_item(
                 item, self.load_id, root_table_name
             ):
                 # filter row, may eliminate some or all fields
                 row = schema.filter_row(table_name, row)
                 # do not process empty rows
                 if row:
-                    # decode pua types
-                    for k, v in row.items():
-                        row[k] = custom_pua_decode(v)  # type: ignore
-                    # coerce row of values into schema table, generating partial table with new columns if any
-                    row, partial_table = schema.coerce_row(
-                        table_name, parent_table, row
-                    )
-                    # theres a new table or new columns in existing table
-                    if partial_table:
-                        # update schema and save the change
-                        schema.update_table(partial_table)
-                        table_updates = schema_update.setdefault(table_name, [])
-                        table_updates.append(partial_table)
-                        # update our columns
-                        column_schemas[table_name] = schema.get_table_columns(
-                            table_name
-                        )
-                    # get current columns schema
-                    columns = column_schemas.get(table_name)
-                    if not columns:
-                        columns = schema.get_table_columns(table_name)
-                        column_schemas[table_name] = columns
-                    # store row
-                    # TODO: it is possible to write to single file from many processes using this: https://gitlab.com/warsaw/flufl.lock
-                    self.load_storage.write_data_item(
-                        self.load_id, schema_name, table_name, row, columns
-                    )
-                    # count total items
-                    items_count += 1
-                    increase_row_count(row_counts, table_name, 1)
+                    yield (table_name, parent_table), row
             signals.raise_if_signalled()
+
+    def _coerce_and_write_rows(self, rows: Iterable[Tuple[Tuple[str, str], TDataItem]]) -> Tuple[TSchemaUpdate, int, TRowCount]:
+        column_schemas: Dict[
+            str, TTableSchemaColumns
+        ] = {}  # quick access to column schema for writers below
+        schema_update: TSchemaUpdate = {}
+        schema = self.schema
+        schema_name = schema.name
+        items_count = 0
+        row_counts: TRowCount = {}
+
+        for (table_name, parent_table), row in rows:
+            # decode pua types
+            for k, v in row.items():
+                row[k] = custom_pua_decode(v)  # type: ignore
+            # coerce row of values into schema table, generating partial table with new columns if any
+            row, partial_table = schema.coerce_row(
+                table_name, parent_table, row
+            )
+            # theres a new table or new columns in existing table
+            if partial_table:
+                # update schema and save the change
+                schema.update_table(partial_table)
+                table_updates = schema_update.setdefault(table_name, [])
+                table_updates.append(partial_table)
+                # update our columns
+                column_schemas[table_name] = schema.get_table_columns(
+                    table_name
+                )
+            # get current columns schema
+            columns = column_schemas.get(table_name)
+            if not columns:
+                columns = schema.get_table_columns(table_name)
+                column_schemas[table_name] = columns
+            # store row
+            # TODO: it is possible to write to single file from many processes using this: https://gitlab.com/warsaw/flufl.lock
+            self.load_storage.write_data_item(
+                self.load_id, schema_name, table_name, row, columns
+            )
+            # count total items
+            items_count += 1
+            increase_row_count(row_counts, table_name, 1)
         return schema_update, items_count, row_counts
 
     def __call__(
@@ -117,6 +132,134 @@ class JsonLItemsNormalizer(ItemsNormalizer):
         return schema_updates, items_count, row_counts
 
 
+class ArrowJsonLItemsNormalizer(JsonLItemsNormalizer):
+    """Coerces and writes chunks of flat json items column by column with pyarrow as arrow tables into parquet files.
+
+    Items are still normalized, filtered and checked for nesting row by row, only type inference, coercion and writing
+    happen once per column. Chunks with nested items, with rows going into many tables or with values that need coercion
+    or variant columns are processed entirely row by row by `JsonLItemsNormalizer`.
+    """
+
+    def __init__(
+        self,
+        load_storage: LoadStorage,
+        normalize_storage: NormalizeStorage,
+        schema: Schema,
+        load_id: str,
+        config: NormalizeConfiguration
+    ) -> None:
+        super().__init__(load_storage, normalize_storage, schema, load_id, config)
+        # arrow tables can only be written by parquet writer
+        self._columnar = pa is not None and load_storage.loader_file_format == "parquet"
+        # lookup range of PUA encoded values
+        self._pua_range = (chr(0xF026), chr(0xF026 + PUA_CHARACTER_MAX))
+
+    def _normalize_chunk(self, root_table_name: str, items: List[TDataItem]) -> Tuple[TSchemaUpdate, int, TRowCount]:
+        if not self._columnar or not all(self._is_flat_item(item) for item in items):
+            return super()._normalize_chunk(root_table_name, items)
+        rows = list(self._normalize_items(root_table_name, items))
+        tables = {table for table, _ in rows}
+        if len(tables) == 1:
+            table_name, parent_table = tables.pop()
+            schema_update = self._write_columns(table_name, parent_table, [row for _, row in rows])
+            if schema_update is not None:
+                return schema_update, len(rows), {table_name: len(rows)}
+        return self._coerce_and_write_rows(rows)
+
+    @staticmethod
+    def _is_flat_item(item: TDataItem) -> bool:
+        # flat items do not produce child tables or flattened columns
+        return isinstance(item, dict) and not any(isinstance(v, (dict, list)) for v in item.values())
+
+    @staticmethod
+    def _is_arrow_native_type(py_type: Type[Any]) -> bool:
+        # types that pyarrow converts without coercion (enums are coerced to their values)
+        return issubclass(py_type, (str, int, float, Decimal, datetime.date, datetime.time, bytes)) \
+            and not issubclass(py_type, (Wei, Enum))
+
+    def _decode_pua_column(self, values: List[Any]) -> List[Any]:
+        arr = pa.array(values, type=pa.string())
+        first_chars = pc.utf8_slice_codeunits(arr, 0, 1)
+        is_pua = pc.and_(
+            pc.greater_equal(first_chars, self._pua_range[0]),
+            pc.less_equal(first_chars, self._pua_range[1])
+        )
+        if pc.any(is_pua).as_py():
+            return list(map(custom_pua_decode, values))
+        return values
+
+    def _write_columns(self, table_name: str, parent_table: str, rows: List[TDataItem]) -> Optional[TSchemaUpdate]:
+        """Writes `rows` as arrow table. Returns None without writing if any of the columns cannot be written without coercion"""
+        schema = self.schema
+        table = schema.tables.get(table_name)
+        table_columns = table["columns"] if table else {}
+        # column names in order of appearance
+        col_names: Dict[str, None] = {}
+        for row in rows:
+            col_names.update(dict.fromkeys(row))
+
+        columns_values: Dict[str, List[Any]] = {}
+        columns_py_types: Dict[str, Type[Any]] = {}
+        has_nulls: Set[str] = set()
+        # first non null value of each column is used to infer the column schema exactly like coerce_row does
+        probe_row: Dict[str, Any] = {}
+        for col_name in col_names:
+            values = [row.get(col_name) for row in rows]
+            py_types = set(map(type, values))
+            if type(None) in py_types:
+                py_types.discard(type(None))
+                has_nulls.add(col_name)
+            if len(py_types) > 1:
+                # mixed types are coerced or go to variant columns row by row
+                return None
+            if py_types == {str}:
+                values = self._decode_pua_column(values)
+                py_types = set(map(type, values))
+                py_types.discard(type(None))
+                if len(py_types) > 1:
+                    return None
+            if not py_types:
+                # all values are None, column is not created
+                if not table_columns.get(col_name, {}).get("nullable", True):
+                    return None
+                continue
+            py_type = py_types.pop()
+            if not self._is_arrow_native_type(py_type):
+                return None
+            columns_values[col_name] = values
+            columns_py_types[col_name] = py_type
+            probe_row[col_name] = next(v for v in values if v is not None)
+
+        coerced_row, partial_table = schema.coerce_row(table_name, parent_table, probe_row)
+        new_columns = partial_table["columns"] if partial_table else {}
+        caps = self.config.destination_capabilities
+        arrays: List[Any] = []
+        for col_name, values in columns_values.items():
+            # value had to be coerced or went to a variant column
+            if col_name not in coerced_row or type(coerced_row[col_name]) is not columns_py_types[col_name]:
+                return None
+            column = new_columns.get(col_name) or table_columns[col_name]
+            if col_name in has_nulls and not column.get("nullable", True):
+                return None
+            try:
+                arrays.append(pa.array(values, type=pyarrow.get_py_arrow_datatype(column, caps, "UTC")))
+            except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+                return None
+
+        schema_update: TSchemaUpdate = {}
+        if partial_table:
+            schema.update_table(partial_table)
+            schema_update[table_name] = [partial_table]
+        self.load_storage.write_data_item(
+            self.load_id,
+            schema.name,
+            table_name,
+            pa.Table.from_arrays(arrays, names=list(columns_values.keys())),
+            schema.get_table_columns(table_name)
+        )
+        return schema_update
+
+
 class ParquetItemsNormalizer(ItemsNormalizer):
     REWRITE_ROW_GROUPS = 1
 
@@ -129,13 +272,13 @@ class ParquetItemsNormalizer(ItemsNormalizer):
         schema_update: TSchemaUpdate = {}
 
         if add_load_id:
-            table_update = schema.update_table({"name": root_table_name, "columns": {"_dlt_load_id": {"name": "_dlt_load_id", "data_type": "text", "nullable": False}}})
             table_updates = schema_update.setdefault(root_table_name, [])
-            table_updates.append(table_update)
+            table_updates.append(self._add_load_id_column(root_table_name))
+            # a constant column avoids python strings per row but the row groups are still rewritten
             load_id_type = pa.dictionary(pa.int8(), pa.string())
             new_columns.append((
                 pa.field("_dlt_load_id", load_id_type, nullable=False),
-                lambda batch: pa.array([load_id] * batch.num_rows, type=load_id_type)
+                lambda batch: pyarrow.constant_dictionary_array(load_id, batch.num_rows, pa.string())
             ))
 
         if add_dlt_id:
@@ -148,21 +291,19 @@ class ParquetItemsNormalizer(ItemsNormalizer):
             ))
 
         items_count = 0
-        as_py = self.load_storage.loader_file_format != "arrow"
+        columns = schema.get_table_columns(root_table_name)
         with self.normalize_storage.storage.open_file(extracted_items_file, "rb") as f:
             for batch in pyarrow.pq_stream_with_new_columns(f, new_columns, row_groups_per_read=self.REWRITE_ROW_GROUPS):
                 items_count += batch.num_rows
-                if as_py:
-                    # Write python rows to jsonl, insert-values, etc... storage
-                    self.load_storage.write_data_item(
-                        load_id, schema.name, root_table_name, batch.to_pylist(), schema.get_table_columns(root_table_name)
-                    )
-                else:
-                    self.load_storage.write_data_item(
-                        load_id, schema.name, root_table_name, batch, schema.get_table_columns(root_table_name)
-                    )
+                # all writers accept arrow tables, jsonl and insert-values are written column by column
+                self.load_storage.write_data_item(
+                    load_id, schema.name, root_table_name, batch, columns
+                )
         return [schema_update], items_count
 
+    def _add_load_id_column(self, root_table_name: str) -> TPartialTableSchema:
+        return self.schema.update_table({"name": root_table_name, "columns": {"_dlt_load_id": {"name": "_dlt_load_id", "data_type": "text", "nullable": False}}})
+
     def _fix_schema_precisions(self, root_table_name: str) -> List[TSchemaUpdate]:
         """Reduce precision of timestamp columns if needed, according to destination caps"""
         schema = self.schema
@@ -190,8 +331,11 @@ class ParquetItemsNormalizer(ItemsNormalizer):
 
         add_dlt_id = self.config.parquet_normalizer.add_dlt_id
         add_dlt_load_id = self.config.parquet_normalizer.add_dlt_load_id
+        is_arrow = self.load_storage.loader_file_format == "arrow"
+        # destination fills the load id when loading the linked file
+        lazy_load_id = add_dlt_load_id and is_arrow and self.config.destination_capabilities.loader_adds_load_id
 
-        if add_dlt_id or add_dlt_load_id or self.load_storage.loader_file_format != "arrow":
+        if add_dlt_id or (add_dlt_load_id and not lazy_load_id) or not is_arrow:
             schema_update, items_count = self._write_with_dlt_columns(
                 extracted_items_file,
                 root_table_name,
@@ -200,6 +344,9 @@ class ParquetItemsNormalizer(ItemsNormalizer):
             )
             return base_schema_update + schema_update, items_count, {root_table_name: items_count}
 
+        if lazy_load_id:
+            base_schema_update.append({root_table_name: [self._add_load_id_column(root_table_name)]})
+
         from dlt.common.libs.pyarrow import get_row_count
         with self.normalize_storage.storage.open_file(extracted_items_file, "rb") as f:
             items_count = get_row_count(f)
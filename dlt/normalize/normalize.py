@@ -1,8 +1,9 @@
 import os
-from typing import Callable, List, Dict, Sequence, Tuple, Set, Optional
-from concurrent.futures import Future, Executor
+from collections import deque
+from typing import Callable, Deque, List, Dict, Sequence, Tuple, Set, Optional, Type
+from concurrent.futures import Future, Executor, wait, FIRST_COMPLETED
 
-from dlt.common import pendulum, json, logger, sleep
+from dlt.common import pendulum, json, logger
 from dlt.common.configuration import with_config, known_sections
 from dlt.common.configuration.accessors import config
 from dlt.common.configuration.container import Container
@@ -11,7 +12,7 @@ from dlt.common.runners import TRunMetrics, Runnable, NullExecutor
 from dlt.common.runtime import signals
 from dlt.common.runtime.collector import Collector, NULL_COLLECTOR
 from dlt.common.schema.typing import TStoredSchema
-from dlt.common.schema.utils import merge_schema_updates
+from dlt.common.schema.utils import merge_schema_updates, is_complete_column, compare_complete_columns
 from dlt.common.storages.exceptions import SchemaNotFoundError
 from dlt.common.storages import NormalizeStorage, SchemaStorage, LoadStorage, LoadStorageConfiguration, NormalizeStorageConfiguration
 from dlt.common.typing import TDataItem
@@ -21,7 +22,7 @@ from dlt.common.pipeline import NormalizeInfo
 from dlt.common.utils import chunks, TRowCount, merge_row_count, increase_row_count
 
 from dlt.normalize.configuration import NormalizeConfiguration
-from dlt.normalize.items_normalizers import ParquetItemsNormalizer, JsonLItemsNormalizer, ItemsNormalizer
+from dlt.normalize.items_normalizers import ParquetItemsNormalizer, JsonLItemsNormalizer, ArrowJsonLItemsNormalizer, ItemsNormalizer
 
 # normalize worker wrapping function (map_parallel, map_single) return type
 TMapFuncRV = Tuple[Sequence[TSchemaUpdate], TRowCount]
@@ -109,7 +110,13 @@ class Normalize(Runnable[Executor]):
                 load_storage = _get_load_storage(file_format)
                 if file_format in item_normalizers:
                     return item_normalizers[file_format], load_storage
-                klass = ParquetItemsNormalizer if file_format == "parquet" else JsonLItemsNormalizer
+                klass: Type[ItemsNormalizer]
+                if file_format == "parquet":
+                    klass = ParquetItemsNormalizer
+                elif config.json_normalizer.columnar:
+                    klass = ArrowJsonLItemsNormalizer
+                else:
+                    klass = JsonLItemsNormalizer
                 norm = item_normalizers[file_format] = klass(
                     load_storage, normalize_storage, schema, load_id, config
                 )
@@ -155,6 +162,65 @@ class Normalize(Runnable[Executor]):
 
         return schema_updates, total_items, load_storage.closed_files(), row_counts
 
+    @staticmethod
+    def _root_table_names(schema: Schema, schema_updates: Sequence[TSchemaUpdate]) -> Dict[str, str]:
+        """Maps all tables in `schema` and `schema_updates` to the names of their root tables"""
+        parents: Dict[str, str] = {
+            table_name: table["parent"] for table_name, table in schema.tables.items() if table.get("parent")
+        }
+        for schema_update in schema_updates:
+            for table_name, table_updates in schema_update.items():
+                for partial_table in table_updates:
+                    if partial_table.get("parent"):
+                        parents[table_name] = partial_table["parent"]
+        root_tables: Dict[str, str] = {}
+        for table_name in set(schema.tables).union(*schema_updates):
+            root_table_name = table_name
+            while root_table_name in parents:
+                root_table_name = parents[root_table_name]
+            root_tables[table_name] = root_table_name
+        return root_tables
+
+    @staticmethod
+    def find_conflicting_root_tables(schema: Schema, schema_updates: Sequence[TSchemaUpdate]) -> Set[str]:
+        """Finds root tables of tables with columns in `schema_updates` whose data types conflict with columns already in `schema`"""
+        root_tables = Normalize._root_table_names(schema, schema_updates)
+        conflicting_root_tables: Set[str] = set()
+        for schema_update in schema_updates:
+            for table_name, table_updates in schema_update.items():
+                existing_columns = schema.tables.get(table_name, {}).get("columns", {})
+                for partial_table in table_updates:
+                    for col_name, column in partial_table["columns"].items():
+                        existing_column = existing_columns.get(col_name)
+                        if existing_column and is_complete_column(existing_column) and is_complete_column(column) \
+                                and not compare_complete_columns(existing_column, column):
+                            conflicting_root_tables.add(root_tables[table_name])
+        return conflicting_root_tables
+
+    @staticmethod
+    def drop_root_tables_from_result(schema: Schema, result: TWorkerRV, root_table_names: Set[str]) -> TWorkerRV:
+        """Deletes job files and removes schema updates and row counts of tables belonging to `root_table_names` from worker `result`"""
+        schema_updates, total_items, job_files, row_counts = result
+        root_tables = Normalize._root_table_names(schema, schema_updates)
+
+        def _is_dropped(table_name: str) -> bool:
+            return root_tables.get(table_name, table_name) in root_table_names
+
+        kept_updates = [
+            {table_name: table_updates for table_name, table_updates in schema_update.items() if not _is_dropped(table_name)}
+            for schema_update in schema_updates
+        ]
+        kept_files: List[str] = []
+        for file in job_files:
+            if _is_dropped(LoadStorage.parse_job_file_name(file).table_name):
+                os.remove(file)
+            else:
+                kept_files.append(file)
+        # items are counted in root tables
+        total_items -= sum(row_counts.get(table_name, 0) for table_name in root_table_names)
+        kept_row_counts = {table_name: count for table_name, count in row_counts.items() if not _is_dropped(table_name)}
+        return kept_updates, total_items, kept_files, kept_row_counts
+
     def update_table(self, schema: Schema, schema_updates: List[TSchemaUpdate]) -> None:
         for schema_update in schema_updates:
             for table_name, table_updates in schema_update.items():
@@ -180,53 +246,91 @@ class Normalize(Runnable[Executor]):
             l_idx = idx + 1
         return chunk_files
 
+    @staticmethod
+    def group_worker_files_by_size(files: Sequence[Tuple[str, int]], no_groups: int, max_group_size: int) -> List[List[str]]:
+        """Packs `files` (file name, size) into groups not bigger than `max_group_size` bytes and returns groups sorted by size, biggest first.
+
+        The group size is additionally limited so at least `no_groups` groups are produced, if possible. Files are packed in sorted order
+        so the same tables end up in the same group. A file bigger than the limit gets a group of its own.
+        """
+        if not files:
+            return []
+        total_size = sum(size for _, size in files)
+        group_size_limit = max(min(max_group_size, total_size // no_groups), 1)
+        groups: List[Tuple[int, List[str]]] = []
+        group: List[str] = []
+        group_size = 0
+        for file, size in sorted(files):
+            if group and group_size + size > group_size_limit:
+                groups.append((group_size, group))
+                group, group_size = [], 0
+            group.append(file)
+            group_size += size
+        groups.append((group_size, group))
+        # largest tasks are scheduled first so the small ones fill the gaps at the end
+        return [group for _, group in sorted(groups, key=lambda g: g[0], reverse=True)]
+
     def map_parallel(self, schema: Schema, load_id: str, files: Sequence[str]) -> TMapFuncRV:
         workers: int = getattr(self.pool, '_max_workers', 1)
-        chunk_files = self.group_worker_files(files, workers)
-        schema_dict: TStoredSchema = schema.to_dict()
-        param_chunk = [(
-            self.config, self.normalize_storage.config, self.load_storage.config, schema_dict, load_id, files
-        ) for files in chunk_files]
+        files_with_sizes = [
+            (file, os.path.getsize(self.normalize_storage.storage.make_full_path(file))) for file in files
+        ]
+        pending_files: Deque[Sequence[str]] = deque(
+            self.group_worker_files_by_size(files_with_sizes, workers, self.config.task_max_bytes)
+        )
+        schema_dict: TStoredSchema = None
         row_counts: TRowCount = {}
 
         # return stats
         schema_updates: List[TSchemaUpdate] = []
 
-        # push all tasks to queue
-        tasks = [
-            (self.pool.submit(Normalize.w_normalize_files, *params), params) for params in param_chunk
-        ]
-
-        while len(tasks) > 0:
-            sleep(0.3)
-            # operate on copy of the list
-            for task in list(tasks):
-                pending, params = task
-                if pending.done():
-                    result: TWorkerRV = pending.result()  # Exception in task (if any) is raised here
-                    try:
-                        # gather schema from all manifests, validate consistency and combine
-                        self.update_table(schema, result[0])
-                        schema_updates.extend(result[0])
-                        # update metrics
-                        self.collector.update("Files", len(result[2]))
-                        self.collector.update("Items", result[1])
-                        # merge row counts
-                        merge_row_count(row_counts, result[3])
-                    except CannotCoerceColumnException as exc:
-                        # schema conflicts resulting from parallel executing
-                        logger.warning(f"Parallel schema update conflict, retrying task ({str(exc)}")
-                        # delete all files produced by the task
-                        for file in result[2]:
-                            os.remove(file)
-                        # schedule the task again
-                        schema_dict = schema.to_dict()
-                        # TODO: it's time for a named tuple
-                        params = params[:3] + (schema_dict,) + params[4:]
-                        retry_pending: Future[TWorkerRV] = self.pool.submit(Normalize.w_normalize_files, *params)
-                        tasks.append((retry_pending, params))
-                    # remove finished tasks
-                    tasks.remove(task)
+        # tasks in flight, keep at most `workers` so tasks submitted later see schema updates from finished tasks
+        tasks: Dict["Future[TWorkerRV]", Sequence[str]] = {}
+
+        while pending_files or tasks:
+            while pending_files and len(tasks) < workers:
+                task_files = pending_files.popleft()
+                if schema_dict is None:
+                    schema_dict = schema.to_dict()
+                params = (self.config, self.normalize_storage.config, self.load_storage.config, schema_dict, load_id, task_files)
+                tasks[self.pool.submit(Normalize.w_normalize_files, *params)] = task_files
+            # wait for any task to complete
+            done, _ = wait(tasks, return_when=FIRST_COMPLETED)
+            for pending in done:
+                task_files = tasks.pop(pending)
+                result: TWorkerRV = pending.result()  # Exception in task (if any) is raised here
+                try:
+                    # tables with columns that conflict with data types set by other tasks are normalized again
+                    # with the updated schema, exactly like in single thread mode. other tables produced by the task are kept
+                    conflicting_root_tables = self.find_conflicting_root_tables(schema, result[0])
+                    if conflicting_root_tables:
+                        result = self.drop_root_tables_from_result(schema, result, conflicting_root_tables)
+                        retry_files = [
+                            file for file in task_files
+                            if schema.naming.normalize_table_identifier(NormalizeStorage.parse_normalize_file_name(file).table_name) in conflicting_root_tables
+                        ]
+                        logger.info(f"Tables {conflicting_root_tables} conflict with schema updated by other tasks, normalizing {len(retry_files)} files again")
+                        if retry_files:
+                            pending_files.appendleft(retry_files)
+                    # gather schema from all manifests, validate consistency and combine
+                    self.update_table(schema, result[0])
+                    schema_updates.extend(result[0])
+                    # update metrics
+                    self.collector.update("Files", len(result[2]))
+                    self.collector.update("Items", result[1])
+                    # merge row counts
+                    merge_row_count(row_counts, result[3])
+                except CannotCoerceColumnException as exc:
+                    # schema conflicts resulting from parallel executing
+                    logger.warning(f"Parallel schema update conflict, retrying task ({str(exc)}")
+                    # delete all files produced by the task
+                    for file in result[2]:
+                        os.remove(file)
+                    # schedule the task again as soon as possible
+                    pending_files.appendleft(task_files)
+                if result[0]:
+                    # submit next tasks with updated schema
+                    schema_dict = None
 
         return schema_updates, row_counts
 
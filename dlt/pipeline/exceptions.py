@@ -47,6 +47,20 @@ class PipelineStateEngineNoUpgradePathException(PipelineException):
         super().__init__(pipeline_name, f"No engine upgrade path for state in pipeline {pipeline_name} from {init_engine} to {to_engine}, stopped at {from_engine}")
 
 
+class PipelineStateShardNotFound(PipelineException):
+    def __init__(self, pipeline_name: str, source_name: str, resource_name: str, version: int) -> None:
+        self.source_name = source_name
+        self.resource_name = resource_name
+        self.version = version
+        shard = f"resource {resource_name} of source {source_name}" if resource_name else f"source {source_name}"
+        msg = (
+            f"State of {shard} stored in version {version} of pipeline {pipeline_name} state was not found in the destination. "
+            "Restoring the state without it would reset incremental loading of this source. "
+            "Use `dlt pipeline drop` to reset the state of affected source or resource explicitly."
+        )
+        super().__init__(pipeline_name, msg)
+
+
 class PipelineHasPendingDataException(PipelineException):
     def __init__(self, pipeline_name: str, pipelines_dir: str) -> None:
         msg = (
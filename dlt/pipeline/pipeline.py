@@ -29,7 +29,7 @@ from dlt.common.destination.reference import (DestinationClientDwhConfiguration,
                                               TDestinationReferenceArg, DestinationClientStagingConfiguration,  DestinationClientStagingConfiguration,
                                               DestinationClientDwhWithStagingConfiguration)
 from dlt.common.destination.capabilities import INTERNAL_LOADER_FILE_FORMATS
-from dlt.common.pipeline import ExtractInfo, LoadInfo, NormalizeInfo, PipelineContext, SupportsPipeline, TPipelineLocalState, TPipelineState, StateInjectableContext
+from dlt.common.pipeline import ExtractInfo, LoadInfo, NormalizeInfo, PipelineContext, SupportsPipeline, TPipelineLocalState, TPipelineState, TStateShards, StateInjectableContext
 from dlt.common.schema import Schema
 from dlt.common.utils import is_interactive
 from dlt.common.data_writers import TLoaderFileFormat
@@ -49,7 +49,7 @@ from dlt.pipeline.progress import _Collector, _NULL_COLLECTOR
 from dlt.pipeline.exceptions import CannotRestorePipelineException, InvalidPipelineName, PipelineConfigMissing, PipelineNotActive, PipelineStepFailed, SqlClientNotAvailable
 from dlt.pipeline.trace import PipelineTrace, PipelineStepTrace, load_trace, merge_traces, start_trace, start_trace_step, end_trace_step, end_trace, describe_extract_data
 from dlt.pipeline.typing import TPipelineStep
-from dlt.pipeline.state_sync import STATE_ENGINE_VERSION, load_state_from_destination, merge_state_if_changed, migrate_state, state_resource, json_encode_state, json_decode_state
+from dlt.pipeline.state_sync import STATE_ENGINE_VERSION, load_state_from_destination_with_shards, merge_state_if_changed, migrate_state, state_resource, json_encode_state, json_decode_state
 
 from dlt.common.schema.utils import normalize_schema_name
 
@@ -494,7 +494,12 @@ class Pipeline(SupportsPipeline):
         try:
             try:
                 restored_schemas: Sequence[Schema] = None
-                remote_state = self._restore_state_from_destination()
+                remote_state, remote_shards = self._restore_state_from_destination()
+                # remember which state shards are stored in the destination so they are not written again
+                if remote_shards:
+                    local_state["_state_shards"] = remote_shards
+                else:
+                    local_state.pop("_state_shards", None)
 
                 # if remote state is newer or same
                 # print(f'REMOTE STATE: {(remote_state or {}).get("_state_version")} >= {state["_state_version"]}')
@@ -532,6 +537,7 @@ class Pipeline(SupportsPipeline):
                 if remote_state is not None:
                     self.first_run = False
             except DestinationUndefinedEntity:
+                local_state.pop("_state_shards", None)
                 # storage not present. wipe the pipeline if pipeline not new
                 # do it only if pipeline has any data
                 if self.has_data:
@@ -1129,7 +1135,7 @@ class Pipeline(SupportsPipeline):
             logger.info("Client not available due to missing credentials")
         return None
 
-    def _restore_state_from_destination(self) -> Optional[TPipelineState]:
+    def _restore_state_from_destination(self) -> Tuple[Optional[TPipelineState], Optional[TStateShards]]:
         # if state is not present locally, take the state from the destination
         dataset_name = self.dataset_name
         use_single_dataset = self.config.use_single_dataset
@@ -1141,15 +1147,15 @@ class Pipeline(SupportsPipeline):
                 schema = Schema(schema_name)
             with self._get_destination_clients(schema)[0] as job_client:
                 if isinstance(job_client, WithStateSync):
-                    state = load_state_from_destination(self.pipeline_name, job_client)
+                    state, shards = load_state_from_destination_with_shards(self.pipeline_name, job_client)
                     if state is None:
                         logger.info(f"The state was not found in the destination {self.destination.__name__}:{dataset_name}")
                     else:
                         logger.info(f"The state was restored from the destination {self.destination.__name__}:{dataset_name}")
                 else:
-                    state = None
+                    state, shards = None, None
                     logger.info(f"Destination does not support metadata storage {self.destination.__name__}:{dataset_name}")
-            return state
+            return state, shards
         finally:
             # restore the use_single_dataset option
             self.config.use_single_dataset = use_single_dataset
@@ -1209,7 +1215,7 @@ class Pipeline(SupportsPipeline):
             # extract state only when there's change in the state or state was not yet extracted AND we actually want to do it
             if (merged_state or "_last_extracted_at" not in local_state) and extract_state:
                 # print(f'EXTRACT STATE merged: {bool(merged_state)} extracted timestamp in {"_last_extracted_at" not in local_state}')
-                merged_state = self._extract_state(merged_state or state)
+                merged_state = self._extract_state(merged_state or state, local_state.get("_state_shards"))
                 local_state["_last_extracted_at"] = pendulum.now()
 
             # if state is modified and is not being extracted, mark it to be extracted next time
@@ -1249,10 +1255,11 @@ class Pipeline(SupportsPipeline):
     def _save_state(self, state: TPipelineState) -> None:
         self._pipeline_storage.save(Pipeline.STATE_FILE, json_encode_state(state))
 
-    def _extract_state(self, state: TPipelineState) -> TPipelineState:
+    def _extract_state(self, state: TPipelineState, synced_shards: TStateShards = None) -> TPipelineState:
         # this will extract the state into current load package and update the schema with the _dlt_pipeline_state table
         # note: the schema will be persisted because the schema saving decorator is over the state manager decorator for extract
-        state_source = DltSource(self.default_schema.name, self.pipeline_name, self.default_schema, [state_resource(state)])
+        # note: only state shards not present in `synced_shards` are written
+        state_source = DltSource(self.default_schema.name, self.pipeline_name, self.default_schema, [state_resource(state, synced_shards)])
         storage = ExtractorStorage(self._normalize_storage_config)
         extract_id = extract_with_schema(storage, state_source, self.default_schema, _NULL_COLLECTOR, 1, 1)
         storage.commit_extract_files(extract_id)
@@ -1,5 +1,6 @@
 import binascii
-from typing import Any, Optional, cast
+import contextlib
+from typing import Any, Dict, Optional, Set, Tuple, cast
 import binascii
 
 import pendulum
@@ -7,19 +8,21 @@ import pendulum
 import dlt
 
 from dlt.common import json
-from dlt.common.pipeline import TPipelineState
+from dlt.common.pipeline import TPipelineState, TSourceStateShardInfo, TStateShardInfo, TStateShards
 from dlt.common.typing import DictStrAny
 from dlt.common.schema.typing import STATE_TABLE_NAME, TTableSchemaColumns
 from dlt.common.destination.reference import JobClientBase, WithStateSync
 
 from dlt.extract.source import DltResource
 
-from dlt.pipeline.exceptions import PipelineStateEngineNoUpgradePathException
-from dlt.common.utils import compressed_b64decode, compressed_b64encode
+from dlt.pipeline.exceptions import PipelineStateEngineNoUpgradePathException, PipelineStateShardNotFound
+from dlt.common.utils import compressed_b64decode, compressed_b64encode, digest128
 
 
 # allows to upgrade state when restored with a new version of state logic/schema
-STATE_ENGINE_VERSION = 2
+STATE_ENGINE_VERSION = 3
+# unchanged shards older than this number of state versions are written again so restore reads a bounded number of rows
+STATE_SHARDS_COMPACTION_INTERVAL = 100
 
 # state table columns
 STATE_TABLE_COLUMNS: TTableSchemaColumns = {
@@ -83,25 +86,165 @@ def merge_state_if_changed(old_state: TPipelineState, new_state: TPipelineState,
     return old_state
 
 
-def state_resource(state: TPipelineState) -> DltResource:
-    state_str = compress_state(state)
-    state_doc = {
+def _split_source_state(source_state: Any) -> Tuple[Any, Dict[str, Any]]:
+    """Splits `source_state` into a source level shard and a dictionary of resource shards"""
+    if isinstance(source_state, dict) and isinstance(source_state.get("resources"), dict):
+        return {k: v for k, v in source_state.items() if k != "resources"}, source_state["resources"]
+    return source_state, None
+
+
+def _shard_hash(shard: Any) -> str:
+    # typed encoding survives round trip to the destination so restored shards hash the same
+    return digest128(json.typed_dumps(shard, sort_keys=True))
+
+
+def _is_shard_stored(shard_hash: str, version: int, synced_shard: Optional[TStateShardInfo]) -> bool:
+    """Tells if shard with `shard_hash` is already stored in the destination and may be referenced by state `version`"""
+    if not synced_shard or synced_shard.get("hash") != shard_hash:
+        return False
+    # older shards are compacted into the current version
+    return 0 <= version - synced_shard["version"] <= STATE_SHARDS_COMPACTION_INTERVAL
+
+
+def state_doc(state: TPipelineState, synced_shards: TStateShards = None) -> DictStrAny:
+    """Builds a document with `state` to be stored in the destination state table.
+
+    The source and resource states are stored as shards. Shards that did not change since the state in `synced_shards` was stored
+    in the destination are not written again, instead the `_state_shards` manifest references the state version that holds them.
+    """
+    version = state["_state_version"]
+    synced_shards = synced_shards or {}
+    shards: TStateShards = {}
+    stored_sources: Dict[str, Any] = {}
+    for source_name, source_state in state.get("sources", {}).items():
+        source_shard, resources = _split_source_state(source_state)
+        synced_source = synced_shards.get(source_name, {})
+        source_info: TSourceStateShardInfo = {"version": version, "hash": _shard_hash(source_shard)}
+        source_referenced = _is_shard_stored(source_info["hash"], version, synced_source)
+        if source_referenced:
+            source_info["version"] = synced_source["version"]
+        stored_resources: Dict[str, Any] = {}
+        if resources is not None:
+            source_info["resources"] = {}
+            synced_resources = synced_source.get("resources", {})
+            for resource_name, resource_state in resources.items():
+                resource_info: TStateShardInfo = {"version": version, "hash": _shard_hash(resource_state)}
+                if _is_shard_stored(resource_info["hash"], version, synced_resources.get(resource_name)):
+                    resource_info["version"] = synced_resources[resource_name]["version"]
+                else:
+                    stored_resources[resource_name] = resource_state
+                source_info["resources"][resource_name] = resource_info
+        shards[source_name] = source_info
+        # write source level shard when changed and all changed resource shards
+        if not source_referenced:
+            if resources is not None:
+                stored_sources[source_name] = {**source_shard, "resources": stored_resources}
+            else:
+                stored_sources[source_name] = source_shard
+        elif stored_resources:
+            stored_sources[source_name] = {"resources": stored_resources}
+
+    doc: DictStrAny = {k: v for k, v in state.items() if k != "sources"}
+    if "sources" in state:
+        doc["sources"] = stored_sources
+    doc["_state_shards"] = shards
+    return doc
+
+
+def state_resource(state: TPipelineState, synced_shards: TStateShards = None) -> DltResource:
+    state_str = compress_state(cast(TPipelineState, state_doc(state, synced_shards)))
+    state_doc_ = {
         "version": state["_state_version"],
         "engine_version": state["_state_engine_version"],
         "pipeline_name": state["pipeline_name"],
         "state":  state_str,
         "created_at": pendulum.now()
     }
-    return dlt.resource([state_doc], name=STATE_TABLE_NAME, write_disposition="append", columns=STATE_TABLE_COLUMNS)
+    return dlt.resource([state_doc_], name=STATE_TABLE_NAME, write_disposition="append", columns=STATE_TABLE_COLUMNS)
+
+
+def _shards_from_full_state(state: DictStrAny, version: int) -> TStateShards:
+    """Generates manifest for a state that holds all the shards"""
+    return state_doc(cast(TPipelineState, {**state, "_state_version": version}))["_state_shards"]
 
 
 def load_state_from_destination(pipeline_name: str, client: WithStateSync) -> TPipelineState:
     # NOTE: if dataset or table holding state does not exist, the sql_client will rise DestinationUndefinedEntity. caller must handle this
-    state = client.get_stored_state(pipeline_name)
-    if not state:
-        return None
-    s = decompress_state(state.state)
-    return migrate_state(pipeline_name, s, s["_state_engine_version"], STATE_ENGINE_VERSION)
+    state, _ = load_state_from_destination_with_shards(pipeline_name, client)
+    return state
+
+
+def load_state_from_destination_with_shards(pipeline_name: str, client: WithStateSync) -> Tuple[TPipelineState, TStateShards]:
+    """Loads newest state from destination and reassembles it from the shards stored in older state versions.
+
+    Returns the state and the manifest of shards found in the destination. Raises `PipelineStateShardNotFound` if any of the shards cannot be found.
+    """
+    # close the iterator so the destination cursor is released when not all the rows were read
+    with contextlib.closing(client.get_stored_states(pipeline_name)) as stored_states:
+        head = next(stored_states, None)
+        if not head:
+            return None, None
+        s = decompress_state(head.state)
+        shards: TStateShards = s.pop("_state_shards", None)
+        if shards is None:
+            # state written by older engine holds all the shards
+            shards = _shards_from_full_state(s, head.version)
+        else:
+            # collect shard hashes still missing, keyed by version that stores them
+            missing: Dict[int, Set[Tuple[str, str, str]]] = {}
+            for source_name, source_info in shards.items():
+                missing.setdefault(source_info["version"], set()).add((source_name, None, source_info["hash"]))
+                for resource_name, resource_info in source_info.get("resources", {}).items():
+                    missing.setdefault(resource_info["version"], set()).add((source_name, resource_name, resource_info["hash"]))
+            found: Dict[Tuple[str, str], Any] = {}
+            _collect_shards(s, head.version, missing, found)
+            # read only rows of versions that hold the missing shards
+            while missing:
+                stored_state = next(stored_states, None)
+                if stored_state is None:
+                    break
+                if stored_state.version in missing:
+                    _collect_shards(decompress_state(stored_state.state), stored_state.version, missing, found)
+            if missing:
+                version = min(missing)
+                source_name, resource_name, _ = sorted(missing[version], key=str)[0]
+                raise PipelineStateShardNotFound(pipeline_name, source_name, resource_name, version)
+            if "sources" in s:
+                s["sources"] = _assemble_sources(shards, found)
+    return migrate_state(pipeline_name, s, s["_state_engine_version"], STATE_ENGINE_VERSION), shards
+
+
+def _collect_shards(doc: DictStrAny, version: int, missing: Dict[int, Set[Tuple[str, str, str]]], found: Dict[Tuple[str, str], Any]) -> None:
+    """Moves shards from state `doc` at `version` that are in `missing` into `found`"""
+    if version not in missing:
+        return
+    available: Dict[Tuple[str, str, str], Any] = {}
+    for source_name, source_state in doc.get("sources", {}).items():
+        source_shard, resources = _split_source_state(source_state)
+        available[(source_name, None, _shard_hash(source_shard))] = source_shard
+        for resource_name, resource_state in (resources or {}).items():
+            available[(source_name, resource_name, _shard_hash(resource_state))] = resource_state
+    version_missing = missing[version]
+    for key in list(version_missing):
+        if key in available:
+            found[key[:2]] = available[key]
+            version_missing.remove(key)
+    if not version_missing:
+        del missing[version]
+
+
+def _assemble_sources(shards: TStateShards, found: Dict[Tuple[str, str], Any]) -> Dict[str, Any]:
+    """Assembles source states from `found` shards listed in `shards` manifest"""
+    sources: Dict[str, Any] = {}
+    for source_name, source_info in shards.items():
+        source_state = found[(source_name, None)]
+        if "resources" in source_info:
+            source_state = {
+                **source_state,
+                "resources": {resource_name: found[(source_name, resource_name)] for resource_name in source_info["resources"]}
+            }
+        sources[source_name] = source_state
+    return sources
 
 
 def migrate_state(pipeline_name: str, state: DictStrAny, from_engine: int, to_engine: int) -> TPipelineState:
@@ -110,6 +253,9 @@ def migrate_state(pipeline_name: str, state: DictStrAny, from_engine: int, to_en
     if from_engine == 1 and to_engine > 1:
         state["_local"] = {}
         from_engine = 2
+    if from_engine == 2 and to_engine > 2:
+        # state in the destination is stored in shards, the state itself did not change
+        from_engine = 3
 
     # check state engine
     state["_state_engine_version"] = from_engine
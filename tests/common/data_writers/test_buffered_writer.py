@@ -219,3 +219,61 @@ def test_writer_items_count_arrow() -> None:
         writer._flush_items()
         assert writer._buffered_items_count == 0
         assert writer._writer.items_count == 7
+
+
+@pytest.mark.parametrize("writer_format", ["insert_values", "jsonl"])
+@pytest.mark.parametrize("compression_level", [1, 9])
+def test_writer_background_compression(writer_format: TLoaderFileFormat, compression_level: int) -> None:
+    c1 = {"col1": new_column("col1", "bigint"), "col2": new_column("col2", "text")}
+    rows = [{"col1": i, "col2": "value" * (i % 10)} for i in range(10000)]
+
+    def _write(background_compression: bool) -> str:
+        writer = BufferedDataWriter(
+            writer_format,
+            os.path.join(TEST_STORAGE_ROOT, f"{writer_format}_{background_compression}.%s"),
+            buffer_max_items=1000,
+            compression_level=compression_level,
+            background_compression=background_compression,
+            _caps=DestinationCapabilitiesContext.generic_capabilities(writer_format)
+        )
+        with writer:
+            for i in range(0, len(rows), 100):
+                writer.write_data_item(rows[i:i + 100], columns=c1)
+        assert len(writer.closed_files) == 1
+        return writer.closed_files[0]
+
+    bg_file = _write(True)
+    # regular gzip file is produced
+    assert FileStorage.is_gzipped(bg_file)
+    with FileStorage.open_zipsafe_ro(bg_file, "rb") as f:
+        bg_content = f.read()
+    with FileStorage.open_zipsafe_ro(_write(False), "rb") as f:
+        assert bg_content == f.read()
+
+
+@pytest.mark.parametrize("writer_format", ["insert_values", "jsonl"])
+def test_writer_background_compression_rotation(writer_format: TLoaderFileFormat) -> None:
+    c1 = {"col1": new_column("col1", "text")}
+    writer = BufferedDataWriter(
+        writer_format,
+        os.path.join(TEST_STORAGE_ROOT, f"{writer_format}.%s"),
+        buffer_max_items=100,
+        file_max_bytes=100000,
+        background_compression=True,
+        _caps=DestinationCapabilitiesContext.generic_capabilities(writer_format)
+    )
+    with writer:
+        # compressed file is not seekable but tells the uncompressed position, also in text mode
+        writer.write_data_item([{"col1": "x" * 100}] * 100, columns=c1)
+        assert writer._file.seekable() is False
+        assert writer._file.tell() > 10000
+        for _ in range(99):
+            writer.write_data_item([{"col1": "x" * 100}] * 100, columns=c1)
+    # files rotated on uncompressed size
+    assert len(writer.closed_files) > 1
+    lines = 0
+    for file_name in writer.closed_files:
+        with FileStorage.open_zipsafe_ro(file_name, "rb") as f:
+            lines += len(f.readlines())
+    # insert values files have a header line
+    assert lines == 10000 + (2 * len(writer.closed_files) if writer_format == "insert_values" else 0)
@@ -3,11 +3,13 @@ import pytest
 from typing import Iterator
 
 from dlt.common import pendulum, json
+from dlt.common.arithmetics import Decimal
+from dlt.common.wei import Wei
 from dlt.common.typing import AnyFun
 # from dlt.destinations.postgres import capabilities
 from dlt.destinations.redshift import capabilities as redshift_caps
-from dlt.common.data_writers.escape import escape_redshift_identifier, escape_bigquery_identifier, escape_redshift_literal, escape_postgres_literal, escape_duckdb_literal
-from dlt.common.data_writers.writers import DataWriter, InsertValuesWriter, JsonlWriter, ParquetDataWriter
+from dlt.common.data_writers.escape import escape_redshift_identifier, escape_bigquery_identifier, escape_redshift_literal, escape_postgres_literal, escape_duckdb_literal, escape_mssql_literal, get_typed_literal_escaper
+from dlt.common.data_writers.writers import DataWriter, InsertValuesWriter, JsonlWriter, JsonlListPUAEncodeWriter, ParquetDataWriter
 
 from tests.common.utils import load_json_case, row_to_column_schemas
 
@@ -52,6 +54,20 @@ def test_simple_jsonl_writer(jsonl_writer: _BytesIOWriter) -> None:
     assert len(lines) == 3
 
 
+@pytest.mark.parametrize("n_rows", [0, 1, 1000, 1001, 2500])
+def test_jsonl_pua_writer_slices(n_rows: int) -> None:
+    rows = [{"idx": i, "decimal": Decimal(i), "dt": pendulum.datetime(2023, 1, 1)} for i in range(n_rows)]
+    with io.BytesIO() as f:
+        writer = JsonlListPUAEncodeWriter(f)
+        writer.write_all(None, rows)
+        writer.write_data(rows)
+        lines = f.getvalue().split(b"\n")
+    # every chunk of rows is a single line
+    assert lines[-1] == b''
+    assert [json.typed_loadb(line) for line in lines[:-1]] == [rows, rows]
+    assert writer.items_count == n_rows * 2
+
+
 def test_bytes_insert_writer(insert_writer: _StringIOWriter) -> None:
     rows = [{"bytes": b"bytes"}]
     insert_writer.write_all(row_to_column_schemas(rows[0]), rows)
@@ -108,6 +124,20 @@ def test_string_complex_escape(escaper: AnyFun) -> None:
         assert escaped == escaper(json.dumps(doc))
 
 
+@pytest.mark.parametrize("escaper", ALL_LITERAL_ESCAPE + [escape_mssql_literal])
+def test_typed_literal_escape(escaper: AnyFun) -> None:
+    values = [
+        None, True, False, 0, -1, 2**64, 1.5, float("inf"), Decimal("1.2500"), Wei(10**30), "", "it's\n\\ \r\t",
+        "イロハニホヘト", b"bytes", pendulum.datetime(2022, 7, 27, 13, 30, 2, 575267), pendulum.date(1974, 8, 11),
+        pendulum.time(12, 1, 2), {"complex": [1, "a"]}, [1, 2],
+    ]
+    for data_type in ["text", "bool", "bigint", "double", "decimal", "wei", "timestamp", "date", "time", "complex", "binary"]:
+        typed_escaper = get_typed_literal_escaper(escaper, data_type)
+        # any value, also of unexpected type, must be escaped exactly like the generic escaper does
+        for v in values:
+            assert typed_escaper(v) == escaper(v), (data_type, v)
+
+
 def test_identifier_escape() -> None:
     assert escape_redshift_identifier(", NULL'); DROP TABLE\" -\\-") == '", NULL\'); DROP TABLE"" -\\\\-"'
 
@@ -122,3 +152,67 @@ def test_string_literal_escape_unicode() -> None:
     assert escape_redshift_literal("イロハニホヘト チリヌルヲ ワカヨタレソ ツネナラム") == "'イロハニホヘト チリヌルヲ ワカヨタレソ ツネナラム'"
     assert escape_redshift_identifier("ąćł\"") == '"ąćł"""'
     assert escape_redshift_identifier("イロハニホヘト チリヌルヲ \"ワカヨタレソ ツネナラム") == '"イロハニホヘト チリヌルヲ ""ワカヨタレソ ツネナラム"'
+
+
+def test_arrow_insert_writer(insert_writer: _StringIOWriter) -> None:
+    pa = pytest.importorskip("pyarrow")
+    rows = load_json_case("simple_row")
+    columns = row_to_column_schemas(rows[0])
+    # write python rows for reference
+    with io.StringIO() as f:
+        py_writer = InsertValuesWriter(f, caps=redshift_caps())
+        py_writer.write_all(columns, rows + rows)
+        expected = f.getvalue()
+    # arrow tables mixed with python rows, columns in different order and missing
+    table = pa.Table.from_pylist(rows)
+    table = table.select(list(reversed(table.schema.names)))
+    insert_writer.write_all(columns, [table, *rows])
+    assert insert_writer._f.getvalue() == expected
+    assert insert_writer.items_count == 4
+
+
+def test_arrow_insert_writer_missing_columns(insert_writer: _StringIOWriter) -> None:
+    pa = pytest.importorskip("pyarrow")
+    rows = [{"a": 1, "b": "x"}, {"a": 2, "b": None}]
+    insert_writer.write_all({"a": {"name": "a", "data_type": "bigint"}, "b": {"name": "b", "data_type": "text"}, "c": {"name": "c", "data_type": "text"}}, [pa.Table.from_pylist(rows)])
+    lines = insert_writer._f.getvalue().split("\n")
+    assert lines[2:] == ["(1,'x',NULL),", "(2,NULL,NULL);"]
+
+
+def test_arrow_insert_writer_unknown_columns(insert_writer: _StringIOWriter) -> None:
+    pa = pytest.importorskip("pyarrow")
+    # columns not in the header are skipped, also when no column is known
+    table = pa.Table.from_pylist([{"a": 1, "flag": True, "unknown": "x"}, {"a": None, "flag": None, "unknown": "y"}])
+    insert_writer.write_all(
+        {"a": {"name": "a", "data_type": "bigint"}, "flag": {"name": "flag", "data_type": "bool"}},
+        [table, table.select(["unknown"])]
+    )
+    lines = insert_writer._f.getvalue().split("\n")
+    assert lines[2:] == ["(1,True),", "(NULL,NULL),", "(NULL,NULL),", "(NULL,NULL);"]
+
+
+def test_arrow_jsonl_writer(jsonl_writer: _BytesIOWriter) -> None:
+    pa = pytest.importorskip("pyarrow")
+    rows = load_json_case("simple_row")
+    table = pa.Table.from_pylist(rows)
+    jsonl_writer.write_all(None, [table, rows[0]])
+    lines = jsonl_writer._f.getvalue().split(b"\n")
+    assert lines[-1] == b''
+    assert [json.loadb(line) for line in lines[:-1]] == table.to_pylist() + [rows[0]]
+    assert jsonl_writer.items_count == 3
+
+    # integer and boolean columns formatted by arrow, table with many chunks
+    jsonl_writer._f.seek(0)
+    jsonl_writer._f.truncate()
+    table = pa.concat_tables([pa.Table.from_pylist([{"id": 1, "flag": True, "name": "a"}, {"id": None, "flag": None, "name": None}])] * 2)
+    jsonl_writer.write_data([table])
+    assert jsonl_writer._f.getvalue() == b'{"id":1,"flag":true,"name":"a"}\n{"id":null,"flag":null,"name":null}\n' * 2
+
+    # batches are joined in slices, also when the table starts at an offset
+    jsonl_writer._f.seek(0)
+    jsonl_writer._f.truncate()
+    rows = [{"id": i, "name": str(i)} for i in range(25)]
+    table = pa.Table.from_pylist(rows).slice(3)
+    jsonl_writer.ARROW_SLICE_SIZE = 7
+    jsonl_writer.write_data([table])
+    assert [json.loadb(line) for line in jsonl_writer._f.getvalue().split(b"\n")[:-1]] == rows[3:]
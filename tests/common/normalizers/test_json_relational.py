@@ -90,6 +90,44 @@ def test_preserve_complex_value_with_hint(norm: RelationalNormalizer) -> None:
     assert "value__complex" not in flattened_row
 
 
+def test_complex_type_cache_invalidation(norm: RelationalNormalizer) -> None:
+    row = {
+        "value": {"complex": True}
+    }
+    flattened_row, _ = norm._flatten("any_table", row, 0)  # type: ignore[arg-type]
+    assert "value__complex" in flattened_row
+    assert norm._complex_types["any_table"]["value"] is False
+
+    # changing preferred types drops the cached decisions
+    norm.schema._settings.setdefault("preferred_types", {})[TSimpleRegex("re:^value$")] = "complex"
+    norm.schema._compile_settings()
+    assert norm._complex_types == {}
+    flattened_row, _ = norm._flatten("any_table", row, 0)  # type: ignore[arg-type]
+    assert flattened_row["value"] == row["value"]  # type: ignore[typeddict-item]
+
+    # updating a table drops decisions cached for it
+    table = new_table("other_table", columns=[{"name": "value", "data_type": "text", "nullable": True}])
+    flattened_row, _ = norm._flatten("other_table", row, 0)  # type: ignore[arg-type]
+    assert norm._complex_types["other_table"]["value"] is True
+    norm.schema.update_table(table)
+    assert "other_table" not in norm._complex_types
+    flattened_row, _ = norm._flatten("other_table", row, 0)  # type: ignore[arg-type]
+    assert "value__complex" in flattened_row
+
+
+def test_child_names_cache(norm: RelationalNormalizer) -> None:
+    norm._flatten("any_table", {"value": {"complex": True}}, 0)  # type: ignore[arg-type]
+    assert norm._child_names[((), "value")] == ("value", "value", "value")
+    assert norm._child_names[(("value",), "complex")] == ("complex", "value__complex", "complex")
+    # settings change drops cached names
+    norm.schema._compile_settings()
+    assert norm._child_names == {}
+    # cache is bounded
+    norm.CHILD_NAMES_CACHE_SIZE = 2
+    norm._flatten("any_table", {"a": 1, "b": 2, "c": 3}, 0)  # type: ignore[arg-type]
+    assert list(norm._child_names) == [((), "c")]
+
+
 def test_child_table_linking(norm: RelationalNormalizer) -> None:
     row = {
         "f": [{
@@ -150,6 +150,29 @@ def test_coerce_row(schema: Schema) -> None:
     assert not isinstance(exc_val.value.coerced_value, bytes)
 
 
+def test_coerce_row_plan(schema: Schema) -> None:
+    row = {"id": 1, "name": "a", "value": 1.5, "payload": {"a": 1}}
+    _, new_table = schema.coerce_row("event_user", None, row)
+    schema.update_table(new_table)
+    # plan compiled when coercing against existing columns
+    assert schema.coerce_row("event_user", None, row) == (row, None)
+    plan = schema._coerce_plans["event_user"][1]
+    assert plan == {("id", int), ("name", str), ("value", float)}
+    # values of other types are still coerced
+    assert schema.coerce_row("event_user", None, {"id": "2", "value": 2}) == ({"id": 2, "value": 2.0}, None)
+    # variant is created for value that cannot be coerced
+    new_row, new_table = schema.coerce_row("event_user", None, {"id": "two"})
+    assert new_row == {"id__v_text": "two"}
+    # adding columns invalidates the plan
+    schema.update_table(new_table)
+    assert "event_user" not in schema._coerce_plans
+    assert schema.coerce_row("event_user", None, {"id": 1, "id__v_text": "two"}) == ({"id": 1, "id__v_text": "two"}, None)
+    assert schema._coerce_plans["event_user"][1] == {("id", int), ("id__v_text", str)}
+    # plan is not used for replaced tables
+    schema._schema_tables["event_user"] = utils.new_table("event_user", columns=[{"name": "id", "data_type": "text", "nullable": True}])
+    assert schema.coerce_row("event_user", None, {"id": 1}) == ({"id": "1"}, None)
+
+
 def test_coerce_row_iso_timestamp(schema: Schema) -> None:
     _add_preferred_types(schema)
     timestamp_str = "2022-05-10T00:17:15.300000+00:00"
@@ -122,3 +122,35 @@ def test_version_preserve_on_reload(remove_defaults: bool) -> None:
     saved_rasa_schema = Schema.from_dict(yaml.safe_load(rasa_yml))
     assert saved_rasa_schema.stored_version == rasa_schema.stored_version
     assert saved_rasa_schema.stored_version_hash == rasa_schema.stored_version_hash
+
+
+def test_version_hash_reuses_dumped_tables() -> None:
+    eth_v6: TStoredSchema = load_yml_case("schemas/eth/ethereum_schema_v6")
+    schema = Schema.from_dict(eth_v6)  # type: ignore[arg-type]
+    version_hash = schema.version_hash
+    assert set(schema._dumped_tables.keys()) == set(schema.tables.keys())
+    # hash is the same as computed from the full document
+    assert utils.generate_version_hash(schema.to_dict()) == version_hash
+    dumped_blocks = schema._dumped_tables["blocks"]
+    assert schema.version_hash == version_hash
+    assert schema._dumped_tables["blocks"] is dumped_blocks
+
+    # update table via schema
+    row = {"floatX": 78172.128}
+    _, new_table = schema.coerce_row("blocks", None, row)
+    schema.update_table(new_table)
+    assert "blocks" not in schema._dumped_tables
+    assert schema.version_hash != version_hash
+    assert schema.version == eth_v6["version"] + 1
+    assert utils.generate_version_hash(schema.to_dict()) == schema.version_hash
+
+    # modify table in place
+    version_hash = schema.version_hash
+    schema.tables["blocks"]["write_disposition"] = "merge"
+    assert schema.version_hash != version_hash
+    assert utils.generate_version_hash(schema.to_dict()) == schema.version_hash
+    # drop table
+    version_hash = schema.version_hash
+    schema.tables.pop("blocks__transactions__logs")
+    assert schema.version_hash != version_hash
+    assert utils.generate_version_hash(schema.to_dict()) == schema.version_hash
@@ -159,6 +159,34 @@ def test_retry_job(storage: LoadStorage) -> None:
     assert LoadStorage.parse_job_file_name(new_fp).retry_count == 2
 
 
+def test_jobs_index(storage: LoadStorage) -> None:
+    load_id, fn = start_loading_file(storage, "test file")  # type: ignore[arg-type]
+    # index is built from disk
+    assert load_id not in storage._jobs_index
+    assert storage.list_job_states_for_table(load_id, "mock_table") == [("started_jobs", LoadStorage.parse_job_file_name(fn))]
+    assert storage.list_job_states_for_table(load_id, "unknown_table") == []
+    # index follows the job
+    new_fp = storage.retry_job(load_id, fn)
+    fn = Path(new_fp).name
+    assert storage.list_job_states_for_table(load_id, "mock_table") == [("new_jobs", LoadStorage.parse_job_file_name(fn))]
+    storage.start_job(load_id, fn)
+    storage.fail_job(load_id, fn, "EXCEPTION")
+    assert storage.list_job_states_for_table(load_id, "mock_table") == [("failed_jobs", LoadStorage.parse_job_file_name(fn))]
+    # new job added to the package
+    followup_fn = storage.build_job_file_name("other_table", uniq_id())
+    storage.add_new_job(load_id, storage.storage.save(followup_fn, "followup"), "started_jobs")
+    storage.complete_job(load_id, followup_fn)
+    assert storage.list_job_states_for_table(load_id, "other_table") == [("completed_jobs", LoadStorage.parse_job_file_name(followup_fn))]
+    # index is the same as rebuilt from disk
+    jobs_index = storage._jobs_index[load_id]
+    storage._drop_jobs_index(load_id)
+    assert storage.list_job_states_for_table(load_id, "mock_table") == [("failed_jobs", LoadStorage.parse_job_file_name(fn))]
+    assert storage._jobs_index[load_id] == jobs_index
+    # index dropped when package completes
+    storage.complete_load_package(load_id, False)
+    assert load_id not in storage._jobs_index
+
+
 def test_build_parse_job_path(storage: LoadStorage) -> None:
     file_id = uniq_id(5)
     f_n_t = ParsedLoadJobFileName("test_table", file_id, 0, "jsonl")
@@ -6,7 +6,7 @@ import pytest
 
 from dlt.common import json, Decimal, pendulum
 from dlt.common.arithmetics import numeric_default_context
-from dlt.common.json import _DECIMAL, _WEI, custom_pua_decode, _orjson, _simplejson, SupportsJson, _DATETIME
+from dlt.common.json import _DECIMAL, _WEI, custom_pua_decode, custom_pua_encode, _orjson, _simplejson, SupportsJson, _DATETIME
 
 from tests.utils import autouse_test_storage, TEST_STORAGE_ROOT
 from tests.cases import JSON_TYPED_DICT, JSON_TYPED_DICT_DECODED, JSON_TYPED_DICT_NESTED, JSON_TYPED_DICT_NESTED_DECODED
@@ -250,6 +250,29 @@ def test_json_typed_encode(json_impl: SupportsJson) -> None:
     assert d_d == JSON_TYPED_DICT_DECODED
 
 
+def test_custom_pua_encode_types() -> None:
+    import datetime  # noqa: I251
+    from uuid import uuid4
+    from hexbytes import HexBytes
+    from dlt.common.wei import Wei
+
+    class DecimalSubclass(Decimal):
+        pass
+
+    uuid = uuid4()
+    # exact types and subclasses are encoded the same way and decode back
+    for value in [
+        Decimal("1.25"), DecimalSubclass("1.25"), Wei(10**30), pendulum.datetime(2023, 1, 1, 12), datetime.datetime(2023, 1, 1, 12, tzinfo=datetime.timezone.utc),
+        pendulum.date(2023, 1, 1), datetime.date(2023, 1, 1), pendulum.time(12, 1), datetime.time(12, 1), uuid, HexBytes(b"abc"), b"abc"
+    ]:
+        encoded = custom_pua_encode(value)
+        decoded = custom_pua_decode(encoded)
+        assert decoded == value
+        assert isinstance(decoded, Wei) == isinstance(value, Wei)
+        assert isinstance(decoded, HexBytes) == isinstance(value, HexBytes)
+    assert custom_pua_encode(DecimalSubclass("1.25")) == custom_pua_encode(Decimal("1.25")) == _DECIMAL + "1.25"
+
+
 def test_load_and_compare_all_impls() -> None:
     with open(json_case_path("rasa_event_bot_metadata"), "rb") as f:
         content_b = f.read()
@@ -2,7 +2,7 @@ from copy import deepcopy
 
 import pyarrow as pa
 
-from dlt.common.libs.pyarrow import py_arrow_to_table_schema_columns, get_py_arrow_datatype
+from dlt.common.libs.pyarrow import py_arrow_to_table_schema_columns, get_py_arrow_datatype, constant_dictionary_array
 from dlt.common.destination import DestinationCapabilitiesContext
 from tests.cases import TABLE_UPDATE_COLUMNS_SCHEMA
 
@@ -49,3 +49,15 @@ def test_py_arrow_to_table_schema_columns():
 
     # Resulting schema should match the original
     assert result == dlt_schema
+
+
+def test_constant_dictionary_array():
+    arr = constant_dictionary_array("1234.567", 3, pa.string())
+    assert arr.type == pa.dictionary(pa.int8(), pa.string())
+    assert arr.to_pylist() == ["1234.567"] * 3
+    # single dictionary entry regardless of the row count
+    assert len(arr.dictionary) == 1
+    assert len(constant_dictionary_array("x", 0)) == 0
+    # can be appended to a table like any other column
+    tbl = pa.table({"a": [1, 2, 3]}).append_column(pa.field("_dlt_load_id", arr.type, nullable=False), arr)
+    assert tbl.column("_dlt_load_id").to_pylist() == ["1234.567"] * 3
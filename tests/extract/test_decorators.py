@@ -1,4 +1,5 @@
 import os
+import asyncio
 from typing import List, Optional, Dict, Iterator, Any, cast
 
 import pytest
@@ -300,6 +301,26 @@ def test_resource_name_from_generator() -> None:
     assert r.section == "test_decorators"
 
 
+def test_async_generator_resource() -> None:
+    @dlt.resource
+    async def async_pages(pages: int = 3):
+        for page in range(pages):
+            await asyncio.sleep(0.01)
+            yield [{"page": page}]
+
+    assert list(async_pages) == [{"page": 0}, {"page": 1}, {"page": 2}]
+    # bind arguments
+    assert list(async_pages(2)) == [{"page": 0}, {"page": 1}]
+
+    # async generator object is a valid resource
+    async def some_data():
+        yield [1, 2, 3]
+
+    r = dlt.resource(some_data())
+    assert r.name == "some_data"
+    assert list(r) == [1, 2, 3]
+
+
 def test_source_sections() -> None:
     # source in __init__.py of module
     from tests.extract.cases.section_source import init_source_f_1, init_resource_f_2
@@ -1,3 +1,7 @@
+from typing import List
+
+import pytest
+
 import dlt
 from dlt.common import json
 from dlt.common.storages import NormalizeStorageConfiguration
@@ -110,3 +114,97 @@ def test_extract_renamed_clone_and_parent():
     assert "tx_clone" in schema_update
     # mind that pipe name of the evaluated parent will have different name than the resource
     assert source.tx_clone._pipe.parent.name == "input_gen_tx_clone"
+
+
+def test_extract_background_writer() -> None:
+    @dlt.resource(table_name=lambda i: ("odd" if i % 2 == 1 else "even") + "_table")
+    def numbers(_range):
+        yield from range(_range)
+
+    clean_test_storage()
+    source = DltSource("selectables", "module", dlt.Schema("selectables"), [numbers(10)])
+    storage = ExtractorStorage(NormalizeStorageConfiguration(), background_writer=True, background_writer_queue_size=2)
+    extract_id = storage.create_extract_id()
+    schema_update = extract(extract_id, source, storage)
+    assert set(schema_update) == {"odd_table", "even_table"}
+    # writer thread was stopped when writers got closed
+    assert storage._writer_thread is None
+    storage.commit_extract_files(extract_id)
+    expect_extracted_file(storage, "selectables", "odd_table", json.dumps([1,3,5,7,9]))
+    expect_extracted_file(storage, "selectables", "even_table", json.dumps([0,2,4,6,8]))
+
+    # exception in writer thread is raised in extract
+    def failing_write(*args, **kwargs):
+        raise RuntimeError("disk full")
+
+    clean_test_storage()
+    source = DltSource("selectables", "module", dlt.Schema("selectables"), [numbers(10)])
+    storage = ExtractorStorage(NormalizeStorageConfiguration(), background_writer=True)
+    for item_storage in storage._item_storages.values():
+        item_storage.get_writer = lambda *args: type("FailingWriter", (), {"write_data_item": failing_write})()  # type: ignore[method-assign]
+    extract_id = storage.create_extract_id()
+    with pytest.raises(RuntimeError, match="disk full"):
+        extract(extract_id, source, storage)
+    assert storage._writer_thread is None
+
+    # writer thread is stopped when extraction is interrupted
+    @dlt.resource
+    def interrupted():
+        yield from range(5)
+        raise KeyboardInterrupt()
+
+    clean_test_storage()
+    source = DltSource("selectables", "module", dlt.Schema("selectables"), [interrupted()])
+    storage = ExtractorStorage(NormalizeStorageConfiguration(), background_writer=True)
+    extract_id = storage.create_extract_id()
+    with pytest.raises(KeyboardInterrupt):
+        extract(extract_id, source, storage)
+    assert storage._writer_thread is None
+
+
+def test_extract_dynamic_tables_partitions() -> None:
+    @dlt.resource(table_name=lambda i: i["type"], primary_key=lambda i: i["pk"])
+    def events():
+        yield [{"type": "click", "pk": "id", "id": 1}, {"type": "view", "pk": "id", "id": 2}, {"type": "click", "pk": "id", "id": 3}]
+        yield {"type": "view", "pk": "view_id", "id": 4}
+
+    clean_test_storage()
+    source = DltSource("events", "module", dlt.Schema("events"), [events()])
+    storage = ExtractorStorage(NormalizeStorageConfiguration())
+    extract_id = storage.create_extract_id()
+    schema_update = extract(extract_id, source, storage)
+    assert set(schema_update) == {"click", "view"}
+    # primary key hints got merged
+    view_table = schema_update["view"][0]
+    assert view_table["columns"]["id"]["primary_key"] is True
+    assert view_table["columns"]["view_id"]["primary_key"] is True
+    storage.commit_extract_files(extract_id)
+    # both click events written with a single call
+    assert [[i["id"] for i in json.loads(line)] for line in _extracted_lines(storage, "events", "click")] == [[1, 3]]
+
+
+def test_extract_arrow_dynamic_tables() -> None:
+    pa = pytest.importorskip("pyarrow")
+
+    @dlt.resource(table_name=lambda t: "table_" + str(t.num_rows))
+    def arrow_tables():
+        yield pa.table({"id": [1, 2], "Value": ["a", "b"]})
+        yield [pa.table({"id": [3]}), pa.table({"id": [4, 5], "Value": ["c", "d"]})]
+
+    clean_test_storage()
+    source = DltSource("arrow", "module", dlt.Schema("arrow"), [arrow_tables()])
+    storage = ExtractorStorage(NormalizeStorageConfiguration())
+    extract_id = storage.create_extract_id()
+    schema_update = extract(extract_id, source, storage)
+    assert set(schema_update) == {"table_1", "table_2"}
+    # arrow columns are present in dynamic tables with normalized names
+    assert list(schema_update["table_2"][0]["columns"]) == ["id", "value"]
+    assert schema_update["table_2"][0]["columns"]["id"]["data_type"] == "bigint"
+
+
+def _extracted_lines(storage: ExtractorStorage, schema_name: str, table_name: str) -> List[str]:
+    file = next(
+        file for file in storage.list_files_to_normalize_sorted()
+        if storage.get_schema_name(file) == schema_name and storage.parse_normalize_file_name(file).table_name == table_name
+    )
+    return storage.storage.load(file).splitlines()  # type: ignore[no-any-return]
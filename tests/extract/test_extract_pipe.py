@@ -95,6 +95,83 @@ def test_rotation_on_none() -> None:
     assert time.time() - started < 0.8
 
 
+def test_async_generator_pipes() -> None:
+
+    async def async_gen(start: int):
+        for i in range(start, start + 3):
+            await asyncio.sleep(0.2)
+            yield i
+
+    def get_pipes():
+        return [
+            Pipe.from_data("data1", async_gen(0)),
+            Pipe.from_data("data2", async_gen(10)),
+            Pipe.from_data("data3", async_gen(20)),
+        ]
+
+    for mode in ["fifo", "round_robin"]:
+        started = time.time()
+        _l = list(PipeIterator.from_pipes(get_pipes(), next_item_mode=mode))  # type: ignore[arg-type]
+        # items of each generator come in order
+        for pipe_name, start in [("data1", 0), ("data2", 10), ("data3", 20)]:
+            assert [pi.item for pi in _l if pi.pipe.name == pipe_name] == list(range(start, start + 3))
+        # generators were evaluated concurrently
+        assert time.time() - started < 1.5
+
+    # async generator returned by a transformer is also evaluated
+    async def async_transformer(item: int):
+        for _ in range(2):
+            await asyncio.sleep(0.01)
+            yield item
+
+    p = Pipe.from_data("data", [1, 2])
+    p.append_step(async_transformer)  # type: ignore[arg-type]
+    assert sorted(_f_items(list(PipeIterator.from_pipe(p)))) == [1, 1, 2, 2]
+
+
+def test_async_generator_closed() -> None:
+    closed = False
+
+    async def infinite_gen():
+        nonlocal closed
+        try:
+            while True:
+                await asyncio.sleep(0.05)
+                yield 1
+        finally:
+            closed = True
+
+    # async generator is closed when pipe iterator closes early
+    with PipeIterator.from_pipe(Pipe.from_data("infinite", infinite_gen())) as pipe_iter:
+        assert next(pipe_iter).item == 1
+    assert closed is True
+
+
+def test_futures_wake_up_on_done() -> None:
+
+    @dlt.defer
+    def deferred(item: int) -> int:
+        time.sleep(0.05)
+        return item
+
+    async def awaitable(item: int) -> int:
+        await asyncio.sleep(0.05)
+        return item
+
+    def get_pipes():
+        return [
+            Pipe.from_data("deferred", [deferred(i) for i in range(10)]),
+            Pipe.from_data("awaitable", [awaitable(i) for i in range(10, 20)]),
+        ]
+
+    # poll interval is much longer than evaluation of all the futures
+    started = time.time()
+    _l = list(PipeIterator.from_pipes(get_pipes(), futures_poll_interval=5.0, max_parallel_items=4))
+    assert sorted(_f_items(_l)) == list(range(20))
+    # iterator did not wait for poll interval to pick up the done futures
+    assert time.time() - started < 3.0
+
+
 def test_add_step() -> None:
     data = [1, 2, 3]
     data_iter = iter(data)
@@ -20,6 +20,7 @@ from dlt.common.json import json
 from dlt.extract.source import DltSource
 from dlt.sources.helpers.transform import take_first
 from dlt.extract.incremental import IncrementalCursorPathMissing, IncrementalPrimaryKeyMissing
+from dlt.extract.incremental.transform import JsonIncremental
 from dlt.pipeline.exceptions import PipelineStepFailed
 
 from tests.extract.utils import AssertItems, data_to_item_format, TItemFormat, ALL_ITEM_FORMATS, data_item_to_list
@@ -434,6 +435,47 @@ def test_cursor_datetime_type(item_type: TItemFormat) -> None:
     assert s['last_value'] == initial_value + timedelta(minutes=4)
 
 
+@pytest.mark.parametrize("item_type", ALL_ITEM_FORMATS)
+def test_new_rows_with_last_value_are_deduplicated(item_type: TItemFormat) -> None:
+    data = [
+        [{'created_at': 1, 'id': 'a'}, {'created_at': 2, 'id': 'b'}],
+        [{'created_at': 2, 'id': 'b'}, {'created_at': 2, 'id': 'c'}],
+        [{'created_at': 2, 'id': 'b'}, {'created_at': 2, 'id': 'c'}],
+    ]
+
+    @dlt.resource
+    def some_data(run: int, created_at=dlt.sources.incremental('created_at')):
+        yield from data_to_item_format(item_type, data[run])
+
+    p = dlt.pipeline(pipeline_name=uniq_id())
+    p.extract(some_data(0))
+    # row with the same last value is added and its hash stored
+    p.extract(some_data(1))
+    assert list(some_data(2)) == []
+
+    s = p.state["sources"][p.default_schema_name]['resources']['some_data']['incremental']['created_at']
+    # hashes are the same for all item formats
+    assert sorted(s['unique_hashes']) == sorted(
+        digest128(json.dumps(row, sort_keys=True)) for row in data[1]
+    )
+
+
+def test_json_incremental_unique_hashes_index() -> None:
+    state = {"initial_value": None, "last_value": None, "unique_hashes": []}
+    transform = JsonIncremental("some_data", "created_at", None, None, state, max, "id")
+    rows = [{"created_at": 1, "id": i} for i in range(100)]
+    assert [transform(row)[0] for row in rows] == rows
+    # all rows with the last value are kept in the state and index
+    assert len(state["unique_hashes"]) == 100
+    assert transform.unique_hashes_index() == set(state["unique_hashes"])
+    assert all(transform(row)[0] is None for row in rows)
+    # hashes replaced in state are picked up by the index
+    state["unique_hashes"] = [digest128(json.dumps(0))]
+    assert transform({"created_at": 1, "id": 0})[0] is None
+    assert transform({"created_at": 1, "id": 1})[0] == {"created_at": 1, "id": 1}
+    assert len(state["unique_hashes"]) == 2
+
+
 @pytest.mark.parametrize("item_type", ALL_ITEM_FORMATS)
 def test_descending_order_unique_hashes(item_type: TItemFormat) -> None:
     """Resource returns items in descending order but using `max` last value function.
@@ -1085,6 +1127,54 @@ def test_out_of_range_flags(item_type: TItemFormat) -> None:
 
     pipeline.extract(ascending_single_item())
 
+
+@pytest.mark.parametrize("item_type", ALL_ITEM_FORMATS)
+@pytest.mark.parametrize("last_value_func", [max, min])
+def test_row_order_closes_resource(item_type: TItemFormat, last_value_func: Any) -> None:
+    """Resource declaring items sorted by cursor is closed when no more items can be in range"""
+    yielded = []
+    closed = []
+
+    # for max the range is 10..40, for min it is 40..10
+    initial_value, end_value = (10, 40) if last_value_func is max else (40, 10)
+
+    @dlt.resource
+    def sorted_items(
+        row_order: str,
+        updated_at=dlt.sources.incremental('updated_at', initial_value=initial_value, end_value=end_value, last_value_func=last_value_func)
+    ) -> Any:
+        values = range(0, 100) if row_order == "asc" else reversed(range(0, 100))
+        try:
+            for chunk in chunks(list(values), 5):
+                yielded.extend(chunk)
+                yield data_to_item_format(item_type, [{'updated_at': i} for i in chunk])
+        except GeneratorExit:
+            closed.append(True)
+            raise
+
+    for row_order in ["asc", "desc"]:
+        yielded.clear()
+        closed.clear()
+        items = list(sorted_items(row_order, updated_at=dlt.sources.incremental(last_value_func=last_value_func, row_order=row_order)))
+        assert sorted(chain.from_iterable(data_item_to_list(item_type, [item]) for item in items), key=lambda i: i['updated_at']) == [
+            {'updated_at': i} for i in range(min(initial_value, end_value) + int(last_value_func is min), max(initial_value, end_value) + int(last_value_func is min))
+        ]
+        # generator closed right after the first chunk with an item out of range
+        assert closed == [True]
+        if row_order == "asc":
+            # chunk 40..44 contains the end value (max) or a value above initial value (min)
+            assert max(yielded) == 44
+        else:
+            # chunk 9..5 contains a value below initial value (max), chunk 14..10 contains the end value (min)
+            assert min(yielded) == (5 if last_value_func is max else 10)
+
+    # without row order all items are requested
+    yielded.clear()
+    closed.clear()
+    list(sorted_items("asc", updated_at=dlt.sources.incremental(last_value_func=last_value_func)))
+    assert len(yielded) == 100
+    assert closed == []
+
 @pytest.mark.parametrize("item_type", ALL_ITEM_FORMATS)
 def test_get_incremental_value_type(item_type: TItemFormat) -> None:
     assert dlt.sources.incremental("id").get_incremental_value_type() is Any
@@ -1,4 +1,7 @@
 import itertools
+import os
+import threading
+import time
 from typing import Iterator
 
 import pytest
@@ -9,9 +12,11 @@ from dlt.common.exceptions import DictValidationException, PipelineStateNotAvail
 from dlt.common.pipeline import StateInjectableContext, source_state
 from dlt.common.schema import Schema
 from dlt.common.typing import TDataItems
-from dlt.extract.exceptions import DataItemRequiredForDynamicTableHints, InconsistentTableTemplate, InvalidParentResourceDataType, InvalidParentResourceIsAFunction, InvalidResourceDataTypeMultiplePipes, InvalidTransformerDataTypeGeneratorFunctionRequired, InvalidTransformerGeneratorFunction, ParametrizedResourceUnbound, ResourcesNotFoundError
+from dlt.common.utils import uniq_id
+from dlt.extract.exceptions import DataItemRequiredForDynamicTableHints, InconsistentTableTemplate, InvalidParentResourceDataType, InvalidParentResourceIsAFunction, InvalidParallelResourceDataType, InvalidResourceDataTypeMultiplePipes, InvalidTransformerDataTypeGeneratorFunctionRequired, InvalidTransformerGeneratorFunction, ParametrizedResourceUnbound, ResourcesNotFoundError
 from dlt.extract.pipe import Pipe
-from dlt.extract.typing import FilterItem, MapItem
+from dlt.extract.typing import NO_ITEM_READY, FilterItem, MapItem
+from dlt.extract.utils import wrap_parallel_iterator
 from dlt.extract.source import DltResource, DltResourceDict, DltSource
 
 
@@ -771,6 +776,83 @@ def test_limit_source() -> None:
     assert list(infinite_source().add_limit(2)) == ['A', 'A', 0, 'A', 'A', 'A', 1] * 3
 
 
+def test_parallelized_resource() -> None:
+    threads = set()
+
+    def pages(page_count: int):
+        for page in range(page_count):
+            threads.add(threading.get_ident())
+            time.sleep(0.1)
+            yield page
+
+    @dlt.source
+    def parallel_source():
+        return dlt.resource(pages, name="pages_1", parallelized=True)(3), dlt.resource(pages(3), name="pages_2").parallelize()
+
+    # resources are advanced together in fifo mode
+    started = time.time()
+    items = list(parallel_source())
+    assert sorted(items) == [0, 0, 1, 1, 2, 2]
+    assert time.time() - started < 0.55
+    # generators were evaluated in a thread pool
+    assert threading.get_ident() not in threads
+
+    # resources are advanced together in round robin mode
+    os.environ["EXTRACT__NEXT_ITEM_MODE"] = "round_robin"
+    started = time.time()
+    assert sorted(parallel_source()) == [0, 0, 1, 1, 2, 2]
+    assert time.time() - started < 0.55
+
+    # limited resource may be parallelized
+    assert list(dlt.resource(itertools.count(), name="infinity").add_limit(5).parallelize()) == list(range(5))
+
+    # transformers and lists cannot be parallelized
+    with pytest.raises(InvalidParallelResourceDataType):
+        dlt.resource([1, 2, 3], name="list").parallelize()
+    with pytest.raises(InvalidParallelResourceDataType):
+        (dlt.resource([1, 2, 3], name="list") | dlt.transformer(name="tx")(pages)).parallelize()
+
+
+def test_parallelized_resource_close() -> None:
+    closed = threading.Event()
+    started = threading.Event()
+
+    def slow_pages():
+        try:
+            while True:
+                started.set()
+                time.sleep(0.2)
+                yield 1
+        finally:
+            closed.set()
+
+    gen = wrap_parallel_iterator(slow_pages())
+    next_item = next(gen)
+    worker = threading.Thread(target=next_item)
+    worker.start()
+    started.wait()
+    # wrapper has no item ready while next item is evaluated
+    assert next(gen) is NO_ITEM_READY
+    # closing the wrapper while item is evaluated closes wrapped generator when evaluation ends
+    gen.close()
+    assert not closed.is_set()
+    worker.join()
+    assert closed.is_set()
+
+
+def test_parallelized_resource_state() -> None:
+
+    @dlt.resource(parallelized=True)
+    def stateful_pages():
+        for page in range(3):
+            dlt.current.resource_state()["page"] = page
+            yield page
+
+    p = dlt.pipeline(pipeline_name="parallel_state_" + uniq_id(), destination="dummy")
+    p.extract(stateful_pages())
+    assert p.state["sources"][p.default_schema_name]["resources"]["stateful_pages"]["page"] == 2
+
+
 def test_source_state() -> None:
 
     @dlt.source
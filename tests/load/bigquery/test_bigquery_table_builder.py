@@ -1,6 +1,7 @@
 import pytest
 import sqlfluff
 from copy import deepcopy
+from unittest.mock import patch
 
 from dlt.common.utils import custom_environ, uniq_id
 from dlt.common.schema import Schema
@@ -122,3 +123,29 @@ def test_double_partition_exception(gcp_client: BigQueryClient) -> None:
     with pytest.raises(DestinationSchemaWillNotUpdate) as excc:
         gcp_client._get_table_update_sql("event_test_table", mod_update, False)
     assert excc.value.columns == ["`col4`", "`col5`"]
+
+
+def test_get_storage_tables_types(gcp_client: BigQueryClient) -> None:
+    # rows as returned by INFORMATION_SCHEMA.COLUMNS
+    rows = [
+        ("event_test_table", "col1", "INT64", "NO", "NO", None),
+        ("event_test_table", "col2", "NUMERIC(10, 2)", "YES", "NO", 1),
+        ("event_test_table", "col3", "ARRAY<STRING>", "NO", "NO", None),
+        ("event_test_table", "col4", "STRUCT<a INT64, b NUMERIC(10, 2)>", "YES", "NO", None),
+        ("event_test_table", "col5", "TIMESTAMP", "YES", "YES", None),
+    ]
+    with patch.object(gcp_client.sql_client, "execute_sql", return_value=rows):
+        exists, columns = gcp_client.get_storage_table("event_test_table")
+    assert exists is True
+    assert columns["col1"]["data_type"] == "bigint"
+    assert columns["col1"]["nullable"] is False
+    assert columns["col2"]["data_type"] == "decimal"
+    assert (columns["col2"]["precision"], columns["col2"]["scale"]) == (10, 2)
+    assert columns["col2"]["cluster"] is True
+    assert columns["col3"]["data_type"] == "complex"
+    assert columns["col4"]["data_type"] == "complex"
+    assert columns["col5"]["data_type"] == "timestamp"
+    assert columns["col5"]["partition"] is True
+
+    with patch.object(gcp_client.sql_client, "execute_sql", return_value=[]):
+        assert gcp_client.get_storage_table("event_test_table") == (False, {})
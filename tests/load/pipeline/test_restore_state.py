@@ -497,7 +497,11 @@ def test_restore_state_parallel_changes(destination_config: DestinationTestConfi
     ra_production_p.sync_destination()
     # state didn't change because production is ahead of local with its version
     # nevertheless this is potentially dangerous situation 🤷
-    assert ra_production_p.state == prod_state
+    # only the manifest of state shards stored in the destination is refreshed
+    ra_prod_state = ra_production_p.state
+    ra_prod_state["_local"].pop("_state_shards", None)
+    prod_state["_local"].pop("_state_shards", None)
+    assert ra_prod_state == prod_state
 
     # get all the states, notice version 4 twice (one from production, the other from local)
     try:
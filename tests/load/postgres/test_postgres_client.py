@@ -2,13 +2,16 @@ import os
 from typing import Iterator
 import pytest
 
-from dlt.common import pendulum, Wei
+from hexbytes import HexBytes
+
+from dlt.common import json, pendulum, Wei
 from dlt.common.configuration.resolve import resolve_configuration, ConfigFieldMissingException
 from dlt.common.storages import FileStorage
+from dlt.common.storages.load_storage import ParsedLoadJobFileName
 from dlt.common.utils import uniq_id
 
 from dlt.destinations.postgres.configuration import PostgresCredentials
-from dlt.destinations.postgres.postgres import PostgresClient
+from dlt.destinations.postgres.postgres import PostgresClient, PostgresCopyJob, _csv_encoder
 from dlt.destinations.postgres.sql_client import psycopg2
 
 from tests.utils import TEST_STORAGE_ROOT, delete_test_storage, skipifpypy, preserve_environ
@@ -79,3 +82,29 @@ def test_wei_value(client: PostgresClient, file_storage: FileStorage) -> None:
     insert_sql = "INSERT INTO {}(_dlt_id, _dlt_root_id, sender_id, timestamp, parse_data__metadata__rasa_x_id)\nVALUES\n"
     insert_values = f"('{uniq_id()}', '{uniq_id()}', '90238094809sajlkjxoiewjhduuiuehd', '{str(pendulum.now())}', {Wei.from_int256(2*256-1, 78)});"
     expect_load_file(client, file_storage, insert_sql+insert_values, user_table_name)
+
+
+def test_copy_jsonl_file(client: PostgresClient, file_storage: FileStorage) -> None:
+    user_table_name = prepare_table(client)
+    rows = [
+        {"_dlt_id": uniq_id(), "_dlt_root_id": uniq_id(), "sender_id": 'quoted "sender", with comma', "timestamp": str(pendulum.now())},
+        {"_dlt_id": uniq_id(), "_dlt_root_id": uniq_id(), "sender_id": "", "timestamp": str(pendulum.now()), "parse_data__metadata__rasa_x_id": str(Wei.from_int256(2*256-1, 18))},
+    ]
+    file_name = ParsedLoadJobFileName(user_table_name, uniq_id(), 0, "jsonl").job_id()
+    file_storage.save(file_name, b"\n".join(json.dumpb(row) for row in rows))
+    job = client.start_file_load(client.get_load_table(user_table_name), file_storage.make_full_path(file_name), uniq_id())
+    assert isinstance(job, PostgresCopyJob)
+    assert job.state() == "completed"
+    with client.sql_client.execute_query(f"SELECT sender_id, parse_data__metadata__rasa_x_id FROM {user_table_name} ORDER BY sender_id") as cur:
+        db_rows = cur.fetchall()
+    # empty string is not converted to NULL and missing values are NULL
+    assert [r[0] for r in db_rows] == ["", 'quoted "sender", with comma']
+    assert db_rows[1][1] is None
+
+
+def test_copy_csv_encoder_binary() -> None:
+    encode = _csv_encoder("binary")
+    for value in [b"\xde\xad\xbe\xef\x01", HexBytes(b"\xde\xad\xbe\xef\x01"), b"", HexBytes(b""), b"0x" + b"a" * 7]:
+        # values are encoded like in jsonl files written by the normalizer
+        encoded = json.loads(json.dumps({"v": value}))["v"]
+        assert encode(encoded) == "\\x" + bytes(value).hex()
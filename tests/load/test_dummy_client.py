@@ -1,8 +1,8 @@
 import shutil
 import os
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, wait
 from time import sleep
-from typing import List, Sequence, Tuple
+from typing import Any, List, Sequence, Tuple
 import pytest
 from unittest.mock import patch
 
@@ -220,12 +220,13 @@ def test_spool_job_retry_spool_new() -> None:
         load.load_storage,
         NORMALIZED_FILES
     )
-    # call higher level function that returns jobs and counts
+    # call higher level function that submits jobs to the pool
     with ThreadPoolExecutor() as pool:
         load.pool = pool
-        jobs_count, jobs = load.spool_new_jobs(load_id, schema)
-        assert jobs_count == 2
-        assert len(jobs) == 2
+        started_jobs = load.start_new_jobs(load_id, schema, load.config.workers, set())
+        assert len(started_jobs) == 2
+        for future in started_jobs:
+            assert future.result().state() == "retry"
 
 
 def test_spool_job_retry_started() -> None:
@@ -287,8 +288,9 @@ def test_try_retrieve_job() -> None:
         NORMALIZED_FILES
     )
     load.pool = ThreadPoolExecutor()
-    jobs_count, jobs = load.spool_new_jobs(load_id, schema)
-    assert jobs_count == 2
+    started_jobs = load.start_new_jobs(load_id, schema, load.config.workers, set())
+    assert len(started_jobs) == 2
+    wait(started_jobs)
     # now jobs are known
     with load.destination.client(schema, load.initial_client_config) as c:
         job_count, jobs = load.retrieve_jobs(c, load_id)
@@ -370,6 +372,92 @@ def test_retry_exceptions() -> None:
         assert py_ex.value.max_retry_count * 2 == py_ex.value.retry_count == 10
 
 
+def test_sliding_window_spools_all_jobs() -> None:
+    os.environ["LOAD__WORKERS"] = "2"
+    load = setup_loader(client_config=DummyClientConfiguration(completed_prob=1.0))
+    load_id, _ = prepare_load_package(
+        load.load_storage,
+        NORMALIZED_FILES
+    )
+    # add more jobs than workers
+    new_jobs_path = load.load_storage.storage.make_full_path(os.path.join(load.load_storage.get_package_path(load_id), LoadStorage.NEW_JOBS_FOLDER))
+    for idx in range(4):
+        file_id = uniq_id()
+        shutil.copy(os.path.join(new_jobs_path, NORMALIZED_FILES[idx % 2]), os.path.join(new_jobs_path, NORMALIZED_FILES[idx % 2].replace("839c6e6b514e427687586ccc65bf133f", file_id)))
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        # all jobs are processed in a single run while at most 2 jobs are in flight
+        with patch.object(load, "start_new_jobs", wraps=load.start_new_jobs) as start_new_jobs:
+            load.run(pool)
+        assert all(call.args[2] <= 2 for call in start_new_jobs.call_args_list)
+        package_info = load.load_storage.get_load_package_info(load_id)
+        assert len(package_info.jobs["new_jobs"]) == 0
+        assert len(package_info.jobs["started_jobs"]) == 0
+        assert len(package_info.jobs["completed_jobs"]) == 6
+        # package is completed in the next run
+        load.run(pool)
+        assert not load.load_storage.storage.has_folder(load.load_storage.get_package_path(load_id))
+
+
+def test_pooled_clients_reused() -> None:
+    os.environ["LOAD__WORKERS"] = "1"
+    load = setup_loader(client_config=DummyClientConfiguration(completed_prob=1.0))
+    load_id, schema = prepare_load_package(
+        load.load_storage,
+        NORMALIZED_FILES
+    )
+    with patch.object(dummy_impl.DummyClient, "__exit__") as client_exit:
+        # jobs are started on the same client
+        jobs = [Load.w_spool_job(load, f, load_id, schema) for f in load.load_storage.list_new_jobs(load_id)]
+        assert len(jobs) == 2
+        assert len(load._pooled_clients) == 1
+        client = load.get_pooled_client(schema)
+        assert client is next(iter(load._pooled_clients.values()))
+        client_exit.assert_not_called()
+        # different schema gets new client
+        assert load.get_pooled_client(schema.clone()) is not client
+        client_exit.assert_called_once()
+        load.close_pooled_clients()
+        assert len(load._pooled_clients) == 0
+        assert client_exit.call_count == 2
+        # client that is not open anymore is replaced
+        client = load.get_pooled_client(schema)
+        with patch.object(dummy_impl.DummyClient, "is_open", return_value=False):
+            assert load.get_pooled_client(schema) is not client
+        assert client_exit.call_count == 3
+
+
+def test_pooled_clients_closed_after_starting_jobs() -> None:
+    os.environ["LOAD__WORKERS"] = "2"
+    load = setup_loader(client_config=DummyClientConfiguration(completed_prob=1.0))
+    load_id, _ = prepare_load_package(
+        load.load_storage,
+        NORMALIZED_FILES
+    )
+    events: List[str] = []
+    start_file_load = dummy_impl.DummyClient.start_file_load
+
+    def _slow_start_file_load(self: dummy_impl.DummyClient, *args: Any) -> LoadJob:
+        sleep(0.5)
+        events.append("started")
+        return start_file_load(self, *args)
+
+    close_pooled_clients = load.close_pooled_clients
+
+    def _close_pooled_clients() -> None:
+        events.append("closed")
+        close_pooled_clients()
+
+    with patch.object(dummy_impl.DummyClient, "start_file_load", _slow_start_file_load), \
+            patch.object(load, "close_pooled_clients", _close_pooled_clients), \
+            patch("dlt.load.load.signals.raise_if_signalled", side_effect=KeyboardInterrupt()):
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            # signal is received while jobs are being started
+            with pytest.raises(KeyboardInterrupt):
+                load.run(pool)
+    # clients are closed only when jobs were started
+    assert events == ["started", "started", "closed"]
+
+
 def test_load_single_thread() -> None:
     os.environ["LOAD__WORKERS"] = "1"
     load = setup_loader(client_config=DummyClientConfiguration(completed_prob=1.0))
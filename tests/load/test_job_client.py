@@ -300,6 +300,25 @@ def test_drop_tables(client: SqlJobClientBase) -> None:
     assert len(rows) == 2
 
 
+@pytest.mark.parametrize("client", destinations_configs(default_sql_configs=True), indirect=True, ids=lambda x: x.name)
+def test_get_storage_tables(client: SqlJobClientBase) -> None:
+    client.update_stored_schema()
+    table_names = [LOADS_TABLE_NAME, "not_exists_" + uniq_id(), VERSION_TABLE_NAME]
+    storage_tables = list(client.get_storage_tables(table_names))
+    # tables are returned in requested order
+    assert [table_name for table_name, _ in storage_tables] == table_names
+    assert len(storage_tables[1][1]) == 0
+    # columns match those retrieved for a single table
+    for table_name, storage_table in storage_tables:
+        exists, single_storage_table = client.get_storage_table(table_name)
+        assert exists is (len(storage_table) > 0)
+        assert single_storage_table == storage_table
+    assert list(storage_tables[2][1].keys()) == list(client.schema.get_table_columns(VERSION_TABLE_NAME).keys())
+    # table names are passed in chunks to stay within query parameter limits
+    client.STORAGE_TABLES_QUERY_CHUNK = 2
+    assert list(client.get_storage_tables(table_names)) == storage_tables
+
+
 @pytest.mark.parametrize("client", destinations_configs(default_sql_configs=True), indirect=True, ids=lambda x: x.name)
 def test_get_storage_table_with_all_types(client: SqlJobClientBase) -> None:
     schema = client.schema
@@ -1,12 +1,17 @@
+import os
+import time
 import pytest
 from fnmatch import fnmatch
-from typing import Dict, Iterator, List, Sequence, Tuple
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+from unittest.mock import patch
 # from multiprocessing import get_start_method, Pool
 # from multiprocessing.dummy import Pool as ThreadPool
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
-from dlt.common import json
+from dlt.common import json, pendulum
+from dlt.common.arithmetics import Decimal
 from dlt.common.schema.schema import Schema
+from dlt.common.schema.utils import new_table
 from dlt.common.utils import uniq_id
 from dlt.common.typing import StrAny
 from dlt.common.data_types import TDataType
@@ -302,6 +307,120 @@ def test_schema_changes(caps: DestinationCapabilitiesContext, raw_normalize: Nor
     assert {"_dlt_id", "_dlt_list_idx", "_dlt_parent_id", "str", "int", "bool", "int__v_text"} == set(doc__comp_table["columns"].keys())
 
 
+@pytest.mark.parametrize("caps", JSONL_CAPS, indirect=True)
+def test_parallel_schema_conflict_as_single_worker(caps: DestinationCapabilitiesContext) -> None:
+    # two files normalized in parallel infer different data types for the same column
+
+    def _normalize(parallel: bool) -> Tuple[Schema, List[StrAny]]:
+        global _DELAYED_FILE
+
+        normalize = next(init_normalize())
+        extract_items(normalize.normalize_storage, [{"id": 1, "value": 1}], "conflict", "doc")
+        int_file = normalize.normalize_storage.list_files_to_normalize_sorted()[0]
+        extract_items(normalize.normalize_storage, [{"id": 2, "value": "text"}, {"id": 3, "value": "3"}], "conflict", "doc")
+        text_file = next(f for f in normalize.normalize_storage.list_files_to_normalize_sorted() if f != int_file)
+        # let the file with the text value finish last
+        _DELAYED_FILE = text_file
+
+        if parallel:
+            # use process pool so workers do not share the schema
+            with patch.object(Normalize, "w_normalize_files", staticmethod(_w_normalize_files_delayed)):
+                with ProcessPoolExecutor(max_workers=2) as pool:
+                    normalize.run(pool)
+            load_id = normalize.load_storage.list_packages()[0]
+        else:
+            load_id = uniq_id()
+            normalize.load_storage.create_temp_load_package(load_id)
+            normalize.spool_files("conflict", load_id, normalize.map_single, [int_file, text_file])
+        schema = normalize.load_storage.load_package_schema(load_id)
+        _, table_files = expect_load_package(normalize.load_storage, load_id, ["doc"])
+        rows: List[StrAny] = []
+        for file in table_files["doc"]:
+            with normalize.load_storage.storage.open_file(file) as f:
+                for line in f:
+                    row = json.loads(line)
+                    del row["_dlt_id"]
+                    del row["_dlt_load_id"]
+                    rows.append(row)
+        return schema, sorted(rows, key=lambda r: r["id"])
+
+    schema, rows = _normalize(True)
+    single_schema, single_rows = _normalize(False)
+    assert schema.get_table_columns("doc") == single_schema.get_table_columns("doc")
+    assert schema.get_table_columns("doc")["value"]["data_type"] == "bigint"
+    assert schema.get_table_columns("doc")["value__v_text"]["variant"] is True
+    # values that can be coerced are not moved to variant column
+    assert rows == single_rows == [{"id": 1, "value": 1}, {"id": 2, "value__v_text": "text"}, {"id": 3, "value": 3}]
+
+
+def test_find_conflicting_root_tables() -> None:
+    schema = Schema("conflict")
+    schema.update_table(new_table("doc", columns=[{"name": "value", "data_type": "bigint", "nullable": True}]))
+    schema.update_table(new_table("doc__items", parent_table_name="doc", columns=[{"name": "value", "data_type": "bigint", "nullable": True}]))
+    update = {"doc": [{"name": "doc", "columns": {"other": {"name": "other", "data_type": "text", "nullable": True}}}]}
+    assert Normalize.find_conflicting_root_tables(schema, [update]) == set()
+    # conflict in child table is reported for root table
+    update["doc__items"] = [{"name": "doc__items", "columns": {"value": {"name": "value", "data_type": "text", "nullable": True}}}]
+    assert Normalize.find_conflicting_root_tables(schema, [update]) == {"doc"}
+    # new child table of new table
+    update = {"doc__items__sub": [{"name": "doc__items__sub", "parent": "doc__items", "columns": {}}]}
+    assert Normalize._root_table_names(schema, [update])["doc__items__sub"] == "doc"
+
+
+def test_normalize_json_columnar() -> None:
+    pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    now = pendulum.now()
+    chunks = [
+        # flat chunk written column by column
+        [{"id": 1, "name": "a", "value": 1.5, "is_ok": True, "ts": now, "amount": Decimal("1.23")}, {"id": 2, "name": None, "value": 2.0}],
+        # value must be coerced into variant column
+        [{"id": 3, "value": "text"}],
+        # nested chunk creates child table
+        [{"id": 4, "items": [{"x": 1}]}],
+        # new column added to table
+        [{"id": 5, "extra": "e"}],
+        # column with mixed types in a flat chunk goes to a variant column
+        [{"id": 6, "mixed": 1}, {"id": 7, "mixed": "a"}],
+    ]
+
+    def _normalize(columnar: bool) -> Tuple[Schema, Dict[str, List[StrAny]]]:
+        os.environ["NORMALIZE__JSON_NORMALIZER__COLUMNAR"] = str(columnar)
+        with Container().injectable_context(DestinationCapabilitiesContext.generic_capabilities("parquet")):
+            clean_test_storage()
+            normalize = Normalize()
+            # each chunk is a separate line in a single extracted file
+            file_name = NormalizeStorage.build_extracted_file_stem("columnar", "doc", uniq_id()) + ".jsonl"
+            with normalize.normalize_storage.storage.open_file(os.path.join(NormalizeStorage.EXTRACTED_FOLDER, file_name), "wb") as f:
+                for chunk in chunks:
+                    f.write(json.typed_dumpb(chunk) + b"\n")
+            load_id = normalize_pending(normalize, "columnar")
+            schema = normalize.load_storage.load_package_schema(load_id)
+            tables: Dict[str, List[StrAny]] = {}
+            for file in normalize.load_storage.list_new_jobs(load_id):
+                table_name = normalize.load_storage.parse_job_file_name(file).table_name
+                rows = pq.read_table(normalize.load_storage.storage.make_full_path(file)).to_pylist()
+                for row in rows:
+                    # ids are random and load ids differ
+                    del row["_dlt_id"]
+                    row.pop("_dlt_parent_id", None)
+                    row.pop("_dlt_load_id", None)
+                tables.setdefault(table_name, []).extend(rows)
+            return schema, tables
+
+    schema, tables = _normalize(False)
+    c_schema, c_tables = _normalize(True)
+    assert c_schema.get_table_columns("doc") == schema.get_table_columns("doc")
+    assert "value__v_text" in c_schema.get_table_columns("doc")
+    assert c_schema.get_table_columns("doc__items") == schema.get_table_columns("doc__items")
+    for table_name, rows in tables.items():
+        assert sorted(c_tables[table_name], key=lambda r: r["id"] if "id" in r else 0) == \
+            sorted(rows, key=lambda r: r["id"] if "id" in r else 0)
+    assert "mixed__v_text" in c_schema.get_table_columns("doc")
+    assert len(c_tables["doc"]) == 7
+
+
 @pytest.mark.parametrize("caps", ALL_CAPABILITIES, indirect=True)
 def test_normalize_twice_with_flatten(caps: DestinationCapabilitiesContext, raw_normalize: Normalize) -> None:
     load_id = extract_and_normalize_cases(raw_normalize, ["github.issues.load_page_5_duck"])
@@ -350,6 +469,19 @@ def test_group_worker_files() -> None:
     assert Normalize.group_worker_files(files, 3) == [["chd.3"], ["chd.4", "tab1.2"], ["tab1.1", "tab1.3"]]
 
 
+def test_group_worker_files_by_size() -> None:
+    assert Normalize.group_worker_files_by_size([], 4, 100) == []
+    assert Normalize.group_worker_files_by_size([("f001", 10)], 4, 100) == [["f001"]]
+    # at least no_groups groups if sizes allow
+    files = [("f%03d" % idx, 10) for idx in range(0, 8)]
+    assert Normalize.group_worker_files_by_size(files, 4, 100) == [["f000", "f001"], ["f002", "f003"], ["f004", "f005"], ["f006", "f007"]]
+    # max group size limits the group
+    assert len(Normalize.group_worker_files_by_size(files, 1, 30)) == 3
+    # oversized file goes to its own group and is scheduled first
+    files = [("tab1.1", 10), ("chd.3", 1000), ("tab1.2", 10), ("chd.4", 10), ("tab1.3", 10)]
+    assert Normalize.group_worker_files_by_size(files, 2, 100) == [["chd.3"], ["chd.4", "tab1.1", "tab1.2", "tab1.3"]]
+
+
 EXPECTED_ETH_TABLES = ["blocks", "blocks__transactions", "blocks__transactions__logs", "blocks__transactions__logs__topics",
                        "blocks__uncles", "blocks__transactions__access_list", "blocks__transactions__access_list__storage_keys"]
 
@@ -361,6 +493,16 @@ EXPECTED_USER_TABLES = ["event", "event__parse_data__intent_ranking", "event__pa
          "event__parse_data__response_selector__default__response__responses"]
 
 
+_DELAYED_FILE: str = None
+_w_normalize_files = Normalize.w_normalize_files
+
+
+def _w_normalize_files_delayed(*args: Any) -> Any:
+    if _DELAYED_FILE in args[-1]:
+        time.sleep(0.5)
+    return _w_normalize_files(*args)
+
+
 def extract_items(normalize_storage: NormalizeStorage, items: Sequence[StrAny], schema_name: str, table_name: str) -> None:
     extractor = ExtractorStorage(normalize_storage.config)
     extract_id = extractor.create_extract_id()
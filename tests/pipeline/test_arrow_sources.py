@@ -241,3 +241,32 @@ def test_normalize_with_dlt_columns(item_type: TArrowFormat):
     schema = pipeline.default_schema
     assert schema.tables['some_data']['columns']['_dlt_id']['data_type'] == 'text'
     assert schema.tables['some_data']['columns']['_dlt_load_id']['data_type'] == 'text'
+
+
+@pytest.mark.parametrize("item_type", ["table", "pandas", "record_batch"])
+def test_load_id_added_by_destination(item_type: TArrowFormat) -> None:
+    item, records = arrow_table_all_data_types(item_type, num_rows=100, include_json=False)
+    os.environ['NORMALIZE__PARQUET_NORMALIZER__ADD_DLT_LOAD_ID'] = "True"
+
+    @dlt.resource
+    def some_data():
+        yield item
+
+    pipeline = dlt.pipeline("arrow_" + uniq_id(), destination="duckdb")
+    pipeline.extract(some_data())
+    pipeline.normalize()
+
+    # file is linked without rewriting, duckdb fills the load id
+    load_id = pipeline.list_normalized_load_packages()[0]
+    storage = pipeline._get_load_storage()
+    job = [j for j in storage.list_new_jobs(load_id) if "some_data" in j][0]
+    with storage.storage.open_file(job, 'rb') as f:
+        assert "_dlt_load_id" not in pa.parquet.read_schema(f).names
+    assert pipeline.default_schema.tables['some_data']['columns']['_dlt_load_id']['data_type'] == 'text'
+
+    pipeline.load()
+    with pipeline.sql_client() as client:
+        rows = client.execute_sql("SELECT string, _dlt_load_id FROM some_data")
+    assert len(rows) == 100
+    assert sorted(row[0] for row in rows) == sorted(r["string"] for r in records)
+    assert {row[1] for row in rows} == {load_id}
@@ -4,6 +4,8 @@ import pytest
 
 import dlt
 
+from dlt.common import pendulum
+from dlt.common.destination.reference import StateInfo
 from dlt.common.exceptions import PipelineStateNotAvailable, ResourceNameNotAvailable
 from dlt.common.schema import Schema
 from dlt.common.source import get_current_pipe_name
@@ -12,9 +14,9 @@ from dlt.common import pipeline as state_module
 from dlt.common.utils import uniq_id
 from dlt.destinations.job_client_impl import SqlJobClientBase
 
-from dlt.pipeline.exceptions import PipelineStateEngineNoUpgradePathException, PipelineStepFailed
+from dlt.pipeline.exceptions import PipelineStateEngineNoUpgradePathException, PipelineStateShardNotFound, PipelineStepFailed
 from dlt.pipeline.pipeline import Pipeline
-from dlt.pipeline.state_sync import migrate_state, STATE_ENGINE_VERSION
+from dlt.pipeline.state_sync import migrate_state, STATE_ENGINE_VERSION, STATE_SHARDS_COMPACTION_INTERVAL, compress_state, load_state_from_destination_with_shards, state_doc
 
 from tests.utils import test_storage
 from tests.pipeline.utils import json_case_path, load_json_case, airtable_emojis
@@ -444,3 +446,121 @@ def test_resource_state_name_not_normalized() -> None:
         state = load_state_from_destination(pipeline.pipeline_name, client)
         assert "airtable_emojis" in state["sources"]
         assert state["sources"]["airtable_emojis"]["resources"] == {"🦚Peacock": {"🦚🦚🦚": "🦚"}}
+
+
+class _StoredStates:
+    """Keeps state rows like destination state table, newest first"""
+    def __init__(self) -> None:
+        self.rows: list = []
+        self.read_versions: list = []
+        self.closed = False
+
+    def store(self, state, synced_shards=None):
+        doc = state_doc(state, synced_shards)
+        self.rows.insert(0, StateInfo(state["_state_version"], STATE_ENGINE_VERSION, state["pipeline_name"], compress_state(doc), pendulum.now()))
+        return doc
+
+    def get_stored_states(self, pipeline_name: str):
+        self.closed = False
+        try:
+            for row in self.rows:
+                self.read_versions.append(row.version)
+                yield row
+        finally:
+            # like the cursor of the sql client
+            self.closed = True
+
+
+def _sharded_state(version: int, sources) -> dict:
+    return {"_state_version": version, "_state_engine_version": STATE_ENGINE_VERSION, "pipeline_name": "shards", "sources": sources}
+
+
+def test_state_shards_write_changed() -> None:
+    storage = _StoredStates()
+    sources = {
+        "chess": {"archives": [1, 2], "resources": {"players": {"last": 1}, "games": {"last": 10}}},
+        "plain": "value"
+    }
+    doc = storage.store(_sharded_state(1, sources))
+    # first state holds all shards
+    assert doc["sources"] == sources
+    restored, shards = load_state_from_destination_with_shards("shards", storage)
+    assert restored["sources"] == sources
+    assert shards["chess"]["resources"]["games"]["version"] == 1
+
+    # change only one resource
+    sources["chess"]["resources"]["games"]["last"] = 11
+    doc = storage.store(_sharded_state(2, sources), shards)
+    assert doc["sources"] == {"chess": {"resources": {"games": {"last": 11}}}}
+    assert doc["_state_shards"]["chess"]["version"] == 1
+    assert doc["_state_shards"]["chess"]["resources"]["players"]["version"] == 1
+    assert doc["_state_shards"]["chess"]["resources"]["games"]["version"] == 2
+    restored, shards = load_state_from_destination_with_shards("shards", storage)
+    assert restored["sources"] == sources
+    assert restored["_state_version"] == 2
+    assert "_state_shards" not in restored
+
+    # change source level state and drop a resource
+    sources["chess"]["archives"] = [3]
+    sources["chess"]["resources"].pop("players")
+    doc = storage.store(_sharded_state(3, sources), shards)
+    assert doc["sources"] == {"chess": {"archives": [3], "resources": {}}}
+    restored, shards = load_state_from_destination_with_shards("shards", storage)
+    assert restored["sources"] == sources
+
+    # nothing changed: only manifest is written
+    doc = storage.store(_sharded_state(3, sources), shards)
+    assert doc["sources"] == {}
+    restored, _ = load_state_from_destination_with_shards("shards", storage)
+    assert restored["sources"] == sources
+
+
+def test_state_shards_compaction() -> None:
+    storage = _StoredStates()
+    sources = {"chess": {"resources": {"players": {"last": 1}, "games": {"last": 0}}}}
+    storage.store(_sharded_state(1, sources))
+    _, shards = load_state_from_destination_with_shards("shards", storage)
+    # unchanged shards are referenced until they get too old
+    doc = storage.store(_sharded_state(1 + STATE_SHARDS_COMPACTION_INTERVAL, sources), shards)
+    assert doc["sources"] == {}
+    doc = storage.store(_sharded_state(2 + STATE_SHARDS_COMPACTION_INTERVAL, sources), shards)
+    assert doc["sources"] == sources
+    # only the head row is read
+    storage.read_versions.clear()
+    restored, shards = load_state_from_destination_with_shards("shards", storage)
+    assert restored["sources"] == sources
+    assert storage.read_versions == [2 + STATE_SHARDS_COMPACTION_INTERVAL]
+    # iterator is closed even if not all rows were read
+    assert storage.closed is True
+    assert shards["chess"]["resources"]["players"]["version"] == 2 + STATE_SHARDS_COMPACTION_INTERVAL
+
+
+def test_state_shards_missing() -> None:
+    storage = _StoredStates()
+    sources = {"chess": {"resources": {"players": {"last": 1}, "games": {"last": 0}}}}
+    storage.store(_sharded_state(1, sources))
+    _, shards = load_state_from_destination_with_shards("shards", storage)
+    sources["chess"]["resources"]["games"]["last"] = 1
+    storage.store(_sharded_state(2, sources), shards)
+    # lose the first row ie. it was deleted
+    storage.rows.pop()
+    # state is not restored without the shards that hold ie. incremental state
+    with pytest.raises(PipelineStateShardNotFound) as py_ex:
+        load_state_from_destination_with_shards("shards", storage)
+    assert py_ex.value.version == 1
+    assert py_ex.value.source_name == "chess"
+    assert storage.closed is True
+
+
+def test_state_shards_from_full_state() -> None:
+    # state written by engine 2 holds all the shards in a single row
+    storage = _StoredStates()
+    state = _sharded_state(4, {"chess": {"resources": {"players": {"last": 1}}}})
+    state["_state_engine_version"] = 2
+    storage.rows.insert(0, StateInfo(4, 2, "shards", compress_state(state), pendulum.now()))
+    restored, shards = load_state_from_destination_with_shards("shards", storage)
+    assert restored["sources"] == state["sources"]
+    assert restored["_state_engine_version"] == STATE_ENGINE_VERSION
+    assert shards["chess"]["resources"]["players"]["version"] == 4
+    doc = storage.store(_sharded_state(5, restored["sources"]), shards)
+    assert doc["sources"] == {}